@@ -2,21 +2,35 @@ import traceback
 
 import logfire
 from fastapi import FastAPI, Request
-from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
-from fastapi.staticfiles import StaticFiles
 
+from app.config.server_timing import ServerTimingMiddleware
 from app.config.settings import settings
-from app.v1.controllers.middleware.bs4_middleware import BS4Middleware
+from app.v1.controllers.middleware.body_cache import BodyCache
+from app.v1.controllers.middleware.response_pipeline import ResponsePipelineMiddleware
+from app.v1.controllers.middleware.response_stages import GZipStage, HTMLStage
+from app.v1.controllers.static_assets import StaticAssets, get_asset_manifest
 from app.v1.controllers.v1_router import router as v1_router
 
+body_cache = (
+    BodyCache(max_entries=settings.body_cache_max_entries, max_bytes=settings.body_cache_max_bytes)
+    if settings.body_cache_max_entries > 0
+    else None
+)
+
 app = FastAPI(title=settings.app_name, debug=settings.debug)
-app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
-app.add_middleware(BS4Middleware)
+app.add_middleware(
+    ResponsePipelineMiddleware,
+    stages=[
+        HTMLStage(pretty=settings.html_pretty, cache=body_cache),
+        GZipStage(minimum_size=1000, compresslevel=5, cache=body_cache if settings.body_cache_gzip else None),
+    ],
+)
+# Outermost, so the breakdown covers the pipeline's stages.
+app.add_middleware(ServerTimingMiddleware, header=settings.server_timing_header)
 
 logfire.configure(environment=settings.logfire_environment, token=settings.logfire_token)
 logfire.instrument_fastapi(app, capture_headers=True)
-logfire.instrument_sqlite3()
 
 
 @app.exception_handler(Exception)
@@ -32,7 +46,7 @@ async def debug_exception_handler(_: Request, exc: Exception):
     )
 
 
-app.mount("/static", StaticFiles(directory="static"), name="static")
+app.mount("/static", StaticAssets(get_asset_manifest()), name="static")
 app.include_router(v1_router)
 
 
@@ -0,0 +1,258 @@
+import asyncio
+import contextvars
+import queue
+import sqlite3
+import threading
+from collections.abc import AsyncGenerator, Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any
+
+import logfire
+
+from app.config.database import ConnectionPool
+from app.config.settings import settings
+
+__all__ = [
+    "AsyncConnection",
+    "AsyncDatabase",
+    "close_async_database",
+    "get_async_database",
+    "get_async_db_connection",
+]
+
+_write_batch_size = logfire.metric_histogram("db_writer.batch_size", description="Writes committed per transaction")
+
+
+class _WriteJob:
+    def __init__(self, function: Callable[[sqlite3.Connection], Any]) -> None:
+        self.function = function
+        # Run in the submitter's context, so its per-request state (e.g. server timings) sees the write.
+        self.context = contextvars.copy_context()
+        self.future: Future[Any] = Future()
+
+
+class _Writer(threading.Thread):
+    """
+    The single thread allowed to write.
+
+    Queued jobs are drained in batches and run in one `BEGIN IMMEDIATE` transaction, each inside its own savepoint so
+    a failing job only rolls back its own changes. Results are delivered once the whole batch has committed.
+
+    If the thread itself fails (e.g. its connection can't be opened), every queued job fails with that error and later
+    submissions are refused, rather than waiting on a writer that will never run them.
+    """
+
+    def __init__(self, pool: ConnectionPool, max_batch_size: int) -> None:
+        super().__init__(name="sqlite-writer", daemon=True)
+        self.pool = pool
+        self.max_batch_size = max_batch_size
+        self.jobs: queue.SimpleQueue[_WriteJob | None] = queue.SimpleQueue()
+        self.submitted = 0
+        self.error: BaseException | None = None
+        # Held while submitting and while failing the queue, so no job is queued after the queue has been drained.
+        self._lock = threading.Lock()
+
+    def submit(self, function: Callable[[sqlite3.Connection], Any]) -> Future[Any]:
+        with self._lock:
+            if self.error is not None:
+                raise RuntimeError("SQLite writer has stopped") from self.error
+            self.submitted += 1
+            job = _WriteJob(function)
+            self.jobs.put(job)
+        return job.future
+
+    def stop(self) -> None:
+        self.jobs.put(None)
+        self.join()
+
+    def run(self) -> None:
+        batch: list[_WriteJob] = []
+        try:
+            self._run(batch)
+        except BaseException as e:
+            logfire.exception("SQLite writer failed")
+            with self._lock:
+                self.error = e
+                while True:
+                    try:
+                        job = self.jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is not None:
+                        batch.append(job)
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_exception(e)
+
+    def _run(self, batch: list[_WriteJob]) -> None:
+        """Run batches until stopped. `batch` holds the jobs in flight, so they can be failed if this raises."""
+        with self.pool.connection() as conn:
+            while True:
+                batch.clear()
+                job = self.jobs.get()
+                if job is None:
+                    return
+
+                batch.append(job)
+                stopping = False
+                while len(batch) < self.max_batch_size:
+                    try:
+                        job = self.jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is None:
+                        stopping = True
+                        break
+                    batch.append(job)
+
+                self._run_batch(conn, batch)
+                if stopping:
+                    return
+
+    def _run_batch(self, conn: sqlite3.Connection, batch: list[_WriteJob]) -> None:
+        results: list[tuple[_WriteJob, Any, BaseException | None]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job in batch:
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    result = job.context.run(job.function, conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO write_job")
+                    results.append((job, None, e))
+                else:
+                    results.append((job, result, None))
+                conn.execute("RELEASE write_job")
+            conn.commit()
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            for job in batch:
+                job.future.set_exception(e)
+            return
+
+        _write_batch_size.record(len(batch))
+        for job, result, exception in results:
+            if exception is None:
+                job.future.set_result(result)
+            else:
+                job.future.set_exception(exception)
+
+
+class AsyncDatabase:
+    """
+    Async facade over SQLite.
+
+    Reads run on a bounded thread pool of read-only connections. Writes are funneled through a single writer thread
+    that batches them into shared transactions, matching WAL's single-writer model.
+    """
+
+    def __init__(self, database: str, readers: int = 4, write_batch_size: int = 100) -> None:
+        self.readers = ConnectionPool(database, size=readers, read_only=True)
+        self._executor = ThreadPoolExecutor(max_workers=readers, thread_name_prefix="sqlite-reader")
+        self._writer = _Writer(ConnectionPool(database, size=1), write_batch_size)
+        self._writer.start()
+
+    async def run_in_reader[T](self, function: Callable[[], T]) -> T:
+        # `run_in_executor` doesn't carry context variables over to the thread, unlike `asyncio.to_thread`.
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(self._executor, context.run, function)
+
+    async def read[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        """Run `function` with a read-only connection on the reader pool."""
+
+        def run() -> T:
+            with self.readers.connection() as conn:
+                return function(conn)
+
+        return await self.run_in_reader(run)
+
+    async def write[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        """
+        Run `function` on the writer thread, returning once its transaction has committed.
+
+        `function` must not commit or roll back itself; it shares its transaction with other queued writes.
+        """
+        return await asyncio.wrap_future(self._writer.submit(function))
+
+    def activity(self) -> int:
+        """Reads and writes since startup. The difference between two calls shows how busy the database was."""
+        return self.readers.stats().checkouts + self._writer.submitted
+
+    def close(self) -> None:
+        self._writer.stop()
+        self._writer.pool.close()
+        self._executor.shutdown()
+        self.readers.close()
+
+
+class AsyncConnection:
+    """
+    Per-use handle on the async database.
+
+    Each read checks a reader connection out for just that read, like `AsyncDatabase.read`. Holding one across awaits
+    would let more open handles than readers tie up every reader thread waiting for a connection, leaving the
+    handles that hold one unable to run their next read or return it.
+    """
+
+    def __init__(self, database: AsyncDatabase) -> None:
+        self.database = database
+
+    async def read[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        return await self.database.read(function)
+
+    async def fetchall(self, sql: str, parameters: Sequence[Any] = ()) -> list[sqlite3.Row]:
+        return await self.read(lambda conn: conn.execute(sql, parameters).fetchall())
+
+    async def fetchone(self, sql: str, parameters: Sequence[Any] = ()) -> sqlite3.Row | None:
+        return await self.read(lambda conn: conn.execute(sql, parameters).fetchone())
+
+    async def write[T](self, function: Callable[[sqlite3.Connection], T]) -> T:
+        return await self.database.write(function)
+
+    async def execute(self, sql: str, parameters: Sequence[Any] = ()) -> int:
+        """Run a single write statement, returning the number of rows changed."""
+        return await self.write(lambda conn: conn.execute(sql, parameters).rowcount)
+
+    async def executemany(self, sql: str, parameters: Sequence[Sequence[Any]]) -> int:
+        return await self.write(lambda conn: conn.executemany(sql, parameters).rowcount)
+
+    async def close(self) -> None:
+        """Nothing is held between reads; kept so handles can be closed regardless."""
+
+
+_database: AsyncDatabase | None = None
+_database_lock = threading.Lock()
+
+
+def get_async_database() -> AsyncDatabase:
+    """Get the shared async database, creating it on first use"""
+    global _database
+    with _database_lock:
+        if _database is None:
+            _database = AsyncDatabase(
+                settings.sqlite_database,
+                readers=settings.sqlite_async_readers,
+                write_batch_size=settings.sqlite_write_batch_size,
+            )
+        return _database
+
+
+def close_async_database() -> None:
+    """Close the shared async database, if any"""
+    global _database
+    with _database_lock:
+        if _database is not None:
+            _database.close()
+            _database = None
+
+
+@asynccontextmanager
+async def get_async_db_connection() -> AsyncGenerator[AsyncConnection]:
+    """Async context manager for database connections"""
+    conn = AsyncConnection(get_async_database())
+    try:
+        yield conn
+    finally:
+        await conn.close()
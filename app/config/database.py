@@ -1,37 +1,274 @@
 import sqlite3
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 
 import logfire
 
+from app.config import server_timing
 from app.config.settings import settings
+from app.config.sql_profiler import ProfiledConnection
 
-__all__ = ["get_db_connection", "execute_sql_file"]
+__all__ = [
+    "ConnectionPool",
+    "PoolStats",
+    "close_pool",
+    "execute_sql_file",
+    "get_db_connection",
+    "get_pool",
+    "get_read_only_pool",
+]
 
+_checkouts = logfire.metric_counter("db_pool.checkouts", description="Connections checked out of the pool")
+_wait_time = logfire.metric_histogram("db_pool.wait_time", unit="s", description="Time spent waiting for a connection")
+_connection_age = logfire.metric_histogram(
+    "db_pool.connection_age", unit="s", description="Age of connections at checkout"
+)
 
-@contextmanager
-def get_db_connection() -> Generator[sqlite3.Connection]:
-    """Context manager for database connections"""
-    conn = sqlite3.connect(settings.sqlite_database)
-    conn.row_factory = sqlite3.Row
 
-    with logfire.span("PRAGMA settings"):
-        cursor = conn.cursor()
-        cursor.execute("PRAGMA synchronous = NORMAL")
-        cursor.execute("PRAGMA busy_timeout = 5000")
-        cursor.execute("PRAGMA cache_size = -20000")
-        cursor.execute("PRAGMA foreign_keys = ON")
-        cursor.execute("PRAGMA temp_store = MEMORY")
-        cursor.execute("PRAGMA mmap_size = 268435456")
-        cursor.close()
-
-    # Enable SQLite logging.
-    conn.set_trace_callback(lambda sql: logfire.info("SQL", args=[sql]))
-
-    try:
+@dataclass
+class PoolStats:
+    """Point-in-time pool metrics"""
+
+    size: int
+    open: int
+    idle: int
+    checkouts: int
+    wait_time: float
+    connections_opened: int
+    connections_closed: int
+
+
+@dataclass
+class _PooledConnection:
+    connection: sqlite3.Connection
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+class ConnectionPool:
+    """
+    Pool of reusable SQLite connections.
+
+    Connections are configured once when opened and handed out one checkout at a time, so the page cache and mmap
+    survive across requests. Idle connections are health-checked before reuse and recycled once older than `max_age`.
+    With `read_only`, connections are opened with `mode=ro` and `query_only` set, so they can't write or take the
+    write lock; under WAL they read in parallel with the writer.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        size: int = 5,
+        timeout: float = 30.0,
+        max_age: float = 3600.0,
+        health_check_after: float = 60.0,
+        read_only: bool = False,
+    ) -> None:
+        self.database = database
+        self.size = size
+        self.timeout = timeout
+        self.max_age = max_age
+        self.health_check_after = health_check_after
+        self.read_only = read_only
+
+        self._condition = threading.Condition()
+        self._idle: list[_PooledConnection] = []
+        self._open = 0
+        self._closed = False
+
+        self._checkouts = 0
+        self._wait_time = 0.0
+        self._connections_opened = 0
+        self._connections_closed = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.read_only:
+            uri = f"{Path(self.database).absolute().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=ProfiledConnection)
+        else:
+            conn = sqlite3.connect(self.database, check_same_thread=False, factory=ProfiledConnection)
+        conn.row_factory = sqlite3.Row
+
+        with logfire.span("PRAGMA settings"):
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA synchronous = NORMAL")
+            cursor.execute("PRAGMA busy_timeout = 5000")
+            cursor.execute("PRAGMA cache_size = -20000")
+            cursor.execute("PRAGMA foreign_keys = ON")
+            cursor.execute("PRAGMA temp_store = MEMORY")
+            cursor.execute("PRAGMA mmap_size = 268435456")
+            if self.read_only:
+                cursor.execute("PRAGMA query_only = ON")
+            cursor.close()
+
+        with self._condition:
+            self._connections_opened += 1
+        return conn
+
+    def _close(self, pooled: _PooledConnection) -> None:
+        pooled.connection.close()
+        with self._condition:
+            self._connections_closed += 1
+
+    def _is_healthy(self, pooled: _PooledConnection) -> bool:
+        if time.monotonic() - pooled.last_used_at < self.health_check_after:
+            return True
+        try:
+            pooled.connection.execute("SELECT 1").fetchone()
+        except sqlite3.Error:
+            return False
+        return True
+
+    def _checkout(self) -> _PooledConnection:
+        start = time.perf_counter()
+        deadline = time.monotonic() + self.timeout
+        pooled: _PooledConnection | None = None
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timed out after {self.timeout}s waiting for a database connection")
+                self._condition.wait(remaining)
+
+        try:
+            if pooled is not None and not self._is_healthy(pooled):
+                self._close(pooled)
+                pooled = None
+            if pooled is None:
+                pooled = _PooledConnection(self._connect())
+        except BaseException:
+            self._release_slot()
+            raise
+
+        wait_time = time.perf_counter() - start
+        with self._condition:
+            self._checkouts += 1
+            self._wait_time += wait_time
+        _checkouts.add(1)
+        _wait_time.record(wait_time)
+        server_timing.record("db-connection", wait_time)
+        _connection_age.record(time.monotonic() - pooled.created_at)
+
+        return pooled
+
+    def _checkin(self, pooled: _PooledConnection) -> None:
+        try:
+            # Never hand out a connection with someone else's uncommitted work.
+            if pooled.connection.in_transaction:
+                pooled.connection.rollback()
+        except sqlite3.Error:
+            self._close(pooled)
+            self._release_slot()
+            return
+
+        pooled.last_used_at = time.monotonic()
+        if self._closed or pooled.last_used_at - pooled.created_at > self.max_age:
+            self._close(pooled)
+            self._release_slot()
+            return
+
+        with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def _release_slot(self) -> None:
+        with self._condition:
+            self._open -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection]:
+        """Check out a connection, returning it to the pool afterwards."""
+        pooled = self._checkout()
+        try:
+            yield pooled.connection
+        finally:
+            self._checkin(pooled)
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                size=self.size,
+                open=self._open,
+                idle=len(self._idle),
+                checkouts=self._checkouts,
+                wait_time=self._wait_time,
+                connections_opened=self._connections_opened,
+                connections_closed=self._connections_closed,
+            )
+
+    def close(self) -> None:
+        """Close idle connections. Checked out connections are closed when returned."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            self._close(pooled)
+
+
+_pool: ConnectionPool | None = None
+_read_only_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool(read_only: bool) -> ConnectionPool:
+    return ConnectionPool(
+        settings.sqlite_database,
+        size=settings.sqlite_pool_size,
+        timeout=settings.sqlite_pool_timeout,
+        max_age=settings.sqlite_pool_max_age,
+        read_only=read_only,
+    )
+
+
+def get_pool() -> ConnectionPool:
+    """Get the shared connection pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _shared_pool(read_only=False)
+        return _pool
+
+
+def get_read_only_pool() -> ConnectionPool:
+    """Get the shared pool of read-only connections, creating it on first use"""
+    global _read_only_pool
+    with _pool_lock:
+        if _read_only_pool is None:
+            _read_only_pool = _shared_pool(read_only=True)
+        return _read_only_pool
+
+
+def close_pool() -> None:
+    """Close the shared connection pools, if any"""
+    global _pool, _read_only_pool
+    with _pool_lock:
+        for pool in (_pool, _read_only_pool):
+            if pool is not None:
+                pool.close()
+        _pool = _read_only_pool = None
+
+
+@contextmanager
+def get_db_connection(read_only: bool = False) -> Generator[sqlite3.Connection]:
+    """Context manager for database connections. Code that only reads should ask for `read_only` ones."""
+    with (get_read_only_pool() if read_only else get_pool()).connection() as conn:
         yield conn
-    finally:
-        conn.close()
 
 
 def execute_sql_file(file_path: str) -> None:
@@ -0,0 +1,172 @@
+import asyncio
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+import logfire
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.config.database import ConnectionPool, get_pool
+from app.config.settings import settings
+
+__all__ = ["CheckpointResult", "MaintenanceScheduler", "maintenance"]
+
+
+@dataclass
+class CheckpointResult:
+    """Outcome of a `wal_checkpoint`"""
+
+    mode: Literal["PASSIVE", "TRUNCATE"]
+    busy: bool
+    wal_frames: int
+    checkpointed_frames: int
+    wal_bytes_before: int
+    wal_bytes_after: int
+
+
+class MaintenanceScheduler:
+    """
+    Background SQLite housekeeping.
+
+    Every `interval` seconds the WAL is checkpointed: passively (never waiting on readers) while it's small, and with
+    `TRUNCATE` once it's grown past `wal_truncate_bytes`, so it's reset to empty. Every `vacuum_interval` seconds up
+    to `vacuum_pages` free pages are released to the file system with `incremental_vacuum`, through the writer so it
+    never contends with other writes. Every `optimize_interval` seconds `PRAGMA optimize` refreshes query planner
+    statistics, waiting for an interval with fewer than `quiet_operations` reads and writes. Each job is logged as a
+    span with its outcome.
+
+    Vacuuming needs incremental auto-vacuum, which `012.sql` turns on. Until it has run, vacuums are skipped and logged
+    rather than converting the database here, as that rewrites the whole file under the write lock.
+    """
+
+    def __init__(
+        self,
+        database: AsyncDatabase | None = None,
+        pool: ConnectionPool | None = None,
+        interval: float = 60.0,
+        wal_truncate_bytes: int = 64 * 1024 * 1024,
+        vacuum_interval: float = 600.0,
+        vacuum_pages: int = 1000,
+        optimize_interval: float = 6 * 60 * 60,
+        quiet_operations: int = 30,
+    ) -> None:
+        self._database = database
+        self._pool = pool
+        self.interval = interval
+        self.wal_truncate_bytes = wal_truncate_bytes
+        self.vacuum_interval = vacuum_interval
+        self.vacuum_pages = vacuum_pages
+        self.optimize_interval = optimize_interval
+        self.quiet_operations = quiet_operations
+
+    @property
+    def database(self) -> AsyncDatabase:
+        # Resolved on use, so the scheduler follows the shared database.
+        return self._database or get_async_database()
+
+    @property
+    def pool(self) -> ConnectionPool:
+        return self._pool or get_pool()
+
+    def _wal_bytes(self) -> int:
+        try:
+            return os.path.getsize(f"{self.pool.database}-wal")
+        except OSError:
+            return 0
+
+    async def checkpoint(self, mode: Literal["PASSIVE", "TRUNCATE"] | None = None) -> CheckpointResult:
+        """Checkpoint the WAL, truncating it if it's past `wal_truncate_bytes` (unless `mode` is given)."""
+        wal_bytes_before = self._wal_bytes()
+        mode = mode or ("TRUNCATE" if wal_bytes_before > self.wal_truncate_bytes else "PASSIVE")
+
+        def checkpoint() -> tuple[int, int, int]:
+            # On its own connection, as a checkpoint can't run inside the writer's transactions.
+            with self.pool.connection() as conn:
+                return tuple(conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone())
+
+        with logfire.span("SQLite maintenance: checkpoint", mode=mode) as span:
+            busy, wal_frames, checkpointed_frames = await asyncio.to_thread(checkpoint)
+            result = CheckpointResult(
+                mode=mode,
+                busy=bool(busy),
+                wal_frames=wal_frames,
+                checkpointed_frames=checkpointed_frames,
+                wal_bytes_before=wal_bytes_before,
+                wal_bytes_after=self._wal_bytes(),
+            )
+            span.set_attributes(
+                {
+                    "busy": result.busy,
+                    "wal_frames": wal_frames,
+                    "checkpointed_frames": checkpointed_frames,
+                    "wal_bytes_before": wal_bytes_before,
+                    "wal_bytes_after": result.wal_bytes_after,
+                }
+            )
+        return result
+
+    async def incremental(self) -> bool:
+        """Whether the database has incremental auto-vacuum enabled."""
+        # Asked in the writer's transaction: a connection that hasn't read since the change still reports the old mode.
+        return await self.database.write(lambda conn: conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2)
+
+    async def vacuum(self) -> int:
+        """Release up to `vacuum_pages` free pages. Returns how many were released."""
+
+        def vacuum(conn: sqlite3.Connection) -> int:
+            free_pages: int = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if free_pages:
+                conn.execute(f"PRAGMA incremental_vacuum({min(free_pages, self.vacuum_pages)})").fetchall()
+            return free_pages - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        with logfire.span("SQLite maintenance: incremental vacuum", max_pages=self.vacuum_pages) as span:
+            released = await self.database.write(vacuum)
+            span.set_attribute("released_pages", released)
+        return released
+
+    async def optimize(self) -> None:
+        """Let SQLite re-analyze tables whose statistics are out of date."""
+        with logfire.span("SQLite maintenance: optimize"):
+            await self.database.write(lambda conn: conn.execute("PRAGMA optimize").fetchall())
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Run each job as it comes due until `stop` is set. Failed jobs are logged and retried when next due."""
+        vacuumed_at = optimized_at = time.monotonic()
+        activity: int | None = None
+        while True:
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+                return
+            except TimeoutError:
+                pass
+
+            now = time.monotonic()
+            try:
+                previous, activity = activity, self.database.activity()
+                operations = activity - previous if previous is not None else 0
+                await self.checkpoint()
+                if now - vacuumed_at >= self.vacuum_interval:
+                    vacuumed_at = now
+                    if await self.incremental():
+                        await self.vacuum()
+                    else:
+                        logfire.warn("SQLite maintenance: vacuum skipped, incremental auto-vacuum is off")
+                if now - optimized_at >= self.optimize_interval:
+                    if operations < self.quiet_operations:
+                        optimized_at = now
+                        await self.optimize()
+                    else:
+                        logfire.debug("SQLite maintenance: optimize deferred until quiet", operations=operations)
+            except Exception:
+                logfire.exception("SQLite maintenance failed")
+
+
+maintenance = MaintenanceScheduler(
+    interval=settings.sqlite_maintenance_interval,
+    wal_truncate_bytes=settings.sqlite_wal_truncate_bytes,
+    vacuum_interval=settings.sqlite_vacuum_interval,
+    vacuum_pages=settings.sqlite_vacuum_pages,
+    optimize_interval=settings.sqlite_optimize_interval,
+)
@@ -0,0 +1,148 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any, cast
+
+import logfire
+from opentelemetry import trace
+from opentelemetry.metrics import Counter
+
+from app.config.settings import settings
+
+__all__ = ["ResponseCache", "response_cache"]
+
+_hits = logfire.metric_counter("response_cache.hits", description="Responses served fresh from the cache")
+_stale = logfire.metric_counter("response_cache.stale", description="Stale responses served while being refreshed")
+_misses = logfire.metric_counter("response_cache.misses", description="Responses computed because none was cached")
+_coalesced = logfire.metric_counter(
+    "response_cache.coalesced", description="Requests that waited on an identical request's computation"
+)
+_evictions = logfire.metric_counter("response_cache.evictions", description="Responses evicted from the cache")
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+    tags: frozenset[str]
+
+
+@dataclass
+class _Flight:
+    task: asyncio.Task[Any]
+    tags: frozenset[str]
+
+
+class ResponseCache:
+    """
+    In-process cache of computed responses, with single-flight computation and stale-while-revalidate.
+
+    Entries are fresh for `ttl` seconds, then served stale for up to `stale_ttl` more while one background task
+    recomputes them. Concurrent requests for a missing entry all await the same computation. Entries are tagged with
+    what they were computed from, so writers can `invalidate` them; a computation that was in flight when its tag was
+    invalidated isn't stored. At most `max_entries` are kept, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.hits = 0
+        self.stale = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get[T](self, key: Hashable, compute: Callable[[], Awaitable[T]], tags: Iterable[str] = ()) -> T:
+        """Get the value cached under `key`, computing it with `compute` if there isn't a usable one."""
+        entry = self._entries.get(key)
+        age = self.clock() - entry.stored_at if entry is not None else math.inf
+
+        if entry is not None and age < self.ttl:
+            self._entries.move_to_end(key)
+            self._record("hit", _hits)
+            self.hits += 1
+            return cast(T, entry.value)
+
+        if entry is not None and age < self.ttl + self.stale_ttl:
+            self._entries.move_to_end(key)
+            self._record("stale", _stale)
+            self.stale += 1
+            if key not in self._flights:
+                self._start(key, compute, frozenset(tags), background=True)
+            return cast(T, entry.value)
+
+        flight = self._flights.get(key)
+        if flight is not None:
+            self._record("coalesced", _coalesced)
+            self.coalesced += 1
+        else:
+            self._record("miss", _misses)
+            self.misses += 1
+            flight = self._start(key, compute, frozenset(tags), background=False)
+        # Shielded, so a cancelled request doesn't cancel the computation others are waiting on.
+        return cast(T, await asyncio.shield(flight.task))
+
+    def invalidate(self, tag: str | None = None) -> int:
+        """Drop the entries (and in-flight computations) tagged `tag`, or all of them. Returns how many entries."""
+        keys = [key for key, entry in self._entries.items() if tag is None or tag in entry.tags]
+        for key in keys:
+            del self._entries[key]
+        for key in [key for key, flight in self._flights.items() if tag is None or tag in flight.tags]:
+            del self._flights[key]
+        return len(keys)
+
+    def _record(self, status: str, counter: Counter) -> None:
+        counter.add(1)
+        trace.get_current_span().set_attribute("response_cache", status)
+
+    def _start(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]], tags: frozenset[str], background: bool
+    ) -> _Flight:
+        async def run() -> Any:
+            value = await compute()
+            # Only store the result if nothing invalidated it (or started a newer computation) meanwhile.
+            if self._flights.get(key) is flight:
+                self._store(key, value, tags)
+            return value
+
+        def done(task: asyncio.Task[Any]) -> None:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if not task.cancelled() and task.exception() is not None and background:
+                logfire.warn("Response cache refresh failed", key=repr(key), error=repr(task.exception()))
+
+        flight = _Flight(asyncio.ensure_future(run()), tags)
+        self._flights[key] = flight
+        flight.task.add_done_callback(done)
+        return flight
+
+    def _store(self, key: Hashable, value: Any, tags: frozenset[str]) -> None:
+        self._entries[key] = _Entry(value, self.clock(), tags)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            _evictions.add(1)
+
+
+response_cache = ResponseCache(
+    ttl=settings.response_cache_ttl,
+    stale_ttl=settings.response_cache_stale_ttl,
+    max_entries=settings.response_cache_max_entries,
+)
@@ -0,0 +1,110 @@
+import re
+import threading
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from opentelemetry import trace
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+__all__ = ["ServerTiming", "ServerTimingMiddleware", "current_timing", "measure", "record"]
+
+_TOKEN = re.compile(r"[^!#$%&'*+\-.^_`|~0-9A-Za-z]")
+
+
+class ServerTiming:
+    """
+    Time spent per part of handling one request (e.g. `sql`, `template`), with how many times each part ran.
+
+    Parts can be recorded from the reader and writer threads as well as the event loop, so updates are locked.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._durations: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+
+    def record(self, name: str, duration: float) -> None:
+        with self._lock:
+            self._durations[name] = self._durations.get(name, 0.0) + duration
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def durations(self) -> dict[str, tuple[float, int]]:
+        """Total seconds and count per part, in the order they were first recorded."""
+        with self._lock:
+            return {name: (duration, self._counts[name]) for name, duration in self._durations.items()}
+
+    def header(self) -> str:
+        """The parts recorded so far, plus the total elapsed, as a `Server-Timing` header value."""
+        metrics = [
+            f'{_TOKEN.sub("-", name)};dur={duration * 1000:.2f};desc="{count}x"'
+            for name, (duration, count) in self.durations().items()
+        ]
+        metrics.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ", ".join(metrics)
+
+
+_current: ContextVar[ServerTiming | None] = ContextVar("server_timing", default=None)
+
+
+def current_timing() -> ServerTiming | None:
+    """The timings of the request being handled, if any."""
+    return _current.get()
+
+
+def record(name: str, duration: float) -> None:
+    """Add `duration` seconds to part `name` of the current request. Does nothing outside a request."""
+    timing = _current.get()
+    if timing is not None:
+        timing.record(name, duration)
+
+
+@contextmanager
+def measure(name: str) -> Generator[None]:
+    """Time the block as part `name` of the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - started)
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware collecting a `ServerTiming` per request.
+
+    The breakdown is sent as a `Server-Timing` header (with `header`), so it shows up in the browser's devtools, and
+    set as `server_timing.*` attributes on the request's span once the response is complete. Parts that run after
+    the headers are sent (compressing later chunks of a streamed body) only make it into the attributes.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True) -> None:
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = ServerTiming()
+        token = _current.set(timing)
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.header:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", timing.header())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            span = trace.get_current_span()
+            for name, (duration, count) in timing.durations().items():
+                span.set_attribute(f"server_timing.{name}_ms", duration * 1000)
+                span.set_attribute(f"server_timing.{name}_count", count)
+            span.set_attribute("server_timing.total_ms", (time.perf_counter() - timing.started) * 1000)
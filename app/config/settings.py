@@ -10,14 +10,60 @@ class Settings(BaseSettings):
 
     debug: bool = True
     sqlite_database: str = ""
+    sqlite_pool_size: int = 5
+    sqlite_pool_timeout: float = 30.0
+    sqlite_pool_max_age: float = 3600.0
+    sqlite_async_readers: int = 4
+    sqlite_write_batch_size: int = 100
+
+    # Background maintenance: a WAL checkpoint every `interval` seconds (truncating once the WAL is past
+    # `wal_truncate_bytes`), an incremental vacuum every `vacuum_interval` and `PRAGMA optimize` every
+    # `optimize_interval`, when traffic is low
+    sqlite_maintenance_interval: float = 60.0
+    sqlite_wal_truncate_bytes: int = 64 * 1024 * 1024
+    sqlite_vacuum_interval: float = 600.0
+    sqlite_vacuum_pages: int = 1000
+    sqlite_optimize_interval: float = 6 * 60 * 60
+
+    # SQL profiling (aggregates are flushed to logfire; a fraction of raw statements can be sampled)
+    sql_profiler_flush_interval: float = 60.0
+    sql_profiler_sample_rate: float = 0.0
+
+    # Per-request `Server-Timing` header (the breakdown is always recorded on the request's span)
+    server_timing_header: bool = True
+
+    # HTML post-processing ("pretty" re-renders every page through BeautifulSoup)
+    html_pretty: bool = False
+
+    # Cache of post-processed (and optionally gzipped) HTML, keyed by a hash of the raw body
+    body_cache_max_entries: int = 256
+    body_cache_max_bytes: int = 32 * 1024 * 1024
+    body_cache_gzip: bool = True
+
+    # In-process cache of expensive responses (fresh for `ttl` seconds, then served stale while refreshed)
+    response_cache_ttl: float = 30.0
+    response_cache_stale_ttl: float = 300.0
+    response_cache_max_entries: int = 256
+
+    # Static files, fingerprinted and precompressed into the build directory at startup (or by `inv assets`)
+    static_dir: str = "static"
+    static_build_dir: str = "build/static"
+
+    # Compiled templates, kept across restarts (empty uses the system temp directory)
+    jinja_bytecode_cache_dir: str = ""
 
     # Monzo OAuth settings
+    monzo_api_url: str = "https://api.monzo.com"
     monzo_client_id: str = ""
     monzo_client_secret: str = ""
     monzo_redirect_uri: str = ""
+    monzo_webhook_secret: str = ""
 
-    # Resend (transactional emails)
+    # Resend (transactional emails, sent from an outbox every `email_poll_interval` seconds or when one is queued)
+    resend_api_url: str = "https://api.resend.com"
     resend_api_key: str = ""
+    email_poll_interval: float = 10.0
+    email_max_attempts: int = 8
 
     # Logfire
     logfire_environment: str = ""
@@ -25,6 +71,14 @@ class Settings(BaseSettings):
 
     # Authentication
     session_cookie_name: str = "turbofox.session_id"
+    # Sessions expire `session_ttl` seconds after they were last seen. They're cached in memory for
+    # `session_cache_ttl` seconds, last-seen times are written every `session_flush_interval` seconds and expired
+    # sessions are deleted every `session_sweep_interval` seconds.
+    session_ttl: float = 30 * 24 * 60 * 60
+    session_cache_ttl: float = 60.0
+    session_cache_max_entries: int = 10_000
+    session_flush_interval: float = 5.0
+    session_sweep_interval: float = 60 * 60
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,272 @@
+import random
+import re
+import sqlite3
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+import logfire
+
+from app.config import server_timing
+from app.config.settings import settings
+
+__all__ = ["ProfiledConnection", "SQLProfiler", "StatementSummary", "fingerprint", "profiler"]
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_BLOB_LITERAL = re.compile(r"\b[xX]\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_LIST = re.compile(r"\bVALUES\s*\(([^()]*)\)(?:\s*,\s*\(\1\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# Durations kept per fingerprint for percentile estimates.
+_SAMPLES = 1024
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """Normalize literals and whitespace out of a statement, so that queries differing only in values group together."""
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _BLOB_LITERAL.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip().rstrip(";").strip()
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    normalized = _VALUES_LIST.sub(r"VALUES (\1), ...", normalized)
+    return normalized
+
+
+@dataclass
+class _Stats:
+    count: int = 0
+    total: float = 0.0
+    rows: int = 0
+    durations: deque[float] = field(default_factory=lambda: deque(maxlen=_SAMPLES))
+
+    def add(self, duration: float, rows: int) -> None:
+        self.count += 1
+        self.total += duration
+        self.rows += rows
+        self.durations.append(duration)
+
+
+@dataclass
+class StatementSummary:
+    """Aggregated timings for one statement fingerprint"""
+
+    fingerprint: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    rows: int
+
+
+def _summarize(statement: str, stats: _Stats) -> StatementSummary:
+    durations = sorted(stats.durations)
+    if len(durations) > 1:
+        quantiles = statistics.quantiles(durations, n=100, method="inclusive")
+        p50, p95 = quantiles[49], quantiles[94]
+    else:
+        p50 = p95 = durations[0]
+    return StatementSummary(
+        fingerprint=statement,
+        count=stats.count,
+        total_ms=stats.total * 1000,
+        mean_ms=stats.total / stats.count * 1000,
+        p50_ms=p50 * 1000,
+        p95_ms=p95 * 1000,
+        rows=stats.rows,
+    )
+
+
+class SQLProfiler:
+    """
+    In-process, per-fingerprint statement statistics.
+
+    Replaces logging every statement: aggregates for the current window are flushed to logfire every
+    `flush_interval` seconds, and only a `sample_rate` fraction of raw statements is logged.
+    """
+
+    def __init__(self, flush_interval: float = 60.0, sample_rate: float = 0.0) -> None:
+        self.flush_interval = flush_interval
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+        self._totals: dict[str, _Stats] = {}
+        self._window: dict[str, _Stats] = {}
+        self._flushed_at = time.monotonic()
+
+    def record(self, sql: str, duration: float, rows: int) -> None:
+        statement = fingerprint(sql)
+        if self.sample_rate and random.random() < self.sample_rate:
+            logfire.info("SQL", args=[sql], duration_ms=duration * 1000, rows=rows)
+
+        with self._lock:
+            for stats in (self._totals, self._window):
+                entry = stats.get(statement)
+                if entry is None:
+                    entry = stats[statement] = _Stats()
+                entry.add(duration, rows)
+            flush = time.monotonic() - self._flushed_at >= self.flush_interval
+
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Log aggregates gathered since the last flush, and start a new window."""
+        with self._lock:
+            window, self._window = self._window, {}
+            self._flushed_at = time.monotonic()
+
+        for statement, stats in window.items():
+            summary = _summarize(statement, stats)
+            logfire.info(
+                "SQL statement stats",
+                fingerprint=summary.fingerprint,
+                count=summary.count,
+                total_ms=summary.total_ms,
+                p50_ms=summary.p50_ms,
+                p95_ms=summary.p95_ms,
+                rows=summary.rows,
+            )
+
+    def top(self, limit: int = 20, by: str = "total_ms") -> list[StatementSummary]:
+        """Get the `limit` slowest fingerprints since startup, ordered by a `StatementSummary` field."""
+        with self._lock:
+            summaries = [_summarize(statement, stats) for statement, stats in self._totals.items()]
+        return sorted(summaries, key=lambda summary: getattr(summary, by), reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+            self._window.clear()
+
+
+profiler = SQLProfiler(
+    flush_interval=settings.sql_profiler_flush_interval,
+    sample_rate=settings.sql_profiler_sample_rate,
+)
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """
+    Cursor that reports each statement to the profiler.
+
+    A statement's time covers `execute` plus fetching its rows; it is recorded once the result set is exhausted, the
+    cursor is reused or closed.
+    """
+
+    _sql: str | None = None
+    _elapsed = 0.0
+    _rows = 0
+
+    def _start(self, sql: str, started: float) -> None:
+        self._finish()
+        self._elapsed = time.perf_counter() - started
+        self._rows = 0
+        if self.description is None:
+            # Nothing to fetch.
+            self._report(sql, self._elapsed, self.rowcount if self.rowcount > 0 else 0)
+        else:
+            self._sql = sql
+
+    def _finish(self) -> None:
+        if self._sql is not None:
+            self._report(self._sql, self._elapsed, self._rows)
+            self._sql = None
+
+    def _report(self, sql: str, elapsed: float, rows: int) -> None:
+        profiler.record(sql, elapsed, rows)
+        server_timing.record("sql", elapsed)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> "ProfiledCursor":
+        started = time.perf_counter()
+        super().execute(sql, parameters)
+        self._start(sql, started)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any], /) -> "ProfiledCursor":
+        started = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._start(sql, started)
+        return self
+
+    def executescript(self, sql_script: str, /) -> "ProfiledCursor":
+        started = time.perf_counter()
+        super().executescript(sql_script)
+        self._start(sql_script, started)
+        return self
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._elapsed += time.perf_counter() - started
+        if row is None:
+            self._finish()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._elapsed += time.perf_counter() - started
+        self._rows += len(rows)
+        if len(rows) < (self.arraysize if size is None else size):
+            self._finish()
+        return rows
+
+    def fetchall(self) -> list[Any]:
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._elapsed += time.perf_counter() - started
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self) -> Any:
+        started = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            # Counted before finishing, so the fetch that found the end is included.
+            self._elapsed += time.perf_counter() - started
+            self._finish()
+            raise
+        except BaseException:
+            self._elapsed += time.perf_counter() - started
+            raise
+        self._elapsed += time.perf_counter() - started
+        self._rows += 1
+        return row
+
+    def close(self) -> None:
+        self._finish()
+        super().close()
+
+    def __del__(self) -> None:
+        try:
+            self._finish()
+        except Exception:
+            pass
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose cursors, including those behind the `execute` shortcuts, report to the profiler."""
+
+    def cursor(self, factory: Any = ProfiledCursor) -> Any:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> Any:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters: Iterable[Any], /) -> Any:
+        return self.cursor().executemany(sql, parameters)
+
+    def executescript(self, sql_script: str, /) -> Any:
+        return self.cursor().executescript(sql_script)
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+__all__ = ["ChartSeries"]
+
+
+class ChartSeries(BaseModel):
+    """A series as parallel arrays: bucket start times (Unix seconds) and amounts (minor units)"""
+
+    t: list[int]
+    v: list[int]
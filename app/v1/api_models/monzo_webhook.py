@@ -0,0 +1,12 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+__all__ = ["MonzoWebhookEvent"]
+
+
+class MonzoWebhookEvent(BaseModel):
+    """A webhook event pushed by Monzo, e.g. `transaction.created`"""
+
+    type: str
+    data: dict[str, Any]
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+__all__ = ["SQLStatementStats"]
+
+
+class SQLStatementStats(BaseModel):
+    """Aggregated timings for one normalized SQL statement"""
+
+    fingerprint: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    rows: int
@@ -0,0 +1,49 @@
+import functools
+from collections.abc import Awaitable, Callable
+from typing import cast
+
+from fastapi import Request, Response
+
+from app.config.response_cache import ResponseCache, response_cache
+from app.v1.controllers.conditional import request_variant
+from app.v1.repositories.change_counters import ChangeCounterRepository
+
+__all__ = ["cached_response"]
+
+
+def _argument_key(value: object) -> str:
+    if isinstance(value, Request):
+        return repr(request_variant(cast(Request, value)))
+    return repr(value)
+
+
+def cached_response[**P](
+    *counters: str, cache: ResponseCache = response_cache
+) -> Callable[[Callable[P, Awaitable[Response]]], Callable[P, Awaitable[Response]]]:
+    """
+    Serve a route's responses from `cache`, so identical requests share one computation.
+
+    Responses are keyed by the route's arguments (a `Request` argument by what the page can vary by) and the versions
+    of `counters`, so every worker sees new data as soon as it's written, and tagged with `counters` for
+    `ResponseCache.invalidate`. Only the body, status and headers are cached, not background tasks.
+    """
+
+    def decorator(endpoint: Callable[P, Awaitable[Response]]) -> Callable[P, Awaitable[Response]]:
+        @functools.wraps(endpoint)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> Response:
+            versions = await ChangeCounterRepository().versions(counters)
+            arguments = tuple(sorted((name, _argument_key(value)) for name, value in kwargs.items()))
+            key = (endpoint.__module__, endpoint.__qualname__, arguments, tuple(versions.items()))
+
+            async def compute() -> tuple[int, bytes, list[tuple[bytes, bytes]]]:
+                response = await endpoint(*args, **kwargs)
+                return response.status_code, bytes(response.body), response.raw_headers
+
+            status_code, body, headers = await cache.get(key, compute, tags=counters)
+            response = Response(body, status_code=status_code)
+            response.raw_headers = list(headers)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,78 @@
+import hashlib
+import json
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import cache
+from typing import Any
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+from app.config.settings import settings
+from app.v1.controllers.etags import etag_matches
+from app.v1.controllers.static_assets import TEMPLATES_DIR
+from app.v1.controllers.templates import FRAGMENT_HEADERS
+from app.v1.repositories.change_counters import ChangeCounterRepository
+
+__all__ = ["ConditionalRoute", "conditional", "request_variant"]
+
+
+@cache
+def _templates_digest() -> str:
+    # A deploy that changes the templates changes every page, even though the data hasn't.
+    digest = hashlib.blake2b(digest_size=8)
+    for path in sorted(TEMPLATES_DIR.rglob("*.html")):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def request_variant(request: Request) -> list[Any]:
+    """What a page's response can vary by, besides the data: the path and query, the htmx fragment and the user."""
+    return [
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        *(request.headers.get(header) for header in FRAGMENT_HEADERS),
+        request.cookies.get(settings.session_cookie_name),
+    ]
+
+
+def conditional(*counters: str) -> Callable[[Request], Awaitable[str]]:
+    """
+    Dependency answering conditional GETs from the version of the data, before the route does any work.
+
+    The ETag covers the versions of the `counters` read, the path and query, the htmx fragment asked for, the user
+    and the templates, so it changes whenever the response could. A matching `If-None-Match` gets a 304 without the
+    route running; otherwise `ConditionalRoute` adds the ETag to its response. It's weak, as the response pipeline
+    minifies and may gzip the body after it's made, so the same ETag is sent with different bytes.
+    """
+
+    async def dependency(request: Request) -> str:
+        versions = await ChangeCounterRepository().versions(counters)
+        key = [versions, *request_variant(request), _templates_digest()]
+        etag = f'W/"{hashlib.blake2b(json.dumps(key).encode(), digest_size=16).hexdigest()}"'
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        request.state.etag = etag
+        return etag
+
+    return dependency
+
+
+class ConditionalRoute(APIRoute):
+    """
+    Route adding the ETag from `conditional` to successful responses.
+
+    A dependency can't set headers on a response the route builds itself, such as a rendered template.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            response = await handler(request)
+            etag: Any = getattr(request.state, "etag", None)
+            if etag is not None and response.status_code == 200:
+                response.headers.setdefault("ETag", etag)
+                response.headers.setdefault("Cache-Control", "no-cache")
+            return response
+
+        return route_handler
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+import logfire
+
+__all__ = ["BodyCache"]
+
+_hits = logfire.metric_counter("body_cache.hits", description="Transformed bodies served from the cache")
+_misses = logfire.metric_counter("body_cache.misses", description="Transformed bodies not found in the cache")
+_evictions = logfire.metric_counter("body_cache.evictions", description="Transformed bodies evicted from the cache")
+
+
+class BodyCache:
+    """
+    Bounded LRU cache of transformed response bodies, keyed by a hash of the input body.
+
+    Entries are evicted least recently used first once either `max_entries` or `max_bytes` is exceeded. Values
+    larger than `max_bytes` on their own are never stored.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: bytes) -> bytes | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            _misses.add(1)
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        _hits.add(1)
+        return value
+
+    def put(self, key: bytes, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+
+        self._entries[key] = value
+        self.size += len(value)
+
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+            _evictions.add(1)
@@ -0,0 +1,166 @@
+import re
+
+from bs4 import BeautifulSoup, Comment
+
+__all__ = ["StreamingHTMLProcessor", "minify_html", "prettify_html"]
+
+# Elements whose contents must be passed through untouched.
+_RAW_TEXT_ELEMENTS = frozenset({b"pre", b"script", b"style", b"textarea"})
+
+# Comments, start/end tags (quoted attribute values may contain ">") and declarations. A comment only matches once
+# its "-->" has arrived, never as a declaration ending at a ">" inside it.
+_MARKUP = re.compile(
+    rb"""
+    <!--.*?-->
+    | <(/?)([a-zA-Z][a-zA-Z0-9:-]*)(?:[^>"']|"[^"]*"|'[^']*')*>
+    | <(?!!--)[!?][^>]*>
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# Anything that could still turn into markup once more bytes arrive.
+_MARKUP_START = re.compile(rb"<(?:/?[a-zA-Z]|[!?])")
+
+_NEWLINE_RUN = re.compile(rb"\s*\n\s*")
+_SPACE_RUN = re.compile(rb"[ \t\r\f\v]+")
+
+# Upper bound on bytes held back waiting for an unterminated tag or comment.
+_MAX_CARRY = 64 * 1024
+
+_raw_end_patterns: dict[bytes, re.Pattern[bytes]] = {}
+
+
+def _raw_end(name: bytes) -> re.Pattern[bytes]:
+    """Get the (cached) pattern matching the end tag of a raw text element."""
+    pattern = _raw_end_patterns.get(name)
+    if pattern is None:
+        pattern = _raw_end_patterns[name] = re.compile(rb"</" + name + rb"\s*>", re.IGNORECASE)
+    return pattern
+
+
+def _collapse(text: bytes) -> bytes:
+    """Collapse whitespace runs to a newline if they span lines, otherwise to a single space."""
+    return _SPACE_RUN.sub(b" ", _NEWLINE_RUN.sub(b"\n", text))
+
+
+class StreamingHTMLProcessor:
+    """
+    Single-pass, incremental HTML post-processor.
+
+    Strips comments and collapses insignificant whitespace without building a DOM. Chunks can be split
+    anywhere; incomplete markup at the end of a chunk is carried over to the next one. The contents of
+    `<pre>`, `<script>`, `<style>` and `<textarea>` are left untouched.
+    """
+
+    def __init__(self) -> None:
+        self.comments_removed = 0
+        self._carry = b""
+        self._pending_space = b""
+        self._started = False
+        self._raw_element: bytes | None = None
+
+    def feed(self, chunk: bytes) -> bytes:
+        """Process a chunk, returning whatever output is ready."""
+        return self._process(self._carry + chunk if self._carry else chunk, final=False)
+
+    def close(self) -> bytes:
+        """Flush any carried-over input. Trailing whitespace is dropped."""
+        output = self._process(self._carry, final=True)
+        self._pending_space = b""
+        return output
+
+    def _text(self, text: bytes) -> bytes:
+        if self._pending_space:
+            text = self._pending_space + text
+            self._pending_space = b""
+        text = _collapse(text)
+        if not self._started:
+            text = text.lstrip()
+        if text[-1:] in (b" ", b"\n"):
+            self._pending_space = text[-1:]
+            text = text[:-1]
+        if text:
+            self._started = True
+        return text
+
+    def _verbatim(self, data: bytes) -> bytes:
+        self._started = True
+        if self._pending_space:
+            data = self._pending_space + data
+            self._pending_space = b""
+        return data
+
+    def _process(self, buffer: bytes, final: bool) -> bytes:
+        self._carry = b""
+        output: list[bytes] = []
+        position = 0
+        length = len(buffer)
+
+        while position < length:
+            if self._raw_element is not None:
+                end = _raw_end(self._raw_element).search(buffer, position)
+                if end is None:
+                    # Hold back a possible partial end tag.
+                    split = length if final else buffer.rfind(b"<", position)
+                    if split == -1 or length - split > 64:
+                        split = length
+                    output.append(self._verbatim(buffer[position:split]))
+                    self._carry = buffer[split:]
+                    break
+                output.append(self._verbatim(buffer[position : end.end()]))
+                self._raw_element = None
+                position = end.end()
+                continue
+
+            lt = buffer.find(b"<", position)
+            if lt == -1:
+                output.append(self._text(buffer[position:]))
+                break
+            if lt > position:
+                output.append(self._text(buffer[position:lt]))
+
+            match = _MARKUP.match(buffer, lt)
+            if match is None:
+                rest = buffer[lt:]
+                if not final and len(rest) <= _MAX_CARRY and (len(rest) < 4 or _MARKUP_START.match(rest)):
+                    self._carry = rest
+                    break
+                if final and rest.startswith(b"<!--"):
+                    # An unterminated comment runs to the end of the document.
+                    self.comments_removed += 1
+                    break
+                output.append(self._text(b"<"))
+                position = lt + 1
+                continue
+
+            if buffer.startswith(b"<!--", lt):
+                self.comments_removed += 1
+            else:
+                output.append(self._verbatim(match.group()))
+                name = match.group(2)
+                if name is not None and not match.group(1):
+                    name = name.lower()
+                    if name in _RAW_TEXT_ELEMENTS and not match.group().endswith(b"/>"):
+                        self._raw_element = name
+            position = match.end()
+
+        return b"".join(output)
+
+
+def minify_html(body: bytes) -> tuple[bytes, int]:
+    """Process a complete document, returning the output and the number of comments removed."""
+    processor = StreamingHTMLProcessor()
+    output = processor.feed(body) + processor.close()
+    return output, processor.comments_removed
+
+
+def prettify_html(body: bytes) -> tuple[bytes, int]:
+    """Re-render a complete document through BeautifulSoup, returning the output and the comments removed."""
+    soup = BeautifulSoup(body.decode(), "html.parser")
+
+    # Remove all comments
+    comments = soup.find_all(string=lambda text: isinstance(text, Comment))
+    for comment in comments:
+        comment.extract()
+
+    return str(soup.prettify()).encode(), len(comments)
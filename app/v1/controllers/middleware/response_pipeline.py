@@ -0,0 +1,138 @@
+import hashlib
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Protocol
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import server_timing
+
+__all__ = ["ResponseContext", "ResponsePipelineMiddleware", "ResponseStage", "Transform"]
+
+
+class Transform(Protocol):
+    """Incremental body transform for a single response."""
+
+    def feed(self, chunk: bytes) -> bytes: ...
+
+    def close(self) -> bytes: ...
+
+
+@dataclass
+class ResponseContext:
+    """What a stage gets to see when deciding whether to transform a response."""
+
+    scope: Scope
+    headers: MutableHeaders
+    body: bytes
+    more_body: bool
+
+    @cached_property
+    def digest(self) -> bytes | None:
+        """Content hash of the complete body, or `None` if more chunks are to follow."""
+        if self.more_body:
+            return None
+        return hashlib.blake2b(self.body, digest_size=16).digest()
+
+
+class ResponseStage(Protocol):
+    """
+    A step in the response pipeline.
+
+    `open` is called once per response with the first body chunk (as output by the preceding stages). It returns a
+    transform for the rest of the body, or `None` to leave the response alone. Stages may mutate the headers. Time
+    spent in a stage that applies is recorded in the request's server timings under its `name`.
+    """
+
+    name: str
+
+    def open(self, context: ResponseContext) -> Transform | None: ...
+
+
+class ResponsePipelineMiddleware:
+    """
+    Pure ASGI middleware that runs response bodies through a chain of stages.
+
+    Unlike `BaseHTTPMiddleware` there is no extra task or memory stream per request: `http.response.body` messages
+    are rewritten as they pass through, and each chunk flows through every active stage before being sent on.
+    """
+
+    def __init__(self, app: ASGIApp, stages: Sequence[ResponseStage]) -> None:
+        self.app = app
+        self.stages = stages
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not self.stages:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _Responder(scope, send, self.stages)
+        await self.app(scope, receive, responder.send)
+
+
+class _Responder:
+    def __init__(self, scope: Scope, send: Send, stages: Sequence[ResponseStage]) -> None:
+        self.scope = scope
+        self._send = send
+        self.stages = stages
+        self.start: Message | None = None
+        self.transforms: list[tuple[str, Transform]] | None = None
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Hold the headers back until the first chunk tells us which stages apply.
+            self.start = message
+            return
+
+        if message_type != "http.response.body" or self.start is None:
+            if self.start is not None and self.transforms is None:
+                self.transforms = []
+                await self._send(self.start)
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.transforms is None:
+            await self._send_first(body, more_body)
+            return
+
+        for name, transform in self.transforms:
+            started = time.perf_counter()
+            body = transform.feed(body)
+            if not more_body:
+                body += transform.close()
+            server_timing.record(name, time.perf_counter() - started)
+        if body or not more_body:
+            await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _send_first(self, body: bytes, more_body: bool) -> None:
+        assert self.start is not None
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+
+        self.transforms = []
+        for stage in self.stages:
+            started = time.perf_counter()
+            transform = stage.open(ResponseContext(self.scope, headers, body, more_body))
+            if transform is None:
+                continue
+            self.transforms.append((stage.name, transform))
+            body = transform.feed(body)
+            if not more_body:
+                body += transform.close()
+            server_timing.record(stage.name, time.perf_counter() - started)
+
+        if self.transforms:
+            if more_body:
+                del headers["content-length"]
+            else:
+                headers["content-length"] = str(len(body))
+
+        await self._send({**self.start, "headers": headers.raw})
+        await self._send({"type": "http.response.body", "body": body, "more_body": more_body})
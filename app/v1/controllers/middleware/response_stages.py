@@ -0,0 +1,136 @@
+import zlib
+
+import logfire
+from starlette.datastructures import Headers
+
+from app.v1.controllers.middleware.body_cache import BodyCache
+from app.v1.controllers.middleware.html_processor import StreamingHTMLProcessor, minify_html, prettify_html
+from app.v1.controllers.middleware.response_pipeline import ResponseContext, Transform
+
+__all__ = ["GZipStage", "HTMLStage"]
+
+
+class _CachedTransform:
+    """Replaces the body with output computed (or looked up) up front."""
+
+    def __init__(self, output: bytes) -> None:
+        self.output = output
+
+    def feed(self, chunk: bytes) -> bytes:
+        return b""
+
+    def close(self) -> bytes:
+        return self.output
+
+
+class _MinifyTransform:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.processor = StreamingHTMLProcessor()
+
+    def feed(self, chunk: bytes) -> bytes:
+        return self.processor.feed(chunk)
+
+    def close(self) -> bytes:
+        output = self.processor.close()
+        logfire.debug("Processed HTML", path=self.path, comments_removed=self.processor.comments_removed)
+        return output
+
+
+class _PrettifyTransform:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.chunks: list[bytes] = []
+
+    def feed(self, chunk: bytes) -> bytes:
+        self.chunks.append(chunk)
+        return b""
+
+    def close(self) -> bytes:
+        output, comments_removed = prettify_html(b"".join(self.chunks))
+        logfire.debug("Processed HTML", path=self.path, comments_removed=comments_removed)
+        return output
+
+
+class HTMLStage:
+    """
+    Strip comments and collapse whitespace in HTML responses.
+
+    With `pretty` the whole body is buffered and re-rendered through BeautifulSoup instead. Bodies sent in one go
+    are looked up in `cache` first, if given.
+    """
+
+    name = "html"
+
+    def __init__(self, pretty: bool = False, cache: BodyCache | None = None) -> None:
+        self.pretty = pretty
+        self.cache = cache
+
+    def open(self, context: ResponseContext) -> Transform | None:
+        if not context.headers.get("content-type", "").startswith("text/html"):
+            return None
+        if "content-encoding" in context.headers:
+            return None
+
+        if self.cache is not None and context.digest is not None:
+            key = (b"pretty:" if self.pretty else b"html:") + context.digest
+            output = self.cache.get(key)
+            if output is None:
+                output, _ = prettify_html(context.body) if self.pretty else minify_html(context.body)
+                self.cache.put(key, output)
+            return _CachedTransform(output)
+
+        path: str = context.scope["path"]
+        return _PrettifyTransform(path) if self.pretty else _MinifyTransform(path)
+
+
+class _GZipTransform:
+    def __init__(self, compresslevel: int) -> None:
+        self.compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def feed(self, chunk: bytes) -> bytes:
+        return self.compressor.compress(chunk)
+
+    def close(self) -> bytes:
+        return self.compressor.flush()
+
+
+class GZipStage:
+    """
+    Gzip-encode responses for clients that accept it.
+
+    Bodies sent in one go under `minimum_size` are left as is; larger HTML ones are looked up in `cache` first, if
+    given. Other content (e.g. one-off JSON) is compressed every time, so it doesn't evict the pages the cache is for.
+    """
+
+    name = "gzip"
+
+    def __init__(self, minimum_size: int = 500, compresslevel: int = 9, cache: BodyCache | None = None) -> None:
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.cache = cache
+
+    def open(self, context: ResponseContext) -> Transform | None:
+        if "gzip" not in Headers(scope=context.scope).get("accept-encoding", ""):
+            return None
+        if "content-encoding" in context.headers:
+            return None
+        if context.headers.get("content-type", "").startswith("text/event-stream"):
+            return None
+        if not context.more_body and len(context.body) < self.minimum_size:
+            return None
+
+        context.headers["content-encoding"] = "gzip"
+        context.headers.add_vary_header("Accept-Encoding")
+
+        cacheable = context.headers.get("content-type", "").startswith("text/html")
+        if self.cache is not None and context.digest is not None and cacheable:
+            key = b"gzip:" + context.digest
+            output = self.cache.get(key)
+            if output is None:
+                transform = _GZipTransform(self.compresslevel)
+                output = transform.feed(context.body) + transform.close()
+                self.cache.put(key, output)
+            return _CachedTransform(output)
+
+        return _GZipTransform(self.compresslevel)
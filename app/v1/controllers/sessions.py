@@ -0,0 +1,15 @@
+from fastapi import Request
+
+from app.config.settings import settings
+from app.v1.repositories.sessions import Session
+from app.v1.services.sessions import session_store
+
+__all__ = ["current_session"]
+
+
+async def current_session(request: Request) -> Session | None:
+    """Dependency: the session named by the request's session cookie, if it's valid."""
+    session_id = request.cookies.get(settings.session_cookie_name)
+    if not session_id:
+        return None
+    return await session_store.get(session_id)
@@ -0,0 +1,209 @@
+import gzip
+import hashlib
+import importlib
+import mimetypes
+import os
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+import logfire
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.config.settings import settings
+from app.config.tailwind import build_stylesheet
+from app.v1.controllers.etags import etag_matches
+
+__all__ = ["Asset", "AssetManifest", "StaticAssets", "build_assets", "get_asset_manifest", "static_url"]
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+# Fingerprinted URLs change whenever their content does, so browsers never need to revalidate them.
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+_REFUSED = re.compile(r"q=0(\.0{0,3})?")
+
+_COMPRESSIBLE = ("text/", "application/javascript", "application/json", "image/svg+xml", "image/vnd.microsoft.icon")
+
+
+def _compressors() -> list[tuple[str, Callable[[bytes], bytes]]]:
+    """Content codings to precompress with, most preferred first."""
+    compressors: list[tuple[str, Callable[[bytes], bytes]]] = []
+    try:
+        # Optional: Brotli variants are only built when the package is installed.
+        brotli_compress: Callable[..., bytes] = importlib.import_module("brotli").compress
+    except ImportError:
+        pass
+    else:
+        compressors.append(("br", lambda content: brotli_compress(content, quality=11)))
+    compressors.append(("gzip", lambda content: gzip.compress(content, compresslevel=9, mtime=0)))
+    return compressors
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A static file, stored under its content hash alongside any precompressed variants."""
+
+    url: str
+    file: Path
+    media_type: str
+    digest: str
+    encodings: tuple[str, ...]
+
+    def etag(self, encoding: str | None) -> str:
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def negotiate(self, accept_encoding: str) -> str | None:
+        """The preferred precompressed variant the client accepts, or `None` for the file itself."""
+        accepted: set[str] = set()
+        for part in accept_encoding.split(","):
+            coding, *params = (item.strip() for item in part.split(";"))
+            if not any(_REFUSED.fullmatch(param.replace(" ", "")) for param in params):
+                accepted.add(coding.lower())
+        return next((encoding for encoding in self.encodings if encoding in accepted or "*" in accepted), None)
+
+
+class AssetManifest:
+    """Maps source paths (e.g. `js/htmx.min.js`) to assets, and fingerprinted URLs back to them."""
+
+    def __init__(self, assets: dict[str, Asset], prefix: str) -> None:
+        self.assets = assets
+        self.prefix = prefix
+        self.fingerprinted = {asset.url.removeprefix(prefix).lstrip("/"): asset for asset in assets.values()}
+
+    def url(self, path: str) -> str:
+        """The fingerprinted URL of a source path. Raises `KeyError` for files that don't exist."""
+        return self.assets[path.lstrip("/")].url
+
+    def lookup(self, path: str) -> tuple[Asset | None, bool]:
+        """Find the asset served at a path under the prefix, and whether the path was fingerprinted."""
+        if path in self.fingerprinted:
+            return self.fingerprinted[path], True
+        return self.assets.get(path), False
+
+
+def _write(path: Path, content: bytes) -> None:
+    # Written under a temporary name and renamed, so concurrent builds never serve a partial file.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(content)
+    os.replace(temporary, path)
+
+
+def build_assets(
+    source: Path, output: Path, prefix: str = "/static", generated: Mapping[str, bytes] | None = None
+) -> AssetManifest:
+    """
+    Fingerprint and precompress every file under `source`, and any `generated` ones (by path), into `output`.
+
+    Files are named after a hash of their content, so identical files share one copy (and one cache entry in the
+    browser). Text files also get gzip and, if `brotli` is installed, Brotli variants at maximum compression. Files
+    already in `output` are reused, so only the first build after a change pays for compressing.
+    """
+    compressors = _compressors()
+    assets: dict[str, Asset] = {}
+    by_digest: dict[str, Asset] = {}
+
+    with logfire.span("Build static assets", source=str(source)) as span:
+        files = {
+            file.relative_to(source).as_posix(): file.read_bytes()
+            for file in sorted(source.rglob("*"))
+            if file.is_file() and output not in file.parents
+        }
+        for path, content in (files | dict(generated or {})).items():
+            digest = hashlib.blake2b(content, digest_size=8).hexdigest()
+            if digest in by_digest:
+                assets[path] = by_digest[digest]
+                continue
+
+            logical = PurePosixPath(path)
+            fingerprinted = logical.with_name(f"{logical.stem}.{digest}{logical.suffix}").as_posix()
+            target = output / fingerprinted
+            if not target.exists():
+                _write(target, content)
+
+            media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+            encodings: list[str] = []
+            if media_type.startswith(_COMPRESSIBLE):
+                for encoding, compress in compressors:
+                    variant = target.with_name(target.name + _SUFFIXES[encoding])
+                    if not variant.exists():
+                        _write(variant, compress(content))
+                    encodings.append(encoding)
+
+            asset = Asset(
+                url=f"{prefix}/{fingerprinted}",
+                file=target,
+                media_type=media_type,
+                digest=digest,
+                encodings=tuple(encodings),
+            )
+            assets[path] = by_digest[digest] = asset
+
+        span.set_attribute("files", len(assets))
+        span.set_attribute("unique", len(by_digest))
+
+    return AssetManifest(assets, prefix)
+
+
+class StaticAssets:
+    """
+    ASGI app serving a manifest's assets, precompressed where the client accepts it.
+
+    Fingerprinted URLs are cached forever. Source paths still work for anything not linked through `static_url`, but
+    are revalidated against their ETag on every use.
+    """
+
+    def __init__(self, manifest: AssetManifest) -> None:
+        self.manifest = manifest
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        assert scope["type"] == "http"
+        path: str = scope["path"].removeprefix(scope.get("root_path", "")).lstrip("/")
+        response = self.respond(scope["method"], path, Headers(scope=scope))
+        await response(scope, receive, send)
+
+    def respond(self, method: str, path: str, headers: Headers) -> Response:
+        if method not in ("GET", "HEAD"):
+            return PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+        asset, immutable = self.manifest.lookup(path)
+        if asset is None:
+            return PlainTextResponse("Not Found", status_code=404)
+
+        encoding = asset.negotiate(headers.get("accept-encoding", ""))
+        response_headers = {
+            "ETag": asset.etag(encoding),
+            "Cache-Control": IMMUTABLE if immutable else "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(headers.get("if-none-match"), response_headers["ETag"]):
+            return Response(status_code=304, headers=response_headers)
+
+        file = asset.file
+        if encoding is not None:
+            file = file.with_name(file.name + _SUFFIXES[encoding])
+            response_headers["Content-Encoding"] = encoding
+        return FileResponse(file, headers=response_headers, media_type=asset.media_type)
+
+
+_manifest: AssetManifest | None = None
+
+
+def get_asset_manifest() -> AssetManifest:
+    """Get the manifest of the static directory and the stylesheet built for the templates, building it on first use"""
+    global _manifest
+    if _manifest is None:
+        stylesheet = build_stylesheet(TEMPLATES_DIR, Path(settings.static_dir) / "css" / "base.css")
+        _manifest = build_assets(
+            Path(settings.static_dir), Path(settings.static_build_dir), generated={"css/app.css": stylesheet}
+        )
+    return _manifest
+
+
+def static_url(path: str) -> str:
+    """Fingerprinted URL of a file in the static directory, for templates."""
+    return get_asset_manifest().url(path)
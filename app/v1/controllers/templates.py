@@ -0,0 +1,97 @@
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+from app.config import server_timing
+from app.config.settings import settings
+from app.v1.controllers.static_assets import TEMPLATES_DIR, static_url
+from app.v1.repositories.transactions import HIGHLIGHT_END, HIGHLIGHT_START
+
+__all__ = ["FRAGMENT_HEADERS", "create_environment", "render", "render_block", "templates"]
+
+# Request headers that decide which fragment `render` returns, so responses must vary by them.
+FRAGMENT_HEADERS = ("HX-Request", "HX-Target", "HX-History-Restore-Request")
+
+
+def highlight(text: str | None) -> Markup:
+    """Escape search result text, marking up the matched terms."""
+    return Markup(str(escape(text or "")).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>"))
+
+
+def money(amount: int) -> str:
+    """Format an amount in minor units, e.g. -1250 as -12.50."""
+    return f"{'-' if amount < 0 else ''}{abs(amount) / 100:,.2f}"
+
+
+def create_environment(directory: Path, auto_reload: bool, bytecode_cache_dir: str = "") -> Environment:
+    """
+    Build the Jinja environment templates are rendered with.
+
+    Without `auto_reload` a compiled template is never checked against its source again. Compiled templates are also
+    cached on disk (in `bytecode_cache_dir`, or the system temp directory), so a new worker loads them rather than
+    compiling every template on its first requests.
+    """
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=select_autoescape(),
+        auto_reload=auto_reload,
+        bytecode_cache=FileSystemBytecodeCache(bytecode_cache_dir or None),
+    )
+    env.filters["highlight"] = highlight
+    env.filters["money"] = money
+    env.globals["static_url"] = static_url  # pyright: ignore[reportArgumentType] (typed from Jinja's defaults)
+    return env
+
+
+templates = Jinja2Templates(
+    env=create_environment(TEMPLATES_DIR, settings.debug, settings.jinja_bytecode_cache_dir),
+)
+
+
+def render_block(name: str, block: str, context: Mapping[str, Any]) -> str:
+    """Render a single block of a template, without the layout it extends."""
+    template = templates.env.get_template(name)
+    return "".join(template.blocks[block](template.new_context(dict(context))))
+
+
+def _fragment(request: Request, name: str) -> str | None:
+    """
+    The block an htmx request should get instead of the whole page: the one named after the element being swapped
+    (`HX-Target`), else `content`. History restores need the whole page, as do templates without that block.
+    """
+    if "hx-request" not in request.headers or "hx-history-restore-request" in request.headers:
+        return None
+    blocks = templates.env.get_template(name).blocks
+    target = request.headers.get("hx-target")
+    if target in blocks:
+        return target
+    return "content" if "content" in blocks else None
+
+
+def render(
+    request: Request,
+    name: str,
+    context: Mapping[str, Any] | None = None,
+    block: str | None = None,
+    status_code: int = 200,
+) -> HTMLResponse:
+    """
+    Render a template as a response.
+
+    An htmx request gets only the block it targets, so partial updates don't pay for rendering (and sending) the
+    layout. Pass `block` to always render just that block.
+    """
+    context = {"request": request, **(context or {})}
+    with server_timing.measure("template"):
+        block = block or _fragment(request, name)
+        if block is None:
+            content = templates.env.get_template(name).render(context)
+        else:
+            content = render_block(name, block, context)
+    return HTMLResponse(content, status_code=status_code, headers={"Vary": ", ".join(FRAGMENT_HEADERS)})
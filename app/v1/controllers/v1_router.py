@@ -1,25 +1,150 @@
+import asyncio
+import secrets
+import threading
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from datetime import datetime
+from typing import Literal
 
-from fastapi import APIRouter, FastAPI
-from fastapi.responses import RedirectResponse
+import logfire
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import ValidationError
 
-from app.v1.repositories.upgrade import upgrade
+from app.config.async_database import close_async_database
+from app.config.database import close_pool
+from app.config.maintenance import maintenance
+from app.config.settings import settings
+from app.config.sql_profiler import profiler
+from app.v1.api_models.chart import ChartSeries
+from app.v1.api_models.monzo_webhook import MonzoWebhookEvent
+from app.v1.api_models.sql_profile import SQLStatementStats
+from app.v1.controllers.cached import cached_response
+from app.v1.controllers.conditional import ConditionalRoute, conditional
+from app.v1.controllers.templates import render
+from app.v1.gateways.monzo import MonzoTransaction, close_monzo_client
+from app.v1.gateways.resend import close_resend_client
+from app.v1.repositories.transactions import InvalidCursorError, TransactionRepository
+from app.v1.repositories.upgrade import run_data_migrations, upgrade
+from app.v1.services.charts import ChartService
+from app.v1.services.email import email_dispatcher
+from app.v1.services.sessions import session_store
+from app.v1.services.tokens import monzo_tokens
+
+
+def _backfill(stop: threading.Event) -> None:
+    try:
+        run_data_migrations(stop)
+    except Exception:
+        logfire.exception("Data migrations failed")
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     # Upgrade database schema.
-    upgrade()
+    await asyncio.to_thread(upgrade)
+
+    # Backfill data in the background, without holding up startup.
+    stop = threading.Event()
+    backfill = asyncio.create_task(asyncio.to_thread(_backfill, stop))
+
+    # Write session last-seen times and sweep expired sessions in the background.
+    stop_background = asyncio.Event()
+    sessions = asyncio.create_task(
+        session_store.run(stop_background, settings.session_flush_interval, settings.session_sweep_interval)
+    )
+
+    # Checkpoint the WAL, reclaim free pages and refresh planner statistics.
+    background = [sessions, asyncio.create_task(maintenance.run(stop_background))]
+
+    # Keep the Monzo access token fresh, so syncs never wait on a refresh.
+    if settings.monzo_client_id:
+        background.append(asyncio.create_task(monzo_tokens.run(stop_background)))
+
+    # Send queued emails, so handlers only ever insert them.
+    if settings.resend_api_key:
+        background.append(asyncio.create_task(email_dispatcher.run(stop_background, settings.email_poll_interval)))
+
     yield
 
+    stop.set()
+    stop_background.set()
+    await backfill
+    await asyncio.gather(*background)
+    profiler.flush()
+    await close_monzo_client()
+    await close_resend_client()
+    close_async_database()
+    close_pool()
+
 
 router = APIRouter(
     lifespan=lifespan,
     prefix="/v1",
     tags=["v1"],
+    route_class=ConditionalRoute,
 )
 
 
 @router.get("/")
 async def index():
     return RedirectResponse(url="/v5/budget")
+
+
+@router.get("/debug/sql")
+async def debug_sql(
+    limit: int = Query(20, ge=1, le=500),
+    by: Literal["total_ms", "mean_ms", "p50_ms", "p95_ms", "count", "rows"] = "total_ms",
+) -> list[SQLStatementStats]:
+    """List the slowest SQL statement fingerprints since startup (debug mode only)."""
+    if not settings.debug:
+        raise HTTPException(status_code=404)
+    return [SQLStatementStats(**asdict(summary)) for summary in profiler.top(limit, by)]
+
+
+@router.post("/webhooks/monzo", status_code=204)
+async def monzo_webhook(event: MonzoWebhookEvent, secret: str = Query("")) -> None:
+    """Store a transaction pushed by Monzo, keeping the budget fresh between syncs."""
+    if not settings.monzo_webhook_secret:
+        raise HTTPException(status_code=404)
+    if not secrets.compare_digest(secret, settings.monzo_webhook_secret):
+        raise HTTPException(status_code=403)
+    if event.type not in ("transaction.created", "transaction.updated"):
+        return
+
+    try:
+        transaction = MonzoTransaction.model_validate(event.data)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False)) from e
+    await TransactionRepository().upsert([transaction])
+
+
+@router.get("/transactions/search", response_class=HTMLResponse, dependencies=[Depends(conditional("transactions"))])
+async def search_transactions(request: Request, q: str = "", limit: int = Query(20, ge=1, le=100)):
+    """Render the search results partial, for htmx to swap into the transactions page."""
+    page = await TransactionRepository().search(q, limit)
+    return render(request, "partials/transaction_search_results.html", {"page": page})
+
+
+@router.get("/transactions/rows", response_class=HTMLResponse, dependencies=[Depends(conditional("transactions"))])
+async def transaction_rows(request: Request, cursor: str | None = None, limit: int = Query(50, ge=1, le=200)):
+    """Render the next slice of transaction rows, ending in a row that loads the slice after it when revealed."""
+    try:
+        page = await TransactionRepository().page(cursor, limit)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    return render(request, "partials/transaction_rows.html", {"page": page})
+
+
+@router.get("/charts/spending", response_model=ChartSeries, dependencies=[Depends(conditional("transactions"))])
+@cached_response("transactions")
+async def spending_chart(
+    bucket: int = Query(86400, ge=60, description="Bucket size in seconds"),
+    width: int = Query(800, ge=2, le=10_000, description="Most points to return, e.g. the chart's width in pixels"),
+    start: datetime | None = None,
+    end: datetime | None = None,
+    category: str | None = None,
+) -> Response:
+    """Spending over time as columnar arrays, bucketed in SQL and downsampled with LTTB."""
+    t, v = await ChartService().spending(bucket, width, start, end, category)
+    return Response(ChartSeries(t=t, v=v).model_dump_json(), media_type="application/json")
@@ -0,0 +1,250 @@
+import asyncio
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+from pydantic import BaseModel, field_validator
+
+from app.config.settings import settings
+
+__all__ = [
+    "MonzoAccount",
+    "MonzoGateway",
+    "MonzoMerchant",
+    "MonzoToken",
+    "MonzoTransaction",
+    "close_monzo_client",
+    "get_monzo_client",
+    "refresh_access_token",
+]
+
+# Largest page the Monzo API returns.
+PAGE_SIZE = 100
+
+_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class MonzoAccount(BaseModel):
+    id: str
+    description: str = ""
+    closed: bool = False
+
+
+class MonzoMerchant(BaseModel):
+    id: str
+    name: str = ""
+
+
+class MonzoTransaction(BaseModel):
+    id: str
+    account_id: str
+    amount: int
+    currency: str
+    created: datetime
+    settled: datetime | None = None
+    description: str = ""
+    category: str = ""
+    notes: str = ""
+    merchant: MonzoMerchant | None = None
+    include_in_spending: bool = True
+
+    @field_validator("settled", mode="before")
+    @classmethod
+    def _unsettled(cls, value: Any) -> Any:
+        # Monzo sends "" for unsettled transactions.
+        return None if value == "" else value
+
+    @field_validator("merchant", mode="before")
+    @classmethod
+    def _merchant(cls, value: Any) -> Any:
+        # Merchants are a bare ID unless expanded, and "" when there is none.
+        if value == "":
+            return None
+        if isinstance(value, str):
+            return {"id": value}
+        return value
+
+
+class MonzoToken(BaseModel):
+    access_token: str
+    refresh_token: str
+    expires_in: int
+
+
+class _AccountsPage(BaseModel):
+    accounts: list[MonzoAccount]
+
+
+class _TransactionsPage(BaseModel):
+    transactions: list[MonzoTransaction]
+
+
+def _cursor(value: str | datetime | None) -> str | None:
+    if isinstance(value, datetime):
+        return value.astimezone(UTC).isoformat().replace("+00:00", "Z")
+    return value
+
+
+class MonzoGateway:
+    """
+    Monzo API client.
+
+    Shares one long-lived `httpx.AsyncClient` (and so its keep-alive pool) across calls. Requests that are rate
+    limited or hit a transient server error are retried with exponential backoff, honouring `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        get_access_token: Callable[[], Awaitable[str]],
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.client = client
+        self.get_access_token = get_access_token
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return min(self.backoff * 2**attempt * (1 + random.random()), self.max_backoff)
+
+    async def _get[T: BaseModel](self, path: str, params: dict[str, Any], model: type[T]) -> T:
+        for attempt in range(self.max_retries + 1):
+            headers = {"Authorization": f"Bearer {await self.get_access_token()}"}
+            response = await self.client.get(path, params=params, headers=headers)
+            if response.status_code in _RETRY_STATUS_CODES and attempt < self.max_retries:
+                await asyncio.sleep(self._retry_delay(response, attempt))
+                continue
+            response.raise_for_status()
+            return model.model_validate_json(response.content)
+        raise AssertionError("unreachable")
+
+    async def list_accounts(self) -> list[MonzoAccount]:
+        page = await self._get("/accounts", {}, _AccountsPage)
+        return page.accounts
+
+    async def iter_transaction_pages(
+        self,
+        account_id: str,
+        since: str | datetime | None = None,
+        before: datetime | None = None,
+        limit: int = PAGE_SIZE,
+    ) -> AsyncIterator[list[MonzoTransaction]]:
+        """
+        Page through an account's transactions, oldest first.
+
+        `since` is a transaction ID or a timestamp; each following page starts after the last transaction seen.
+        """
+        cursor = _cursor(since)
+        while True:
+            params: dict[str, Any] = {"account_id": account_id, "limit": limit, "expand[]": "merchant"}
+            if cursor is not None:
+                params["since"] = cursor
+            if before is not None:
+                params["before"] = _cursor(before)
+
+            transactions = (await self._get("/transactions", params, _TransactionsPage)).transactions
+            if transactions:
+                yield transactions
+            if len(transactions) < limit:
+                return
+            cursor = transactions[-1].id
+
+    async def iter_transactions(
+        self,
+        account_ids: list[str] | None = None,
+        since: str | datetime | None = None,
+        before: datetime | None = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[MonzoTransaction]:
+        """
+        Stream the transactions of several accounts (all open accounts by default), fetched concurrently.
+
+        Pages are yielded as they arrive, so transactions of different accounts interleave. At most `concurrency`
+        decoded pages are buffered per account before fetching waits for the consumer.
+        """
+        if account_ids is None:
+            account_ids = [account.id for account in await self.list_accounts() if not account.closed]
+        if not account_ids:
+            return
+
+        queue: asyncio.Queue[list[MonzoTransaction] | Exception | None] = asyncio.Queue(
+            maxsize=concurrency * len(account_ids)
+        )
+
+        async def fetch(account_id: str) -> None:
+            try:
+                async for page in self.iter_transaction_pages(account_id, since=since, before=before):
+                    await queue.put(page)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(None)
+
+        tasks = [asyncio.create_task(fetch(account_id)) for account_id in account_ids]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is None:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    for transaction in item:
+                        yield transaction
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def refresh_access_token(client: httpx.AsyncClient, refresh_token: str) -> MonzoToken:
+    """
+    Exchange a refresh token for new tokens. Monzo refresh tokens are single use: the old one stops working, and so
+    does the access token issued with it.
+    """
+    response = await client.post(
+        "/oauth2/token",
+        data={
+            "grant_type": "refresh_token",
+            "client_id": settings.monzo_client_id,
+            "client_secret": settings.monzo_client_secret,
+            "refresh_token": refresh_token,
+        },
+    )
+    response.raise_for_status()
+    return MonzoToken.model_validate_json(response.content)
+
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_monzo_client() -> httpx.AsyncClient:
+    """Get the shared Monzo HTTP client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.monzo_api_url,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
+    return _client
+
+
+async def close_monzo_client() -> None:
+    """Close the shared Monzo HTTP client, if any"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
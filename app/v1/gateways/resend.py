@@ -0,0 +1,98 @@
+from collections.abc import Sequence
+
+import httpx
+from pydantic import BaseModel, Field
+
+from app.config.settings import settings
+
+__all__ = ["ResendEmail", "ResendError", "ResendGateway", "close_resend_client", "get_resend_client"]
+
+# Most emails Resend accepts in one batch request.
+BATCH_SIZE = 100
+
+_RETRY_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+
+class ResendEmail(BaseModel):
+    sender: str = Field(serialization_alias="from")
+    to: list[str]
+    subject: str
+    html: str | None = None
+    text: str | None = None
+
+
+class _SentEmail(BaseModel):
+    id: str
+
+
+class _BatchResponse(BaseModel):
+    data: list[_SentEmail]
+
+
+class ResendError(Exception):
+    """A request to Resend failed. `retryable` failures may succeed if sent again."""
+
+    def __init__(self, message: str, status_code: int | None = None, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        return self.status_code is None or self.status_code in _RETRY_STATUS_CODES
+
+
+class ResendGateway:
+    """Resend API client, sending over a shared `httpx.AsyncClient`."""
+
+    def __init__(self, client: httpx.AsyncClient, api_key: str) -> None:
+        self.client = client
+        self.api_key = api_key
+
+    async def send_batch(self, emails: Sequence[ResendEmail], idempotency_key: str) -> list[str]:
+        """
+        Send up to `BATCH_SIZE` emails in one request, returning the ID Resend gave each, in order.
+
+        Resend accepts or rejects the batch as a whole. Sending again with the same `idempotency_key` (within 24
+        hours) doesn't send the emails twice.
+        """
+        try:
+            response = await self.client.post(
+                "/emails/batch",
+                json=[email.model_dump(by_alias=True, exclude_none=True) for email in emails],
+                headers={"Authorization": f"Bearer {self.api_key}", "Idempotency-Key": idempotency_key},
+            )
+        except httpx.TransportError as e:
+            raise ResendError(f"Couldn't reach Resend: {e!r}") from e
+
+        if response.is_error:
+            retry_after = response.headers.get("retry-after")
+            raise ResendError(
+                f"Resend responded {response.status_code}: {response.text[:200]}",
+                status_code=response.status_code,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        return [email.id for email in _BatchResponse.model_validate_json(response.content).data]
+
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_resend_client() -> httpx.AsyncClient:
+    """Get the shared Resend HTTP client, creating it on first use"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.resend_api_url,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=60),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
+    return _client
+
+
+async def close_resend_client() -> None:
+    """Close the shared Resend HTTP client, if any"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,143 @@
+import sqlite3
+from dataclasses import dataclass
+
+import logfire
+
+from app.config.async_database import AsyncDatabase, get_async_database
+
+__all__ = ["BudgetRepository", "CategoryTotal", "RollupMismatch", "rebuild_rollups"]
+
+# Rollups as they'd be computed from scratch.
+_COMPUTED = """
+SELECT
+    substr(created_at, 1, 7) AS month,
+    category,
+    account_id,
+    sum(amount) AS amount,
+    sum(CASE WHEN include_in_spending THEN amount ELSE 0 END) AS spending,
+    count(*) AS transactions
+FROM transactions
+GROUP BY 1, 2, 3
+"""
+
+
+@dataclass
+class CategoryTotal:
+    """A category's totals for a month, in minor units"""
+
+    category: str
+    amount: int
+    spending: int
+    transactions: int
+
+
+@dataclass
+class RollupMismatch:
+    """A rollup row that differs from the transactions it summarizes (`None` where one side has no row)"""
+
+    month: str
+    category: str
+    account_id: str
+    stored: tuple[int, int, int] | None
+    computed: tuple[int, int, int] | None
+
+
+def _mismatches(conn: sqlite3.Connection) -> list[RollupMismatch]:
+    rows = conn.execute(
+        f"""
+        SELECT month, category, account_id,
+            max(CASE WHEN side = 'stored' THEN amount END) AS stored_amount,
+            max(CASE WHEN side = 'stored' THEN spending END) AS stored_spending,
+            max(CASE WHEN side = 'stored' THEN transactions END) AS stored_transactions,
+            max(CASE WHEN side = 'computed' THEN amount END) AS computed_amount,
+            max(CASE WHEN side = 'computed' THEN spending END) AS computed_spending,
+            max(CASE WHEN side = 'computed' THEN transactions END) AS computed_transactions
+        FROM (
+            SELECT 'stored' AS side, month, category, account_id, amount, spending, transactions FROM budget_rollups
+            UNION ALL
+            SELECT 'computed', * FROM ({_COMPUTED})
+        )
+        GROUP BY month, category, account_id
+        HAVING stored_amount IS NOT computed_amount
+            OR stored_spending IS NOT computed_spending
+            OR stored_transactions IS NOT computed_transactions
+        ORDER BY month, category, account_id
+        """
+    ).fetchall()
+    return [
+        RollupMismatch(
+            month=row["month"],
+            category=row["category"],
+            account_id=row["account_id"],
+            stored=None
+            if row["stored_transactions"] is None
+            else (row["stored_amount"], row["stored_spending"], row["stored_transactions"]),
+            computed=None
+            if row["computed_transactions"] is None
+            else (row["computed_amount"], row["computed_spending"], row["computed_transactions"]),
+        )
+        for row in rows
+    ]
+
+
+def rebuild_rollups(conn: sqlite3.Connection) -> None:
+    """Recompute every rollup from the transactions."""
+    conn.execute("DELETE FROM budget_rollups")
+    conn.execute(
+        f"INSERT INTO budget_rollups (month, category, account_id, amount, spending, transactions) {_COMPUTED}"
+    )
+
+
+class BudgetRepository:
+    """
+    Budget totals, read from `budget_rollups` rather than by scanning transactions.
+
+    Triggers on `transactions` keep the rollups current; `check` and `rebuild` catch and repair any drift.
+    """
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def month_totals(self, month: str) -> list[CategoryTotal]:
+        """Get per-category totals across accounts for a `YYYY-MM` month, largest spend first."""
+
+        def month_totals(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
+                """
+                SELECT category, sum(amount) AS amount, sum(spending) AS spending, sum(transactions) AS transactions
+                FROM budget_rollups
+                WHERE month = ?
+                GROUP BY category
+                ORDER BY spending, category
+                """,
+                (month,),
+            ).fetchall()
+
+        return [
+            CategoryTotal(
+                category=row["category"],
+                amount=row["amount"],
+                spending=row["spending"],
+                transactions=row["transactions"],
+            )
+            for row in await self.database.read(month_totals)
+        ]
+
+    async def months(self) -> list[str]:
+        """Get the months that have transactions, latest first."""
+        rows = await self.database.read(
+            lambda conn: conn.execute("SELECT DISTINCT month FROM budget_rollups ORDER BY month DESC").fetchall()
+        )
+        return [row["month"] for row in rows]
+
+    async def check(self) -> list[RollupMismatch]:
+        """Compare the rollups against the transactions, returning any rows that differ."""
+        with logfire.span("Check budget rollups") as span:
+            mismatches = await self.database.read(_mismatches)
+            span.set_attribute("mismatches", len(mismatches))
+        return mismatches
+
+    async def rebuild(self) -> None:
+        """Recompute every rollup from the transactions, in one transaction."""
+        with logfire.span("Rebuild budget rollups"):
+            await self.database.write(rebuild_rollups)
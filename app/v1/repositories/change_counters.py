@@ -0,0 +1,36 @@
+import sqlite3
+from collections.abc import Sequence
+
+from app.config.async_database import AsyncDatabase, get_async_database
+
+__all__ = ["ChangeCounterRepository", "bump"]
+
+
+def bump(conn: sqlite3.Connection, name: str) -> None:
+    """Count a change to `name`, as part of the caller's write."""
+    conn.execute(
+        """
+        INSERT INTO change_counters (name, version) VALUES (?, 1)
+        ON CONFLICT (name) DO UPDATE SET version = version + 1
+        """,
+        (name,),
+    )
+
+
+class ChangeCounterRepository:
+    """Version numbers of tables, bumped by every write that changes their rows."""
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def versions(self, names: Sequence[str]) -> dict[str, int]:
+        """The current version of each name. Names that have never changed are at 0."""
+
+        def versions(conn: sqlite3.Connection) -> dict[str, int]:
+            rows = conn.execute(
+                f"SELECT name, version FROM change_counters WHERE name IN ({', '.join('?' for _ in names)})", names
+            ).fetchall()
+            return {row["name"]: row["version"] for row in rows}
+
+        found = await self.database.read(versions) if names else {}
+        return {name: found.get(name, 0) for name in names}
@@ -0,0 +1,67 @@
+import sqlite3
+from datetime import datetime
+from functools import partial
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.v1.repositories.transactions import format_timestamp
+
+__all__ = ["ChartRepository"]
+
+
+def _spending(
+    conn: sqlite3.Connection, bucket: int, start: str | None, end: str | None, category: str | None
+) -> list[sqlite3.Row]:
+    # Everything referenced is in transactions_created_at_id, so this never reads the table itself. Transactions
+    # excluded from spending are left out, as they are from the budget rollups.
+    conditions = ["amount < 0", "include_in_spending"]
+    parameters: dict[str, object] = {"bucket": bucket}
+    if start is not None:
+        conditions.append("created_at >= :start")
+        parameters["start"] = start
+    if end is not None:
+        conditions.append("created_at < :end")
+        parameters["end"] = end
+    if category is not None:
+        conditions.append("category = :category")
+        parameters["category"] = category
+
+    return conn.execute(
+        f"""
+        SELECT CAST(strftime('%s', created_at) AS INTEGER) / :bucket * :bucket AS t, -sum(amount) AS v
+        FROM transactions
+        WHERE {" AND ".join(conditions)}
+        GROUP BY 1
+        ORDER BY 1
+        """,
+        parameters,
+    ).fetchall()
+
+
+class ChartRepository:
+    """Time series aggregated in SQL, one row per bucket rather than per transaction."""
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def spending(
+        self,
+        bucket: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        category: str | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """
+        Total outgoings per `bucket` seconds between `start` and `end`, as parallel lists of bucket start times (Unix
+        seconds) and amounts (minor units). Outgoings excluded from spending don't count, and buckets without any are
+        omitted.
+        """
+        rows = await self.database.read(
+            partial(
+                _spending,
+                bucket=bucket,
+                start=format_timestamp(start),
+                end=format_timestamp(end),
+                category=category,
+            )
+        )
+        return [row["t"] for row in rows], [row["v"] for row in rows]
@@ -0,0 +1,185 @@
+import json
+import sqlite3
+import uuid
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.v1.repositories.transactions import format_timestamp
+
+__all__ = ["EmailOutboxRepository", "OutboxEmail", "enqueue_email"]
+
+_COLUMNS = "id, idempotency_key, batch_key, sender, recipients, subject, html, text, attempts"
+
+
+@dataclass
+class OutboxEmail:
+    """
+    A transactional email. Emails queued with the same `idempotency_key` are only sent once. Once claimed, an email
+    has the `batch_key` of the request to Resend it's sent in.
+    """
+
+    sender: str
+    to: list[str]
+    subject: str
+    html: str = ""
+    text: str = ""
+    idempotency_key: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: int | None = None
+    attempts: int = 0
+    batch_key: str | None = None
+
+
+def enqueue_email(conn: sqlite3.Connection, email: OutboxEmail, now: datetime) -> bool:
+    """Queue an email as part of the caller's write. Returns whether it was queued, rather than a duplicate."""
+    return (
+        conn.execute(
+            """
+            INSERT INTO email_outbox (idempotency_key, sender, recipients, subject, html, text, next_attempt_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (idempotency_key) DO NOTHING
+            """,
+            (
+                email.idempotency_key,
+                email.sender,
+                json.dumps(email.to),
+                email.subject,
+                email.html,
+                email.text,
+                format_timestamp(now),
+            ),
+        ).rowcount
+        > 0
+    )
+
+
+class EmailOutboxRepository:
+    """Queued emails, and the outcome of sending them"""
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def enqueue(self, email: OutboxEmail, now: datetime) -> bool:
+        return await self.database.write(lambda conn: enqueue_email(conn, email, now))
+
+    async def claim(self, now: datetime, limit: int, claim_for: timedelta) -> list[OutboxEmail]:
+        """
+        Claim the next batch of due emails until `now + claim_for`, so no other dispatcher sends them meanwhile.
+
+        An email that has been tried before is only ever retried with the rest of its batch, which keeps its
+        `batch_key`; otherwise up to `limit` due emails are claimed as a new batch, oldest first. Emails come back in
+        the same order on every attempt.
+        """
+        parameters = {"now": format_timestamp(now), "until": format_timestamp(now + claim_for), "limit": limit}
+
+        def claim(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            oldest = conn.execute(
+                """
+                SELECT batch_key FROM email_outbox
+                WHERE status = 'pending' AND next_attempt_at <= :now
+                    AND (claimed_until IS NULL OR claimed_until <= :now)
+                ORDER BY next_attempt_at, id
+                LIMIT 1
+                """,
+                parameters,
+            ).fetchone()
+            if oldest is None:
+                return []
+            if oldest["batch_key"] is not None:
+                rows = conn.execute(
+                    f"""
+                    UPDATE email_outbox SET claimed_until = :until
+                    WHERE status = 'pending' AND batch_key = :batch_key
+                    RETURNING {_COLUMNS}
+                    """,
+                    parameters | {"batch_key": oldest["batch_key"]},
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    f"""
+                    UPDATE email_outbox SET claimed_until = :until, batch_key = :batch_key
+                    WHERE id IN (
+                        SELECT id FROM email_outbox
+                        WHERE status = 'pending' AND batch_key IS NULL AND next_attempt_at <= :now
+                            AND (claimed_until IS NULL OR claimed_until <= :now)
+                        ORDER BY next_attempt_at, id
+                        LIMIT :limit
+                    )
+                    RETURNING {_COLUMNS}
+                    """,
+                    parameters | {"batch_key": f"batch-{uuid.uuid4()}"},
+                ).fetchall()
+            return sorted(rows, key=lambda row: row["id"])
+
+        return [
+            OutboxEmail(
+                sender=row["sender"],
+                to=json.loads(row["recipients"]),
+                subject=row["subject"],
+                html=row["html"],
+                text=row["text"],
+                idempotency_key=row["idempotency_key"],
+                id=row["id"],
+                attempts=row["attempts"],
+                batch_key=row["batch_key"],
+            )
+            for row in await self.database.write(claim)
+        ]
+
+    async def split(self, ids: Iterable[int]) -> None:
+        """Give each email (by outbox ID) a batch of its own, keyed by its `idempotency_key`."""
+        parameters = [(id,) for id in ids]
+
+        def split(conn: sqlite3.Connection) -> None:
+            conn.executemany("UPDATE email_outbox SET batch_key = idempotency_key WHERE id = ?", parameters)
+
+        if parameters:
+            await self.database.write(split)
+
+    async def mark_sent(self, resend_ids: Mapping[int, str], now: datetime) -> None:
+        """Record emails (by outbox ID) as sent, with the ID Resend gave each."""
+
+        def mark_sent(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                """
+                UPDATE email_outbox SET status = 'sent', attempts = attempts + 1, resend_id = ?, sent_at = ?,
+                    last_error = NULL, claimed_until = NULL
+                WHERE id = ?
+                """,
+                [(resend_id, format_timestamp(now), id) for id, resend_id in resend_ids.items()],
+            )
+
+        if resend_ids:
+            await self.database.write(mark_sent)
+
+    async def mark_failed(self, retry_at: Mapping[int, datetime | None], error: str) -> None:
+        """
+        Record a failed attempt at sending emails (by outbox ID), each to be retried at its `retry_at` or, without
+        one, given up on.
+        """
+
+        def mark_failed(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                """
+                UPDATE email_outbox SET
+                    status = CASE WHEN ? IS NULL THEN 'failed' ELSE 'pending' END,
+                    attempts = attempts + 1,
+                    next_attempt_at = coalesce(?, next_attempt_at),
+                    last_error = ?,
+                    claimed_until = NULL
+                WHERE id = ?
+                """,
+                [(format_timestamp(at), format_timestamp(at), error, id) for id, at in retry_at.items()],
+            )
+
+        if retry_at:
+            await self.database.write(mark_failed)
+
+    async def counts(self) -> dict[str, int]:
+        """How many emails are in each status."""
+
+        def counts(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute("SELECT status, count(*) AS n FROM email_outbox GROUP BY status").fetchall()
+
+        return {row["status"]: row["n"] for row in await self.database.read(counts)}
@@ -0,0 +1,26 @@
+-- transactions
+CREATE TABLE transactions (
+    id TEXT PRIMARY KEY,
+    account_id TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    settled_at TEXT,
+    description TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    notes TEXT NOT NULL DEFAULT '',
+    merchant_id TEXT,
+    merchant_name TEXT,
+    include_in_spending INTEGER NOT NULL DEFAULT 1,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX transactions_account_id_created_at ON transactions (account_id, created_at);
+CREATE INDEX transactions_category_created_at ON transactions (category, created_at);
+
+-- deferred_indexes: secondary indexes dropped for a bulk load, recreated once it finishes
+CREATE TABLE deferred_indexes (
+    name TEXT PRIMARY KEY,
+    table_name TEXT NOT NULL,
+    sql TEXT NOT NULL
+);
@@ -0,0 +1,6 @@
+-- sync_state: per-account high-water mark of synced transactions
+CREATE TABLE sync_state (
+    account_id TEXT PRIMARY KEY,
+    high_water_mark TEXT NOT NULL,
+    synced_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,79 @@
+-- budget_rollups: transaction totals per (month, category, account), kept current by triggers
+CREATE TABLE budget_rollups (
+    month TEXT NOT NULL,
+    category TEXT NOT NULL,
+    account_id TEXT NOT NULL,
+    amount INTEGER NOT NULL DEFAULT 0,
+    spending INTEGER NOT NULL DEFAULT 0,
+    transactions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (month, category, account_id)
+) WITHOUT ROWID;
+
+INSERT INTO budget_rollups (month, category, account_id, amount, spending, transactions)
+SELECT
+    substr(created_at, 1, 7),
+    category,
+    account_id,
+    sum(amount),
+    sum(CASE WHEN include_in_spending THEN amount ELSE 0 END),
+    count(*)
+FROM transactions
+GROUP BY 1, 2, 3;
+
+CREATE TRIGGER transactions_rollup_insert AFTER INSERT ON transactions
+BEGIN
+    INSERT INTO budget_rollups (month, category, account_id, amount, spending, transactions)
+    VALUES (
+        substr(new.created_at, 1, 7),
+        new.category,
+        new.account_id,
+        new.amount,
+        CASE WHEN new.include_in_spending THEN new.amount ELSE 0 END,
+        1
+    )
+    ON CONFLICT (month, category, account_id) DO UPDATE SET
+        amount = amount + excluded.amount,
+        spending = spending + excluded.spending,
+        transactions = transactions + 1;
+END;
+
+CREATE TRIGGER transactions_rollup_delete AFTER DELETE ON transactions
+BEGIN
+    UPDATE budget_rollups SET
+        amount = amount - old.amount,
+        spending = spending - CASE WHEN old.include_in_spending THEN old.amount ELSE 0 END,
+        transactions = transactions - 1
+    WHERE month = substr(old.created_at, 1, 7) AND category = old.category AND account_id = old.account_id;
+
+    DELETE FROM budget_rollups
+    WHERE month = substr(old.created_at, 1, 7) AND category = old.category AND account_id = old.account_id
+        AND transactions = 0;
+END;
+
+CREATE TRIGGER transactions_rollup_update
+AFTER UPDATE OF amount, created_at, category, account_id, include_in_spending ON transactions
+BEGIN
+    UPDATE budget_rollups SET
+        amount = amount - old.amount,
+        spending = spending - CASE WHEN old.include_in_spending THEN old.amount ELSE 0 END,
+        transactions = transactions - 1
+    WHERE month = substr(old.created_at, 1, 7) AND category = old.category AND account_id = old.account_id;
+
+    INSERT INTO budget_rollups (month, category, account_id, amount, spending, transactions)
+    VALUES (
+        substr(new.created_at, 1, 7),
+        new.category,
+        new.account_id,
+        new.amount,
+        CASE WHEN new.include_in_spending THEN new.amount ELSE 0 END,
+        1
+    )
+    ON CONFLICT (month, category, account_id) DO UPDATE SET
+        amount = amount + excluded.amount,
+        spending = spending + excluded.spending,
+        transactions = transactions + 1;
+
+    DELETE FROM budget_rollups
+    WHERE month = substr(old.created_at, 1, 7) AND category = old.category AND account_id = old.account_id
+        AND transactions = 0;
+END;
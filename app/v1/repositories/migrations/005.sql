@@ -0,0 +1,33 @@
+-- transactions_search: full-text index over merchant, description and notes, stored in transactions itself
+CREATE VIRTUAL TABLE transactions_search USING fts5(
+    merchant_name,
+    description,
+    notes,
+    content = 'transactions',
+    content_rowid = 'rowid',
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+-- Backfill existing transactions.
+INSERT INTO transactions_search (transactions_search) VALUES ('rebuild');
+
+CREATE TRIGGER transactions_search_insert AFTER INSERT ON transactions
+BEGIN
+    INSERT INTO transactions_search (rowid, merchant_name, description, notes)
+    VALUES (new.rowid, new.merchant_name, new.description, new.notes);
+END;
+
+CREATE TRIGGER transactions_search_delete AFTER DELETE ON transactions
+BEGIN
+    INSERT INTO transactions_search (transactions_search, rowid, merchant_name, description, notes)
+    VALUES ('delete', old.rowid, old.merchant_name, old.description, old.notes);
+END;
+
+CREATE TRIGGER transactions_search_update AFTER UPDATE OF merchant_name, description, notes ON transactions
+BEGIN
+    INSERT INTO transactions_search (transactions_search, rowid, merchant_name, description, notes)
+    VALUES ('delete', old.rowid, old.merchant_name, old.description, old.notes);
+    INSERT INTO transactions_search (rowid, merchant_name, description, notes)
+    VALUES (new.rowid, new.merchant_name, new.description, new.notes);
+END;
@@ -0,0 +1,11 @@
+-- Covering index for paging transactions newest first by (created_at, id)
+CREATE INDEX transactions_created_at_id ON transactions (
+    created_at,
+    id,
+    amount,
+    currency,
+    description,
+    category,
+    merchant_name,
+    settled_at
+);
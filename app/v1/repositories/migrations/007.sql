@@ -0,0 +1,8 @@
+-- change_counters: bumped by every write that changes a table's rows, so readers can cheaply tell whether anything
+-- changed since they last looked (e.g. for ETags)
+CREATE TABLE change_counters (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+INSERT INTO change_counters (name) VALUES ('transactions');
@@ -0,0 +1,11 @@
+-- sessions: login sessions, keyed by a hash of the token in the session cookie. Sessions expire `expires_at` after
+-- they were last seen; expired rows are swept in bulk.
+CREATE TABLE sessions (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    expires_at TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX sessions_expires_at ON sessions (expires_at);
@@ -0,0 +1,11 @@
+-- oauth_tokens: the current OAuth tokens per provider. `version` is bumped by every refresh, so a process only saves
+-- a refreshed token over the one it refreshed; `refresh_claimed_until` lets one process at a time refresh.
+CREATE TABLE oauth_tokens (
+    name TEXT PRIMARY KEY,
+    access_token TEXT NOT NULL,
+    refresh_token TEXT NOT NULL,
+    expires_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    refresh_claimed_until TEXT,
+    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+) WITHOUT ROWID;
@@ -0,0 +1,21 @@
+-- email_outbox: transactional emails queued by request handlers and sent in batches by a background dispatcher.
+-- `idempotency_key` dedupes queueing and is passed on to Resend, so a retried send is never delivered twice.
+CREATE TABLE email_outbox (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    sender TEXT NOT NULL,
+    recipients TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    html TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'sent', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL,
+    last_error TEXT,
+    resend_id TEXT,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    sent_at TEXT
+);
+
+-- Only pending emails are ever looked up by time.
+CREATE INDEX email_outbox_pending ON email_outbox (next_attempt_at) WHERE status = 'pending';
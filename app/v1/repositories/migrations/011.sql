@@ -0,0 +1,7 @@
+-- email_outbox: emails are claimed for a while before being sent, so only one dispatcher sends each, and every attempt
+-- at an email goes to Resend in the same batch under the same `batch_key` (its Idempotency-Key), so a batch whose
+-- response was lost is deduplicated by Resend when it's retried rather than delivered again.
+ALTER TABLE email_outbox ADD COLUMN batch_key TEXT;
+ALTER TABLE email_outbox ADD COLUMN claimed_until TEXT;
+
+CREATE INDEX email_outbox_batches ON email_outbox (batch_key) WHERE status = 'pending';
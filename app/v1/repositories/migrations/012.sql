@@ -0,0 +1,5 @@
+-- Incremental auto-vacuum: 001.sql asks for it after switching to WAL, when it only takes effect on an empty database,
+-- so existing databases were left with auto-vacuum off. Changing it needs a `VACUUM`, which rewrites the whole file
+-- and holds the write lock while it runs, so expect this migration to take a while on a large database.
+PRAGMA auto_vacuum = INCREMENTAL;
+VACUUM;
@@ -0,0 +1,14 @@
+-- transactions_created_at_id gains include_in_spending, so the spending chart, which leaves out transactions excluded
+-- from spending as the budget rollups do, is still answered from the index alone.
+DROP INDEX transactions_created_at_id;
+CREATE INDEX transactions_created_at_id ON transactions (
+    created_at,
+    id,
+    amount,
+    currency,
+    description,
+    category,
+    merchant_name,
+    settled_at,
+    include_in_spending
+);
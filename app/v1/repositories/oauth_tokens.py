@@ -0,0 +1,111 @@
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.v1.repositories.transactions import format_timestamp
+
+__all__ = ["OAuthToken", "OAuthTokenRepository"]
+
+
+@dataclass(frozen=True)
+class OAuthToken:
+    """An access token, the refresh token to replace it with, and the version of the row they were read from"""
+
+    access_token: str
+    refresh_token: str
+    expires_at: datetime
+    version: int = 0
+
+
+class OAuthTokenRepository:
+    """
+    OAuth tokens shared by every process.
+
+    Refreshes are coordinated through the row: a process `claim`s the refresh of the version it read, and `replace`
+    only saves over that version, so a refresh token is only ever used once.
+
+    Tokens are stored in plaintext, so whoever can read the database file (or a backup of it) can use them.
+    """
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def get(self, name: str) -> OAuthToken | None:
+        def get(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
+                "SELECT access_token, refresh_token, expires_at, version FROM oauth_tokens WHERE name = ?", (name,)
+            ).fetchone()
+
+        row = await self.database.read(get)
+        if row is None:
+            return None
+        return OAuthToken(
+            access_token=row["access_token"],
+            refresh_token=row["refresh_token"],
+            expires_at=datetime.fromisoformat(row["expires_at"]),
+            version=row["version"],
+        )
+
+    async def save(self, name: str, token: OAuthToken) -> OAuthToken:
+        """Store tokens obtained by authorizing, replacing any there were."""
+
+        def save(conn: sqlite3.Connection) -> int:
+            return conn.execute(
+                """
+                INSERT INTO oauth_tokens (name, access_token, refresh_token, expires_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    access_token = excluded.access_token,
+                    refresh_token = excluded.refresh_token,
+                    expires_at = excluded.expires_at,
+                    version = version + 1,
+                    refresh_claimed_until = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                RETURNING version
+                """,
+                (name, token.access_token, token.refresh_token, format_timestamp(token.expires_at)),
+            ).fetchone()[0]
+
+        version = await self.database.write(save)
+        return OAuthToken(token.access_token, token.refresh_token, token.expires_at, version)
+
+    async def claim(self, name: str, version: int, now: datetime, until: datetime) -> bool:
+        """
+        Claim the refresh of `version` until `until`. Fails if the tokens have already been replaced, or another
+        process holds an unexpired claim.
+        """
+
+        def claim(conn: sqlite3.Connection) -> int:
+            return conn.execute(
+                """
+                UPDATE oauth_tokens SET refresh_claimed_until = ?
+                WHERE name = ? AND version = ? AND (refresh_claimed_until IS NULL OR refresh_claimed_until <= ?)
+                """,
+                (format_timestamp(until), name, version, format_timestamp(now)),
+            ).rowcount
+
+        return await self.database.write(claim) > 0
+
+    async def replace(self, name: str, version: int, token: OAuthToken) -> OAuthToken | None:
+        """Atomically replace `version` with refreshed tokens. Returns `None` if it has already been replaced."""
+
+        def replace(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
+                """
+                UPDATE oauth_tokens SET
+                    access_token = ?,
+                    refresh_token = ?,
+                    expires_at = ?,
+                    version = version + 1,
+                    refresh_claimed_until = NULL,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE name = ? AND version = ?
+                RETURNING version
+                """,
+                (token.access_token, token.refresh_token, format_timestamp(token.expires_at), name, version),
+            ).fetchone()
+
+        row = await self.database.write(replace)
+        if row is None:
+            return None
+        return OAuthToken(token.access_token, token.refresh_token, token.expires_at, row[0])
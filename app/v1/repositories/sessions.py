@@ -0,0 +1,110 @@
+import hashlib
+import json
+import secrets
+import sqlite3
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.v1.repositories.transactions import format_timestamp
+
+__all__ = ["Session", "SessionRepository"]
+
+
+@dataclass
+class Session:
+    """A login session, identified by the token in its cookie"""
+
+    id: str
+    data: dict[str, Any]
+    created_at: datetime
+    last_seen_at: datetime
+    expires_at: datetime
+
+
+def _key(session_id: str) -> str:
+    # Only a hash of the token is stored, so a copy of the database can't be used to hijack sessions.
+    return hashlib.sha256(session_id.encode()).hexdigest()
+
+
+class SessionRepository:
+    """Sessions stored in SQLite. Reads never return expired sessions."""
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def create(self, data: Mapping[str, Any], now: datetime, ttl: timedelta) -> Session:
+        """Start a session with a new random token."""
+        session = Session(secrets.token_urlsafe(32), dict(data), now, now, now + ttl)
+
+        def create(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                "INSERT INTO sessions (id, data, created_at, last_seen_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    _key(session.id),
+                    json.dumps(session.data),
+                    format_timestamp(now),
+                    format_timestamp(now),
+                    format_timestamp(session.expires_at),
+                ),
+            )
+
+        await self.database.write(create)
+        return session
+
+    async def get(self, session_id: str, now: datetime) -> Session | None:
+        def get(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
+                "SELECT data, created_at, last_seen_at, expires_at FROM sessions WHERE id = ? AND expires_at > ?",
+                (_key(session_id), format_timestamp(now)),
+            ).fetchone()
+
+        row = await self.database.read(get)
+        if row is None:
+            return None
+        return Session(
+            id=session_id,
+            data=json.loads(row["data"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            last_seen_at=datetime.fromisoformat(row["last_seen_at"]),
+            expires_at=datetime.fromisoformat(row["expires_at"]),
+        )
+
+    async def touch(self, seen: Mapping[str, datetime], ttl: timedelta) -> int:
+        """
+        Record when each session was last seen, extending it to `ttl` from then, in one write. Sessions already seen
+        more recently are left alone. Returns how many sessions were updated.
+        """
+        parameters = [
+            (format_timestamp(at), format_timestamp(at + ttl), _key(session_id), format_timestamp(at))
+            for session_id, at in seen.items()
+        ]
+
+        def touch(conn: sqlite3.Connection) -> int:
+            return conn.executemany(
+                "UPDATE sessions SET last_seen_at = ?, expires_at = ? WHERE id = ? AND last_seen_at < ?", parameters
+            ).rowcount
+
+        return await self.database.write(touch) if parameters else 0
+
+    async def delete(self, session_id: str) -> None:
+        await self.database.write(lambda conn: conn.execute("DELETE FROM sessions WHERE id = ?", (_key(session_id),)))
+
+    async def delete_expired(self, now: datetime, batch_size: int = 1000) -> int:
+        """
+        Delete every session expired by `now`, `batch_size` at a time so the writer isn't held up behind one large
+        delete. Returns how many were deleted.
+        """
+
+        def delete(conn: sqlite3.Connection) -> int:
+            return conn.execute(
+                "DELETE FROM sessions WHERE id IN (SELECT id FROM sessions WHERE expires_at <= ? LIMIT ?)",
+                (format_timestamp(now), batch_size),
+            ).rowcount
+
+        deleted = 0
+        while (batch := await self.database.write(delete)) > 0:
+            deleted += batch
+        return deleted
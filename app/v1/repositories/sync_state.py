@@ -0,0 +1,55 @@
+import sqlite3
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.v1.repositories.transactions import format_timestamp
+
+__all__ = ["SyncState", "SyncStateRepository"]
+
+
+@dataclass
+class SyncState:
+    """How far an account's transactions have been synced"""
+
+    account_id: str
+    high_water_mark: datetime
+    synced_at: datetime
+
+
+class SyncStateRepository:
+    """Per-account sync checkpoints. A high-water mark only ever moves forward."""
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def get(self, account_id: str) -> SyncState | None:
+        def get(conn: sqlite3.Connection) -> sqlite3.Row | None:
+            return conn.execute(
+                "SELECT account_id, high_water_mark, synced_at FROM sync_state WHERE account_id = ?", (account_id,)
+            ).fetchone()
+
+        row = await self.database.read(get)
+        if row is None:
+            return None
+        return SyncState(
+            account_id=row["account_id"],
+            high_water_mark=datetime.fromisoformat(row["high_water_mark"]),
+            synced_at=datetime.fromisoformat(row["synced_at"]).replace(tzinfo=UTC),
+        )
+
+    async def advance(self, account_id: str, high_water_mark: datetime) -> None:
+        """Record that `account_id` has been synced up to the transaction created at `high_water_mark`."""
+
+        def advance(conn: sqlite3.Connection) -> None:
+            conn.execute(
+                """
+                INSERT INTO sync_state (account_id, high_water_mark) VALUES (?, ?)
+                ON CONFLICT (account_id) DO UPDATE SET
+                    high_water_mark = max(high_water_mark, excluded.high_water_mark),
+                    synced_at = CURRENT_TIMESTAMP
+                """,
+                (account_id, format_timestamp(high_water_mark)),
+            )
+
+        await self.database.write(advance)
@@ -0,0 +1,360 @@
+import asyncio
+import base64
+import binascii
+import json
+import re
+import sqlite3
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+import logfire
+
+from app.config.async_database import AsyncDatabase, get_async_database
+from app.config.response_cache import response_cache
+from app.v1.gateways.monzo import MonzoTransaction
+from app.v1.repositories.budget import rebuild_rollups
+from app.v1.repositories.change_counters import bump
+
+__all__ = [
+    "HIGHLIGHT_END",
+    "HIGHLIGHT_START",
+    "InvalidCursorError",
+    "SearchPage",
+    "SearchResult",
+    "TransactionPage",
+    "TransactionRepository",
+    "TransactionRow",
+    "format_timestamp",
+]
+
+# Wrap matched terms in search results. Control characters can't clash with the text, and survive HTML escaping.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_SEARCH_TOKEN = re.compile(r"\w+")
+
+_COLUMNS = (
+    "id",
+    "account_id",
+    "amount",
+    "currency",
+    "created_at",
+    "settled_at",
+    "description",
+    "category",
+    "notes",
+    "merchant_id",
+    "merchant_name",
+    "include_in_spending",
+)
+_UPDATED = _COLUMNS[1:]
+
+# Unchanged rows are left alone, so re-ingesting a page doesn't rewrite it.
+_UPSERT = f"""
+INSERT INTO transactions ({", ".join(_COLUMNS)})
+VALUES ({", ".join("?" for _ in _COLUMNS)})
+ON CONFLICT (id) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in _UPDATED)},
+    updated_at = CURRENT_TIMESTAMP
+WHERE ({", ".join(_UPDATED)}) IS NOT ({", ".join(f"excluded.{column}" for column in _UPDATED)})
+"""
+
+
+def format_timestamp(value: datetime | None) -> str | None:
+    """Fixed-width UTC timestamps, so they sort as text. Naive datetimes are taken to be UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _row(transaction: MonzoTransaction) -> tuple[Any, ...]:
+    merchant = transaction.merchant
+    return (
+        transaction.id,
+        transaction.account_id,
+        transaction.amount,
+        transaction.currency,
+        format_timestamp(transaction.created),
+        format_timestamp(transaction.settled),
+        transaction.description,
+        transaction.category,
+        transaction.notes,
+        merchant.id if merchant else None,
+        merchant.name if merchant else None,
+        transaction.include_in_spending,
+    )
+
+
+@dataclass
+class SearchResult:
+    """A transaction matching a search. Text fields have matches wrapped in `HIGHLIGHT_START`/`HIGHLIGHT_END`."""
+
+    id: str
+    amount: int
+    currency: str
+    created_at: str
+    category: str
+    merchant: str | None
+    description: str
+    notes: str
+
+
+@dataclass
+class SearchPage:
+    """The best matches for a search, and whether there were more"""
+
+    results: list[SearchResult]
+    has_more: bool
+
+
+@dataclass
+class TransactionRow:
+    """A transaction as listed on the transactions page"""
+
+    id: str
+    created_at: str
+    amount: int
+    currency: str
+    description: str
+    category: str
+    merchant_name: str | None
+    settled_at: str | None
+
+
+@dataclass
+class TransactionPage:
+    """A slice of transactions, newest first, and the cursor for the next slice (`None` on the last one)"""
+
+    rows: list[TransactionRow]
+    next_cursor: str | None
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a page cursor wasn't produced by `TransactionRepository.page`."""
+
+
+def _encode_cursor(row: TransactionRow) -> str:
+    return base64.urlsafe_b64encode(json.dumps([row.created_at, row.id]).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        created_at, id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(created_at, str) or not isinstance(id, str):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return created_at, id
+
+
+def _page(conn: sqlite3.Connection, after: tuple[str, str] | None, limit: int) -> list[sqlite3.Row]:
+    # Seeks straight to the cursor in transactions_created_at_id, so every page costs the same.
+    return conn.execute(
+        f"""
+        SELECT id, created_at, amount, currency, description, category, merchant_name, settled_at
+        FROM transactions
+        {"WHERE (created_at, id) < (?, ?)" if after is not None else ""}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+        """,
+        (*(after or ()), limit),
+    ).fetchall()
+
+
+def _match_expression(query: str) -> str | None:
+    """
+    Turn free text into an FTS5 query matching every word as a prefix.
+
+    Words are quoted, so FTS5 syntax in the input is matched literally. Single characters only match whole words, as
+    a one-letter prefix would expand to most of the index.
+    """
+    tokens = _SEARCH_TOKEN.findall(query)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' if len(token) > 1 else f'"{token}"' for token in tokens)
+
+
+def _search(conn: sqlite3.Connection, expression: str, limit: int) -> list[sqlite3.Row]:
+    return conn.execute(
+        """
+        SELECT
+            t.id,
+            t.amount,
+            t.currency,
+            t.created_at,
+            t.category,
+            highlight(transactions_search, 0, :start, :end) AS merchant,
+            highlight(transactions_search, 1, :start, :end) AS description,
+            snippet(transactions_search, 2, :start, :end, '…', 12) AS notes
+        FROM transactions_search
+        JOIN transactions AS t ON t.rowid = transactions_search.rowid
+        WHERE transactions_search MATCH :expression
+        ORDER BY bm25(transactions_search, 10.0, 4.0, 1.0), t.created_at DESC
+        LIMIT :limit
+        """,
+        {"start": HIGHLIGHT_START, "end": HIGHLIGHT_END, "expression": expression, "limit": limit},
+    ).fetchall()
+
+
+def _upsert(conn: sqlite3.Connection, rows: list[tuple[Any, ...]]) -> int:
+    changed = conn.executemany(_UPSERT, rows).rowcount
+    if changed:
+        bump(conn, "transactions")
+    return changed
+
+
+def _is_empty(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM transactions LIMIT 1").fetchone() is None
+
+
+def _defer_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Drop the secondary indexes, and the triggers maintaining rollups and the search index, for a bulk load.
+
+    They're recorded in the same transaction, so they're restored even if the load is interrupted.
+    """
+    deferred = conn.execute(
+        """
+        SELECT type, name, tbl_name, sql FROM sqlite_master
+        WHERE type IN ('index', 'trigger') AND tbl_name = 'transactions' AND sql IS NOT NULL
+        """
+    ).fetchall()
+    conn.executemany(
+        "INSERT OR REPLACE INTO deferred_indexes (name, table_name, sql) VALUES (?, ?, ?)",
+        [(row["name"], row["tbl_name"], row["sql"]) for row in deferred],
+    )
+    for row in deferred:
+        conn.execute(f'DROP {row["type"].upper()} "{row["name"]}"')
+
+
+def _restore_indexes(conn: sqlite3.Connection) -> None:
+    """Recreate whatever `_defer_indexes` dropped, recomputing the derived tables if their triggers were dropped."""
+    rebuild = False
+    for row in conn.execute("SELECT name, sql FROM deferred_indexes").fetchall():
+        exists = conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (row["name"],))
+        if exists.fetchone() is None:
+            conn.execute(row["sql"])
+        rebuild = rebuild or row["sql"].upper().startswith("CREATE TRIGGER")
+    conn.execute("DELETE FROM deferred_indexes")
+
+    if rebuild:
+        rebuild_rollups(conn)
+        conn.execute("INSERT INTO transactions_search (transactions_search) VALUES ('rebuild')")
+
+
+class TransactionRepository:
+    """
+    Transactions, keyed by their Monzo ID.
+
+    Writes are idempotent upserts, sent in batches through the async database's writer thread.
+    """
+
+    def __init__(self, database: AsyncDatabase | None = None) -> None:
+        self.database = database or get_async_database()
+
+    async def upsert(self, transactions: Iterable[MonzoTransaction]) -> int:
+        """Insert or update transactions in one write, returning how many rows changed."""
+        changed = await self.database.write(partial(_upsert, rows=[_row(transaction) for transaction in transactions]))
+        if changed:
+            response_cache.invalidate("transactions")
+        return changed
+
+    async def ingest(
+        self,
+        transactions: AsyncIterable[MonzoTransaction],
+        batch_size: int = 5000,
+        defer_indexes: bool | None = None,
+    ) -> int:
+        """
+        Upsert a stream of transactions, returning how many rows changed.
+
+        Batches are written while the next one is gathered. With `defer_indexes` (by default, when the table is empty)
+        secondary indexes, rollups and the search index are rebuilt in one pass at the end, rather than maintained per
+        row.
+        """
+        if defer_indexes is None:
+            defer_indexes = await self.database.read(_is_empty)
+
+        with logfire.span("Ingest transactions", defer_indexes=defer_indexes) as span:
+            await self.database.write(_defer_indexes if defer_indexes else _restore_indexes)
+
+            changed = 0
+            pending: asyncio.Future[int] | None = None
+            try:
+                batch: list[tuple[Any, ...]] = []
+                async for transaction in transactions:
+                    batch.append(_row(transaction))
+                    if len(batch) >= batch_size:
+                        if pending is not None:
+                            changed += await pending
+                        pending = asyncio.ensure_future(self.database.write(partial(_upsert, rows=batch)))
+                        batch = []
+                if pending is not None:
+                    changed += await pending
+                    pending = None
+                if batch:
+                    changed += await self.database.write(partial(_upsert, rows=batch))
+            finally:
+                if pending is not None:
+                    await asyncio.gather(pending, return_exceptions=True)
+                if defer_indexes:
+                    await self.database.write(_restore_indexes)
+
+            span.set_attribute("changed", changed)
+        if changed:
+            response_cache.invalidate("transactions")
+        return changed
+
+    async def count(self) -> int:
+        return await self.database.read(lambda conn: conn.execute("SELECT count(*) FROM transactions").fetchone()[0])
+
+    async def search(self, query: str, limit: int = 20) -> SearchPage:
+        """Full-text search merchants, descriptions and notes, best matches first."""
+        expression = _match_expression(query)
+        if expression is None:
+            return SearchPage(results=[], has_more=False)
+
+        rows = await self.database.read(partial(_search, expression=expression, limit=limit + 1))
+        results = [
+            SearchResult(
+                id=row["id"],
+                amount=row["amount"],
+                currency=row["currency"],
+                created_at=row["created_at"],
+                category=row["category"],
+                merchant=row["merchant"],
+                description=row["description"] or "",
+                notes=row["notes"] or "",
+            )
+            for row in rows[:limit]
+        ]
+        return SearchPage(results=results, has_more=len(rows) > limit)
+
+    async def page(self, cursor: str | None = None, limit: int = 50) -> TransactionPage:
+        """
+        Get the next `limit` transactions, newest first, after `cursor` (from the start without one).
+
+        Raises `InvalidCursorError` for a cursor that wasn't returned by a previous page.
+        """
+        after = _decode_cursor(cursor) if cursor is not None else None
+        rows = await self.database.read(partial(_page, after=after, limit=limit + 1))
+        page = [
+            TransactionRow(
+                id=row["id"],
+                created_at=row["created_at"],
+                amount=row["amount"],
+                currency=row["currency"],
+                description=row["description"],
+                category=row["category"],
+                merchant_name=row["merchant_name"],
+                settled_at=row["settled_at"],
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor = _encode_cursor(page[-1]) if len(rows) > limit else None
+        return TransactionPage(rows=page, next_cursor=next_cursor)
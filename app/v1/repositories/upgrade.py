@@ -1,8 +1,43 @@
+import fcntl
+import hashlib
+import importlib.util
+import re
 import sqlite3
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 
+import logfire
+
 from app.config.database import get_db_connection
+from app.config.settings import settings
+
+__all__ = ["DataMigration", "MigrationError", "run_data_migrations", "upgrade"]
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+class MigrationError(Exception):
+    """Raised when a migration can't be applied or doesn't match what was applied before."""
+
+
+@dataclass(frozen=True)
+class DataMigration:
+    """
+    A resumable backfill, declared as `migration = DataMigration(...)` in `migrations/<version>.py`.
+
+    `step` is called with a connection, the last checkpoint (`None` on the first call) and the batch size. It should
+    process at most `batch_size` rows after the checkpoint and return the new checkpoint, or `None` once done. Each
+    step runs in its own transaction and its checkpoint is stored with it, so an interrupted backfill resumes where it
+    left off and never holds the write lock for long.
+    """
+
+    name: str
+    step: Callable[[sqlite3.Connection, str | None, int], str | None]
+    batch_size: int = 1000
 
 
 def _get_migration_files() -> list[tuple[int, Path]]:
@@ -11,7 +46,7 @@ def _get_migration_files() -> list[tuple[int, Path]]:
     migration_files: list[tuple[int, Path]] = []
 
     for file in migrations_dir.glob("*.sql"):
-        if not file.stem.startswith("00"):
+        if not file.stem.isdigit():
             continue
         version = int(file.stem)
         migration_files.append((version, file))
@@ -19,6 +54,23 @@ def _get_migration_files() -> list[tuple[int, Path]]:
     return sorted(migration_files, key=lambda x: x[0])
 
 
+def _get_data_migrations() -> list[tuple[int, DataMigration]]:
+    """Get all data migrations sorted by version number."""
+    migrations_dir = Path(__file__).parent / "migrations"
+    data_migrations: list[tuple[int, DataMigration]] = []
+
+    for file in migrations_dir.glob("*.py"):
+        if not file.stem.isdigit():
+            continue
+        spec = importlib.util.spec_from_file_location(f"app.v1.repositories.migrations.m{file.stem}", file)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        data_migrations.append((int(file.stem), module.migration))
+
+    return sorted(data_migrations, key=lambda x: x[0])
+
+
 def _get_current_version(cursor: sqlite3.Cursor) -> int:
     """Get the current schema version from the database."""
     try:
@@ -29,32 +81,141 @@ def _get_current_version(cursor: sqlite3.Cursor) -> int:
         return 0
 
 
+def _checksum(sql: str) -> str:
+    return hashlib.sha256(sql.encode()).hexdigest()
+
+
+def _split_statements(sql: str) -> list[str]:
+    """
+    Split a SQL script into statements.
+
+    A `;` only ends a statement if SQLite agrees the statement is complete, so semicolons inside string literals,
+    comments and trigger bodies are left alone.
+    """
+    statements: list[str] = []
+    start = 0
+    position = sql.find(";")
+    while position != -1:
+        candidate = sql[start : position + 1]
+        if sqlite3.complete_statement(candidate):
+            if _COMMENTS.sub("", candidate).strip(" \t\r\n;"):
+                statements.append(candidate.strip())
+            start = position + 1
+        position = sql.find(";", position + 1)
+
+    if _COMMENTS.sub("", sql[start:]).strip():
+        statements.append(sql[start:].strip())
+    return statements
+
+
+def _runs_outside_transaction(statement: str) -> bool:
+    return _COMMENTS.sub("", statement).lstrip().upper().startswith(("PRAGMA", "VACUUM"))
+
+
+def _ensure_migrations_table(cursor: sqlite3.Cursor) -> None:
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            checksum TEXT NOT NULL,
+            applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
 def _apply_migration(cursor: sqlite3.Cursor, version: int, file_path: Path) -> None:
-    """Apply a single migration file."""
-    with open(file_path) as f:
-        sql = f.read()
+    """
+    Apply a single migration file in its own transaction.
 
-    # Split the SQL file into individual statements
-    statements = sql.split(";")
+    Leading PRAGMA and VACUUM statements run before the transaction starts, as some (e.g. `journal_mode`) can't be
+    changed inside one and `VACUUM` can't run in one at all.
+    """
+    sql = file_path.read_text()
+    statements = _split_statements(sql)
 
-    # Execute each statement
-    for statement in statements:
-        if statement.strip():
+    while statements and _runs_outside_transaction(statements[0]):
+        cursor.execute(statements.pop(0))
+
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        _ensure_migrations_table(cursor)
+        for statement in statements:
             cursor.execute(statement)
 
-    # Update the schema version
-    cursor.execute("UPDATE schema_version SET version = ? WHERE id = 'singleton'", (version,))
+        # Update the schema version
+        cursor.execute("UPDATE schema_version SET version = ? WHERE id = 'singleton'", (version,))
+        cursor.execute(
+            "INSERT OR REPLACE INTO schema_migrations (version, checksum) VALUES (?, ?)", (version, _checksum(sql))
+        )
+        cursor.execute("COMMIT")
+    except sqlite3.Error as e:
+        if cursor.connection.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise MigrationError(f"Migration {version} ({file_path.name}) failed: {e}") from e
+
+
+def _verify_checksums(cursor: sqlite3.Cursor, migration_files: list[tuple[int, Path]], current_version: int) -> None:
+    """Check applied migrations haven't been edited since. Versions applied before checksums existed are adopted."""
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_migrations'")
+    if cursor.fetchone() is None:
+        if current_version == 0:
+            return
+        _ensure_migrations_table(cursor)
+
+    cursor.execute("SELECT version, checksum FROM schema_migrations")
+    recorded: dict[int, str] = {int(row[0]): row[1] for row in cursor.fetchall()}
+
+    adopted: list[tuple[int, str]] = []
+    for version, file_path in migration_files:
+        if version > current_version:
+            continue
+        checksum = _checksum(file_path.read_text())
+        if version not in recorded:
+            adopted.append((version, checksum))
+        elif recorded[version] != checksum:
+            raise MigrationError(f"Migration {version} ({file_path.name}) has changed since it was applied")
+
+    if adopted:
+        cursor.executemany("INSERT INTO schema_migrations (version, checksum) VALUES (?, ?)", adopted)
+        cursor.connection.commit()
+
+
+@contextmanager
+def _migration_lock(name: str, blocking: bool = True) -> Generator[bool]:
+    """
+    Cross-process lock held next to the database file, so only one worker migrates at a time.
+
+    Yields whether the lock was acquired; without `blocking` that may be `False`.
+    """
+    if settings.sqlite_database in ("", ":memory:"):
+        yield True
+        return
+
+    with open(f"{settings.sqlite_database}.{name}.lock", "a") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 
 def upgrade(on_migration: Callable[[int], None] | None = None) -> None:
     """
     Upgrade the database schema to the latest version by applying any pending migrations.
 
+    Each migration runs in its own transaction. Other processes wait for the migration lock and then find nothing
+    left to do.
+
     Args:
         on_migration: Optional callback function that will be called with the version
             of each migration as it is applied.
     """
-    with get_db_connection() as conn:
+    with _migration_lock("migrate"), get_db_connection() as conn:
         cursor = conn.cursor()
 
         # Get current version
@@ -63,11 +224,92 @@ def upgrade(on_migration: Callable[[int], None] | None = None) -> None:
         # Get all migration files
         migration_files = _get_migration_files()
 
+        # Refuse to continue if applied migrations were edited
+        _verify_checksums(cursor, migration_files, current_version)
+
         # Apply pending migrations
         for version, file_path in migration_files:
             if version > current_version:
-                _apply_migration(cursor, version, file_path)
+                with logfire.span("Apply migration {version}", version=version):
+                    _apply_migration(cursor, version, file_path)
                 if on_migration:
                     on_migration(version)
 
-        conn.commit()
+
+def _ensure_data_migrations_table(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS data_migrations (
+            name TEXT PRIMARY KEY,
+            checkpoint TEXT,
+            rows_done INTEGER NOT NULL DEFAULT 0,
+            completed_at TEXT
+        )
+        """
+    )
+    conn.commit()
+
+
+def _run_data_migration(
+    conn: sqlite3.Connection, migration: DataMigration, stop: threading.Event | None, pause: float
+) -> bool:
+    """Run a data migration to completion, one checkpointed batch per transaction. Returns whether it completed."""
+    row = conn.execute(
+        "SELECT checkpoint, completed_at FROM data_migrations WHERE name = ?", (migration.name,)
+    ).fetchone()
+    if row is not None and row["completed_at"] is not None:
+        return True
+    checkpoint: str | None = row["checkpoint"] if row is not None else None
+
+    with logfire.span("Data migration {name}", name=migration.name, resumed_from=checkpoint):
+        while stop is None or not stop.is_set():
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.total_changes
+                checkpoint = migration.step(conn, checkpoint, migration.batch_size)
+                changes = conn.total_changes - before
+                conn.execute(
+                    """
+                    INSERT INTO data_migrations (name, checkpoint, rows_done, completed_at)
+                    VALUES (?, ?, ?, CASE WHEN ? THEN CURRENT_TIMESTAMP END)
+                    ON CONFLICT (name) DO UPDATE SET
+                        checkpoint = excluded.checkpoint,
+                        rows_done = rows_done + excluded.rows_done,
+                        completed_at = excluded.completed_at
+                    """,
+                    (migration.name, checkpoint, changes, checkpoint is None),
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+            if checkpoint is None:
+                return True
+
+            # Let other writers in between batches.
+            time.sleep(pause)
+
+    return False
+
+
+def run_data_migrations(stop: threading.Event | None = None, pause: float = 0.01) -> None:
+    """
+    Run pending data migrations whose schema version has been applied.
+
+    Only one process runs them at a time; others return straight away. Setting `stop` makes the current data
+    migration return after its in-flight batch, to resume from its checkpoint next time.
+    """
+    with _migration_lock("backfill", blocking=False) as acquired:
+        if not acquired:
+            return
+
+        with get_db_connection() as conn:
+            current_version = _get_current_version(conn.cursor())
+            _ensure_data_migrations_table(conn)
+
+            for version, migration in _get_data_migrations():
+                if version > current_version:
+                    break
+                if not _run_data_migration(conn, migration, stop, pause):
+                    return
@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from app.v1.repositories.charts import ChartRepository
+
+__all__ = ["ChartService", "lttb"]
+
+
+def lttb[V: float](t: Sequence[int], v: Sequence[V], threshold: int) -> tuple[list[int], list[V]]:
+    """
+    Downsample a series to `threshold` points with largest-triangle-three-buckets.
+
+    Keeps the first and last points, and from each bucket in between the point forming the largest triangle with the
+    previously kept point and the average of the next bucket, which preserves the series' visual peaks and troughs.
+    """
+    n = len(t)
+    if threshold >= n:
+        return list(t), list(v)
+    if threshold < 3:
+        return [t[0], t[-1]][:threshold], [v[0], v[-1]][:threshold]
+
+    sampled_t, sampled_v = [t[0]], [v[0]]
+    every = (n - 2) / (threshold - 2)
+    previous = 0
+
+    for i in range(threshold - 2):
+        # Average of the next bucket (the last point, for the final bucket).
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        count = next_end - next_start
+        average_t = sum(t[next_start:next_end]) / count
+        average_v = sum(v[next_start:next_end]) / count
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        previous_t, previous_v = t[previous], v[previous]
+        largest, selected = -1.0, start
+        for j in range(start, end):
+            area = abs((previous_t - average_t) * (v[j] - previous_v) - (previous_t - t[j]) * (average_v - previous_v))
+            if area > largest:
+                largest, selected = area, j
+
+        sampled_t.append(t[selected])
+        sampled_v.append(v[selected])
+        previous = selected
+
+    sampled_t.append(t[-1])
+    sampled_v.append(v[-1])
+    return sampled_t, sampled_v
+
+
+class ChartService:
+    """Chart series, bucketed in SQL and then downsampled to what the chart can actually draw."""
+
+    def __init__(self, charts: ChartRepository | None = None) -> None:
+        self.charts = charts or ChartRepository()
+
+    async def spending(
+        self,
+        bucket: int,
+        width: int,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        category: str | None = None,
+    ) -> tuple[list[int], list[int]]:
+        """Spending per `bucket` seconds, downsampled to at most `width` points."""
+        t, v = await self.charts.spending(bucket, start, end, category)
+        return lttb(t, v, width)
@@ -0,0 +1,127 @@
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+import logfire
+
+from app.config.settings import settings
+from app.v1.gateways.resend import BATCH_SIZE, ResendEmail, ResendError, ResendGateway, get_resend_client
+from app.v1.repositories.email_outbox import EmailOutboxRepository, OutboxEmail
+
+__all__ = ["EmailDispatcher", "email_dispatcher"]
+
+_sent = logfire.metric_counter("email.sent", description="Emails accepted by Resend")
+_failed = logfire.metric_counter("email.failed", description="Failed attempts at sending an email")
+
+
+def _resend_email(email: OutboxEmail) -> ResendEmail:
+    return ResendEmail(
+        sender=email.sender, to=email.to, subject=email.subject, html=email.html or None, text=email.text or None
+    )
+
+
+class EmailDispatcher:
+    """
+    Sends transactional emails through an outbox.
+
+    `send` only queues the email (one insert), so request handlers never wait on Resend. `run` drains the outbox in
+    the background, up to `batch_size` emails per request to Resend's batch endpoint. Each batch is claimed for
+    `claim_for` first, so dispatchers in other workers skip it. Failed batches are retried whole, under the same
+    Idempotency-Key, with exponential backoff (honouring `Retry-After`) up to `max_attempts` times; a batch Resend
+    rejects outright is retried one email at a time, so only the bad emails fail.
+    """
+
+    def __init__(
+        self,
+        gateway: ResendGateway | None = None,
+        repository: EmailOutboxRepository | None = None,
+        batch_size: int = BATCH_SIZE,
+        max_attempts: int = 8,
+        backoff: timedelta = timedelta(seconds=30),
+        max_backoff: timedelta = timedelta(hours=1),
+        claim_for: timedelta = timedelta(minutes=5),
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.claim_for = claim_for
+        self.clock = clock
+        self._gateway = gateway
+        self._repository = repository
+        self._wake = asyncio.Event()
+
+    @property
+    def gateway(self) -> ResendGateway:
+        return self._gateway or ResendGateway(get_resend_client(), settings.resend_api_key)
+
+    @property
+    def repository(self) -> EmailOutboxRepository:
+        # Resolved on use, so the shared dispatcher follows the shared database.
+        return self._repository or EmailOutboxRepository()
+
+    async def send(self, email: OutboxEmail) -> bool:
+        """Queue an email to be sent. Returns whether it was queued, rather than a duplicate."""
+        queued = await self.repository.enqueue(email, self.clock())
+        self._wake.set()
+        return queued
+
+    async def dispatch(self) -> int:
+        """Try to send one batch of due emails. Returns how many were tried."""
+        emails = await self.repository.claim(self.clock(), self.batch_size, self.claim_for)
+        if emails:
+            with logfire.span("Send {count} emails", count=len(emails)):
+                await self._send(emails, emails[0].batch_key or emails[0].idempotency_key)
+        return len(emails)
+
+    async def run(self, stop: asyncio.Event, poll_interval: float) -> None:
+        """Drain the outbox whenever an email is queued, or every `poll_interval` seconds for retries."""
+        stopped = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                self._wake.clear()
+                try:
+                    while await self.dispatch():
+                        pass
+                except Exception:
+                    logfire.exception("Sending emails failed")
+                woken = asyncio.ensure_future(self._wake.wait())
+                await asyncio.wait({stopped, woken}, timeout=poll_interval, return_when=asyncio.FIRST_COMPLETED)
+                woken.cancel()
+        finally:
+            stopped.cancel()
+
+    async def _send(self, emails: list[OutboxEmail], batch_key: str) -> None:
+        try:
+            resend_ids = await self.gateway.send_batch([_resend_email(email) for email in emails], batch_key)
+        except ResendError as e:
+            if not e.retryable and len(emails) > 1:
+                # Nothing in a rejected batch was sent, so each email can go on its own, under its own key from now on.
+                await self.repository.split(email.id for email in emails if email.id)
+                for email in emails:
+                    await self._send([email], email.idempotency_key)
+                return
+            _failed.add(len(emails))
+            logfire.warn("Sending {count} emails failed", count=len(emails), error=str(e), retryable=e.retryable)
+            # The batch is retried (or given up on) as a whole, since its key must only ever cover the same emails.
+            retry_at = self._retry_at(emails, e)
+            await self.repository.mark_failed({email.id: retry_at for email in emails if email.id}, str(e))
+            return
+
+        _sent.add(len(emails))
+        await self.repository.mark_sent(
+            {email.id: resend_id for email, resend_id in zip(emails, resend_ids, strict=True) if email.id}, self.clock()
+        )
+
+    def _retry_at(self, emails: list[OutboxEmail], error: ResendError) -> datetime | None:
+        attempts = max(email.attempts for email in emails)
+        if not error.retryable or attempts + 1 >= self.max_attempts:
+            return None
+        delay = min(self.backoff * 2**attempts, self.max_backoff)
+        if error.retry_after is not None:
+            delay = max(delay, timedelta(seconds=error.retry_after))
+        return self.clock() + delay
+
+
+email_dispatcher = EmailDispatcher(max_attempts=settings.email_max_attempts)
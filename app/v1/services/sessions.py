@@ -0,0 +1,146 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import logfire
+
+from app.config.settings import settings
+from app.v1.repositories.sessions import Session, SessionRepository
+
+__all__ = ["SessionStore", "session_store"]
+
+_hits = logfire.metric_counter("sessions.cache_hits", description="Session lookups answered from memory")
+_misses = logfire.metric_counter("sessions.cache_misses", description="Session lookups that went to the database")
+
+
+@dataclass
+class _Entry:
+    session: Session
+    cached_at: datetime
+
+
+class SessionStore:
+    """
+    Sessions, cached in memory in front of the `sessions` table.
+
+    A session is read from the database at most once every `cache_ttl` (which bounds how long a session deleted by
+    another worker keeps working here), and at most `max_entries` are kept, evicting the least recently used. Each
+    use slides its expiry to `ttl` from then; rather than writing on every request, last-seen times are collected
+    and written in one batch by `flush`. `run` flushes periodically and sweeps expired sessions in the background.
+    """
+
+    def __init__(
+        self,
+        ttl: timedelta,
+        cache_ttl: timedelta,
+        max_entries: int,
+        repository: SessionRepository | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.ttl = ttl
+        self.cache_ttl = cache_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._repository = repository
+        self._cache: OrderedDict[str, _Entry] = OrderedDict()
+        self._seen: dict[str, datetime] = {}
+
+    @property
+    def repository(self) -> SessionRepository:
+        # Resolved on use, so the shared store follows the shared database.
+        return self._repository or SessionRepository()
+
+    async def create(self, data: Mapping[str, Any]) -> Session:
+        session = await self.repository.create(data, self.clock(), self.ttl)
+        self._cache_entry(session)
+        return session
+
+    async def get(self, session_id: str) -> Session | None:
+        """The session `session_id` identifies, or `None` if there isn't one or it has expired."""
+        now = self.clock()
+        entry = self._cache.get(session_id)
+        if entry is not None and now - entry.cached_at < self.cache_ttl:
+            self._cache.move_to_end(session_id)
+            _hits.add(1)
+            session = entry.session
+        else:
+            _misses.add(1)
+            loaded = await self.repository.get(session_id, now)
+            if loaded is None:
+                self._forget(session_id)
+                return None
+            session = self._cache_entry(loaded)
+
+        if session.expires_at <= now:
+            self._forget(session_id)
+            return None
+        session.last_seen_at = now
+        session.expires_at = now + self.ttl
+        self._seen[session_id] = now
+        return session
+
+    async def delete(self, session_id: str) -> None:
+        self._forget(session_id)
+        await self.repository.delete(session_id)
+
+    async def flush(self) -> int:
+        """Write the last-seen times collected since the last flush. Returns how many sessions were updated."""
+        if not self._seen:
+            return 0
+        seen, self._seen = self._seen, {}
+        try:
+            return await self.repository.touch(seen, self.ttl)
+        except BaseException:
+            # Keep them for the next flush, unless the session has been seen again since.
+            self._seen = seen | self._seen
+            raise
+
+    async def sweep(self) -> int:
+        """Delete expired sessions from the database. Returns how many were deleted."""
+        with logfire.span("Sweep expired sessions") as span:
+            deleted = await self.repository.delete_expired(self.clock())
+            span.set_attribute("deleted", deleted)
+        return deleted
+
+    async def run(self, stop: asyncio.Event, flush_interval: float, sweep_interval: float) -> None:
+        """Flush every `flush_interval` and sweep every `sweep_interval` seconds, flushing one last time on `stop`."""
+        swept_at = time.monotonic()
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), flush_interval)
+            except TimeoutError:
+                pass
+            try:
+                await self.flush()
+                if time.monotonic() - swept_at >= sweep_interval:
+                    swept_at = time.monotonic()
+                    await self.sweep()
+            except Exception:
+                logfire.exception("Session maintenance failed")
+
+    def clear(self) -> None:
+        """Forget cached sessions and unflushed last-seen times."""
+        self._cache.clear()
+        self._seen.clear()
+
+    def _cache_entry(self, session: Session) -> Session:
+        self._cache[session.id] = _Entry(session, self.clock())
+        self._cache.move_to_end(session.id)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return session
+
+    def _forget(self, session_id: str) -> None:
+        self._cache.pop(session_id, None)
+        self._seen.pop(session_id, None)
+
+
+session_store = SessionStore(
+    ttl=timedelta(seconds=settings.session_ttl),
+    cache_ttl=timedelta(seconds=settings.session_cache_ttl),
+    max_entries=settings.session_cache_max_entries,
+)
@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import logfire
+
+from app.v1.gateways.monzo import MonzoGateway, MonzoTransaction, get_monzo_client
+from app.v1.repositories.sync_state import SyncStateRepository
+from app.v1.repositories.transactions import TransactionRepository
+from app.v1.services.tokens import monzo_tokens
+
+__all__ = ["SyncService"]
+
+
+class SyncService:
+    """
+    Incremental Monzo sync.
+
+    Each account is fetched from its high-water mark (the newest transaction created so far) less an `overlap`
+    window, so transactions that settle or change after they're first seen are picked up again. The first sync of an
+    account downloads its whole history. By default the gateway authenticates with the shared `monzo_tokens`.
+    """
+
+    def __init__(
+        self,
+        gateway: MonzoGateway | None = None,
+        transactions: TransactionRepository | None = None,
+        sync_state: SyncStateRepository | None = None,
+        overlap: timedelta = timedelta(days=3),
+    ) -> None:
+        self.gateway = gateway or MonzoGateway(get_monzo_client(), monzo_tokens.get_access_token)
+        self.transactions = transactions or TransactionRepository()
+        self.sync_state = sync_state or SyncStateRepository()
+        self.overlap = overlap
+
+    async def sync_account(self, account_id: str) -> int:
+        """Sync one account, returning how many transactions were added or changed."""
+        state = await self.sync_state.get(account_id)
+        since = state.high_water_mark - self.overlap if state is not None else None
+        newest: datetime | None = None
+
+        async def tracked() -> AsyncIterator[MonzoTransaction]:
+            nonlocal newest
+            async for transaction in self.gateway.iter_transactions([account_id], since=since):
+                if newest is None or transaction.created > newest:
+                    newest = transaction.created
+                yield transaction
+
+        with logfire.span("Sync account {account_id}", account_id=account_id, since=since):
+            changed = await self.transactions.ingest(tracked())
+            if newest is not None:
+                await self.sync_state.advance(account_id, newest)
+        return changed
+
+    async def sync(self) -> dict[str, int]:
+        """Sync every open account concurrently, returning the transactions added or changed per account."""
+        account_ids = [account.id for account in await self.gateway.list_accounts() if not account.closed]
+        changed = await asyncio.gather(*(self.sync_account(account_id) for account_id in account_ids))
+        return dict(zip(account_ids, changed, strict=True))
@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+import logfire
+
+from app.v1.gateways.monzo import get_monzo_client, refresh_access_token
+from app.v1.repositories.oauth_tokens import OAuthToken, OAuthTokenRepository
+
+__all__ = ["TokenManager", "TokenUnavailableError", "monzo_tokens"]
+
+_refreshes = logfire.metric_counter("oauth_tokens.refreshes", description="OAuth tokens refreshed by this process")
+
+
+class TokenUnavailableError(Exception):
+    """No tokens have been stored, so there's nothing to refresh"""
+
+
+class TokenManager:
+    """
+    Hands out a valid access token, refreshing it before it expires.
+
+    Tokens are kept in memory, so the common case is answered without awaiting anything. Within `refresh_before` of
+    expiry a refresh starts in the background and the current token keeps being used; only once a token has expired
+    do callers wait. Concurrent refreshes in this process share one task, and across processes the one that claims
+    the refresh in the database makes the call while the others pick its tokens up from there.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        refresh: Callable[[str], Awaitable[OAuthToken]],
+        repository: OAuthTokenRepository | None = None,
+        refresh_before: timedelta = timedelta(minutes=5),
+        claim_for: timedelta = timedelta(seconds=30),
+        poll_interval: float = 0.25,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.name = name
+        self.refresh = refresh
+        self.refresh_before = refresh_before
+        self.claim_for = claim_for
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self._repository = repository
+        self._token: OAuthToken | None = None
+        self._updating: asyncio.Task[OAuthToken] | None = None
+
+    @property
+    def repository(self) -> OAuthTokenRepository:
+        # Resolved on use, so the shared manager follows the shared database.
+        return self._repository or OAuthTokenRepository()
+
+    async def get_access_token(self) -> str:
+        """A valid access token. Raises `TokenUnavailableError` if there are no tokens to refresh."""
+        return (await self.token()).access_token
+
+    async def token(self) -> OAuthToken:
+        token = self._token
+        now = self.clock()
+        if token is None or token.expires_at <= now:
+            # Shielded, so a cancelled caller doesn't cancel the refresh others are waiting on.
+            return await asyncio.shield(self._update())
+        if token.expires_at - now <= self.refresh_before:
+            self._update()
+        return token
+
+    async def run(self, stop: asyncio.Event, retry_interval: float = 60.0) -> None:
+        """Refresh the tokens as they become due, so even an idle process never hands out an expired token."""
+        while not stop.is_set():
+            try:
+                token = await self.token()
+                if token.expires_at - self.clock() <= self.refresh_before:
+                    token = await asyncio.shield(self._update())
+                delay = max((token.expires_at - self.refresh_before - self.clock()).total_seconds(), self.poll_interval)
+            except TokenUnavailableError:
+                delay = retry_interval
+            except Exception:
+                logfire.exception("Refreshing {name} tokens failed", name=self.name)
+                delay = retry_interval
+            try:
+                await asyncio.wait_for(stop.wait(), delay)
+            except TimeoutError:
+                pass
+
+    def _update(self) -> asyncio.Task[OAuthToken]:
+        if self._updating is None:
+            self._updating = asyncio.ensure_future(self._load_or_refresh())
+            self._updating.add_done_callback(self._updated)
+        return self._updating
+
+    def _updated(self, task: asyncio.Task[OAuthToken]) -> None:
+        self._updating = None
+        if not task.cancelled() and task.exception() is not None:
+            logfire.warn("Refreshing {name} tokens failed", name=self.name, error=repr(task.exception()))
+
+    async def _load_or_refresh(self) -> OAuthToken:
+        stored = await self.repository.get(self.name)
+        while True:
+            if stored is None:
+                raise TokenUnavailableError(f"No {self.name} tokens have been stored")
+            now = self.clock()
+            if stored.expires_at - now > self.refresh_before:
+                # Still fresh, or another process has already refreshed it.
+                break
+            if await self.repository.claim(self.name, stored.version, now, now + self.claim_for):
+                with logfire.span("Refresh {name} tokens", name=self.name):
+                    refreshed = await self.refresh(stored.refresh_token)
+                    replaced = await self.repository.replace(self.name, stored.version, refreshed)
+                _refreshes.add(1)
+                if replaced is not None:
+                    stored = replaced
+                    break
+            elif stored.expires_at > now:
+                # Another process is refreshing; this token is good until it's done.
+                break
+            else:
+                await asyncio.sleep(self.poll_interval)
+            stored = await self.repository.get(self.name)
+
+        self._token = stored
+        return stored
+
+
+async def _refresh_monzo(refresh_token: str) -> OAuthToken:
+    issued_at = datetime.now(UTC)
+    token = await refresh_access_token(get_monzo_client(), refresh_token)
+    return OAuthToken(token.access_token, token.refresh_token, issued_at + timedelta(seconds=token.expires_in))
+
+
+monzo_tokens = TokenManager("monzo", _refresh_monzo)
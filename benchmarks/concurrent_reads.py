@@ -0,0 +1,100 @@
+"""Latency of chart reads while a bulk ingest is writing, through the read-only and the read-write pools."""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from unittest.mock import patch
+
+from app.config.async_database import close_async_database, get_async_database
+from app.config.database import close_pool, get_db_connection
+from app.v1.gateways.monzo import MonzoTransaction
+from app.v1.repositories.charts import _spending
+from app.v1.repositories.transactions import TransactionRepository, format_timestamp
+from app.v1.repositories.upgrade import upgrade
+from tests.fakes.monzo import EPOCH, FakeMonzo
+
+ROWS = 100_000
+READERS = 4
+DAY = 24 * 60 * 60
+# A month of daily spending, as the chart shows.
+START = format_timestamp(EPOCH + timedelta(days=60))
+END = format_timestamp(EPOCH + timedelta(days=90))
+
+
+def _transactions(accounts: range) -> list[MonzoTransaction]:
+    fake = FakeMonzo(accounts=4, transactions_per_account=ROWS // 4)
+    return [
+        MonzoTransaction.model_validate(fake.transaction(fake.account_ids[i], n))
+        for i in accounts
+        for n in range(fake.transactions_per_account)
+    ]
+
+
+async def _stream(transactions: list[MonzoTransaction]) -> AsyncIterator[MonzoTransaction]:
+    for transaction in transactions:
+        yield transaction
+
+
+def _read(read_only: bool) -> float:
+    start = time.perf_counter()
+    with get_db_connection(read_only=read_only) as conn:
+        _spending(conn, bucket=DAY, start=START, end=END, category=None)
+    return (time.perf_counter() - start) * 1000
+
+
+async def _reads(read_only: bool, until: asyncio.Future[int] | None = None, count: int = 200) -> list[float]:
+    """Read with `READERS` concurrent readers, `count` reads each or until `until` is done."""
+    durations: list[float] = []
+
+    async def reader() -> None:
+        reads = 0
+        while (until is None and reads < count) or (until is not None and not until.done()):
+            durations.append(await asyncio.to_thread(_read, read_only))
+            reads += 1
+
+    await asyncio.gather(*(reader() for _ in range(READERS)))
+    return durations
+
+
+async def _during_ingest(transactions: list[MonzoTransaction], read_only: bool) -> tuple[list[float], float]:
+    repository = TransactionRepository(get_async_database())
+    start = time.perf_counter()
+    # Maintained indexes, as in a sync into a populated database, rather than rebuilt at the end.
+    ingest = asyncio.ensure_future(repository.ingest(_stream(transactions), batch_size=1000, defer_indexes=False))
+    durations = await _reads(read_only, until=ingest)
+    await ingest
+    return durations, len(transactions) / (time.perf_counter() - start)
+
+
+def _summary(label: str, durations: list[float], rate: float | None = None) -> None:
+    p95 = statistics.quantiles(durations, n=20)[-1]
+    rows = f"{rate:>9.0f}" if rate is not None else f"{'-':>9}"
+    print(
+        f"{label:>24} {len(durations):>6} {statistics.median(durations):>8.2f} {p95:>8.2f} {max(durations):>8.2f} {rows}"
+    )
+
+
+def main() -> None:
+    loaded = _transactions(range(2))
+    print(f"{'reads':>24} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'rows/s':>9}")
+    for read_only in (True, False):
+        pool = "read-only" if read_only else "read-write"
+        with tempfile.TemporaryDirectory() as directory:
+            with patch("app.config.settings.settings.sqlite_database", os.path.join(directory, f"{pool}.db")):
+                upgrade()
+                asyncio.run(TransactionRepository(get_async_database()).ingest(_stream(loaded)))
+
+                _summary(f"{pool}, idle", asyncio.run(_reads(read_only)))
+                durations, rate = asyncio.run(_during_ingest(_transactions(range(2, 4)), read_only))
+                _summary(f"{pool}, during ingest", durations, rate)
+
+                close_async_database()
+                close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Per-KB cost of the streaming HTML post-processor against the BeautifulSoup (pretty) path."""
+
+import time
+from collections.abc import Callable
+
+from bs4 import BeautifulSoup, Comment
+
+from app.v1.controllers.middleware.html_processor import StreamingHTMLProcessor
+
+CHUNK_SIZE = 4096
+
+
+def _page(rows: int) -> bytes:
+    """Render a budget-like page with `rows` table rows."""
+    body = "\n".join(
+        f"""
+        <!-- row {i} -->
+        <tr class="border-b hover:bg-gray-50">
+            <td class="px-2 py-1 font-mono">2025-0{i % 9 + 1}-1{i % 10}</td>
+            <td class="px-2 py-1">Merchant {i}</td>
+            <td class="px-2 py-1 text-right">£{i * 3.17:.2f}</td>
+        </tr>"""
+        for i in range(rows)
+    )
+    return f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <title>Budget</title>
+        <script>document.addEventListener("htmx:load", () => {{ /* noop */ }});</script>
+    </head>
+    <body class="bg-gray-100">
+        <!-- Navigation Bar -->
+        <main class="pt-2">
+            <table>{body}</table>
+        </main>
+    </body>
+    </html>
+    """.encode()
+
+
+def _bs4(body: bytes) -> bytes:
+    soup = BeautifulSoup(body.decode(), "html.parser")
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+    return str(soup.prettify()).encode()
+
+
+def _streaming(body: bytes) -> bytes:
+    processor = StreamingHTMLProcessor()
+    output = [processor.feed(body[i : i + CHUNK_SIZE]) for i in range(0, len(body), CHUNK_SIZE)]
+    output.append(processor.close())
+    return b"".join(output)
+
+
+def _per_kb(function: Callable[[bytes], bytes], body: bytes, min_seconds: float = 0.5) -> float:
+    """Return the mean microseconds spent per KB of input."""
+    iterations = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < min_seconds:
+        function(body)
+        iterations += 1
+    return elapsed / iterations / (len(body) / 1024) * 1_000_000
+
+
+def main() -> None:
+    print(f"{'size':>10} {'bs4 µs/KB':>12} {'stream µs/KB':>14} {'speedup':>9}")
+    for rows in (10, 100, 1_000, 10_000):
+        body = _page(rows)
+        bs4 = _per_kb(_bs4, body)
+        streaming = _per_kb(_streaming, body)
+        print(f"{len(body) // 1024:>8}KB {bs4:>12.1f} {streaming:>14.1f} {bs4 / streaming:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Throughput and peak memory of streaming 100k transactions from a fake Monzo API served over real HTTP."""
+
+import asyncio
+import socket
+import threading
+import time
+import tracemalloc
+
+import httpx
+import uvicorn
+
+from app.v1.gateways.monzo import MonzoGateway
+from tests.fakes.monzo import FakeMonzo
+
+ACCOUNTS = 4
+TRANSACTIONS_PER_ACCOUNT = 25_000
+
+
+def _serve(fake: FakeMonzo) -> tuple[uvicorn.Server, str]:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(fake.app, log_level="warning"))
+    threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    host, port = sock.getsockname()
+    return server, f"http://{host}:{port}"
+
+
+async def _token() -> str:
+    return "test-token"
+
+
+async def _fetch(base_url: str, concurrency: int) -> tuple[int, float, float]:
+    """Return transactions fetched, transactions per second and peak traced memory (MiB)."""
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        gateway = MonzoGateway(client, _token)
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = 0
+        async for _ in gateway.iter_transactions(concurrency=concurrency):
+            count += 1
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return count, count / elapsed, peak / 1024 / 1024
+
+
+async def _sequential(base_url: str) -> tuple[int, float, float]:
+    """The naive approach: one account after another, collecting everything into a list."""
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        gateway = MonzoGateway(client, _token)
+        tracemalloc.start()
+        start = time.perf_counter()
+        transactions = []
+        for account in await gateway.list_accounts():
+            async for page in gateway.iter_transaction_pages(account.id):
+                transactions.extend(page)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return len(transactions), len(transactions) / elapsed, peak / 1024 / 1024
+
+
+def main() -> None:
+    fake = FakeMonzo(accounts=ACCOUNTS, transactions_per_account=TRANSACTIONS_PER_ACCOUNT)
+    server, base_url = _serve(fake)
+    try:
+        print(f"{'mode':>22} {'txns':>8} {'txn/s':>8} {'peak MiB':>9}")
+        runs = (
+            ("sequential, buffered", _sequential(base_url)),
+            ("concurrent, streamed", _fetch(base_url, concurrency=4)),
+        )
+        for name, run in runs:
+            count, rate, peak = asyncio.run(run)
+            print(f"{name:>22} {count:>8} {rate:>8.0f} {peak:>9.1f}")
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Latency and peak per-request memory of the pure ASGI pipeline against BaseHTTPMiddleware + GZipMiddleware."""
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.v1.controllers.middleware.body_cache import BodyCache
+from app.v1.controllers.middleware.html_processor import minify_html
+from app.v1.controllers.middleware.response_pipeline import ResponsePipelineMiddleware
+from app.v1.controllers.middleware.response_stages import GZipStage, HTMLStage
+
+CONCURRENCY = 50
+REQUESTS = 2_000
+
+PAGE = (
+    "<!DOCTYPE html><html><body>\n"
+    + "\n".join(f"    <!-- row {i} -->\n    <tr><td>Merchant {i}</td><td>£{i * 3.17:.2f}</td></tr>" for i in range(500))
+    + "\n</body></html>"
+)
+
+
+class _BufferingHTMLMiddleware(BaseHTTPMiddleware):
+    """The previous approach: buffer the body through BaseHTTPMiddleware and rewrite it."""
+
+    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore
+        body, _ = minify_html(body)
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+        return Response(body, status_code=response.status_code, headers=headers)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/", response_class=HTMLResponse)
+    async def index() -> str:  # type: ignore
+        return PAGE
+
+    return app
+
+
+def _base_http_app() -> FastAPI:
+    app = _app()
+    app.add_middleware(_BufferingHTMLMiddleware)
+    app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+    return app
+
+
+def _pipeline_app() -> FastAPI:
+    app = _app()
+    app.add_middleware(ResponsePipelineMiddleware, stages=[HTMLStage(), GZipStage(minimum_size=1000, compresslevel=5)])
+    return app
+
+
+def _cached_pipeline_app() -> FastAPI:
+    app = _app()
+    cache = BodyCache(max_entries=256, max_bytes=32 * 1024 * 1024)
+    stages = [HTMLStage(cache=cache), GZipStage(minimum_size=1000, compresslevel=5, cache=cache)]
+    app.add_middleware(ResponsePipelineMiddleware, stages=stages)
+    return app
+
+
+async def _measure(app: FastAPI) -> tuple[list[float], float, float]:
+    """Return per-request latencies (ms) and throughput under concurrent load, and peak KB traced per request."""
+    transport = httpx.ASGITransport(app=app)
+    headers = {"accept-encoding": "gzip"}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+        latencies: list[float] = []
+
+        async def request(start: float) -> None:
+            # Timed from when the request is issued, before the semaphore, so time spent queued counts too. A request
+            # through the pipeline can complete without yielding, so timing from when its task first runs would
+            # hide the wait for the requests ahead of it.
+            async with semaphore:
+                response = await client.get("/")
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+
+        # Warm up, then measure.
+        await asyncio.gather(*(request(time.perf_counter()) for _ in range(CONCURRENCY)))
+        latencies.clear()
+        start = time.perf_counter()
+        await asyncio.gather(*(request(start) for _ in range(REQUESTS)))
+        throughput = REQUESTS / (time.perf_counter() - start)
+
+        # One request at a time, so each peak is that request's own working set above what was already allocated.
+        peaks: list[int] = []
+        tracemalloc.start()
+        for _ in range(100):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await request(time.perf_counter())
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+        tracemalloc.stop()
+
+    return latencies, throughput, statistics.median(peaks) / 1024
+
+
+def main() -> None:
+    print(f"{'stack':>16} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8} {'peak KB':>8}")
+    stacks = (
+        ("BaseHTTP + GZip", _base_http_app),
+        ("ASGI pipeline", _pipeline_app),
+        ("+ body cache", _cached_pipeline_app),
+    )
+    for name, factory in stacks:
+        latencies, throughput, allocated = asyncio.run(_measure(factory()))
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(f"{name:>16} {quantiles[49]:>8.2f} {quantiles[98]:>8.2f} {throughput:>8.0f} {allocated:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
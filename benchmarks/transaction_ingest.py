@@ -0,0 +1,88 @@
+"""Rows per second upserting Monzo transactions into a migrated database, against a row-at-a-time baseline."""
+
+import asyncio
+import os
+import tempfile
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import patch
+
+from app.config.async_database import close_async_database, get_async_database
+from app.config.database import close_pool, get_db_connection
+from app.v1.gateways.monzo import MonzoTransaction
+from app.v1.repositories.transactions import TransactionRepository, _row, _UPSERT
+from app.v1.repositories.upgrade import upgrade
+from tests.fakes.monzo import FakeMonzo
+
+ROWS = 100_000
+BASELINE_ROWS = 2_000
+
+
+def _transactions() -> list[MonzoTransaction]:
+    fake = FakeMonzo(accounts=4, transactions_per_account=ROWS // 4)
+    return [
+        MonzoTransaction.model_validate(fake.transaction(account_id, i))
+        for account_id in fake.account_ids
+        for i in range(fake.transactions_per_account)
+    ]
+
+
+async def _stream(transactions: list[MonzoTransaction]) -> AsyncIterator[MonzoTransaction]:
+    for transaction in transactions:
+        yield transaction
+
+
+def _baseline(transactions: list[MonzoTransaction]) -> float:
+    """One connection checkout, statement and commit per row."""
+    start = time.perf_counter()
+    for transaction in transactions:
+        with get_db_connection() as conn:
+            conn.execute(_UPSERT, _row(transaction))
+            conn.commit()
+    return len(transactions) / (time.perf_counter() - start)
+
+
+async def _ingest(transactions: list[MonzoTransaction], defer_indexes: bool | None = None) -> tuple[int, float]:
+    repository = TransactionRepository(get_async_database())
+    start = time.perf_counter()
+    changed = await repository.ingest(_stream(transactions), defer_indexes=defer_indexes)
+    return changed, len(transactions) / (time.perf_counter() - start)
+
+
+def _fresh_database(directory: str, name: str) -> str:
+    close_async_database()
+    close_pool()
+    path = os.path.join(directory, f"{name}.db")
+    patch("app.config.settings.settings.sqlite_database", path).start()
+    upgrade()
+    return path
+
+
+def main() -> None:
+    transactions = _transactions()
+    print(f"{'mode':>28} {'changed':>8} {'rows/s':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        _fresh_database(directory, "baseline")
+        rate = _baseline(transactions[:BASELINE_ROWS])
+        print(f"{'row at a time':>28} {BASELINE_ROWS:>8} {rate:>9.0f}")
+
+        _fresh_database(directory, "indexed")
+        changed, rate = asyncio.run(_ingest(transactions, defer_indexes=False))
+        print(f"{'batched, indexes maintained':>28} {changed:>8} {rate:>9.0f}")
+
+        path = _fresh_database(directory, "deferred")
+        changed, rate = asyncio.run(_ingest(transactions))
+        print(f"{'batched, indexes deferred':>28} {changed:>8} {rate:>9.0f}")
+
+        changed, rate = asyncio.run(_ingest(transactions))
+        print(f"{'re-ingest (no changes)':>28} {changed:>8} {rate:>9.0f}")
+        print(f"\ndatabase size: {Path(path).stat().st_size / 1024 / 1024:.1f} MiB")
+
+        close_async_database()
+        close_pool()
+        patch.stopall()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Latency of page N of the transactions list: OFFSET against the (created_at, id) keyset cursor."""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from unittest.mock import patch
+
+from app.config.async_database import close_async_database, get_async_database
+from app.config.database import close_pool, get_db_connection
+from app.v1.gateways.monzo import MonzoTransaction
+from app.v1.repositories.transactions import TransactionRepository, _decode_cursor, _page
+from app.v1.repositories.upgrade import upgrade
+from tests.fakes.monzo import FakeMonzo
+
+ROWS = 100_000
+PAGE_SIZE = 50
+PAGES = (1, 10, 100, 1000, ROWS // PAGE_SIZE)
+REPEAT = 20
+
+_OFFSET = """
+SELECT id, created_at, amount, currency, description, category, merchant_name, settled_at
+FROM transactions
+ORDER BY created_at DESC, id DESC
+LIMIT ? OFFSET ?
+"""
+
+
+async def _load() -> list[str | None]:
+    """Load the transactions, returning the cursor that starts each page."""
+    fake = FakeMonzo(accounts=4, transactions_per_account=ROWS // 4)
+
+    async def stream():
+        for account_id in fake.account_ids:
+            for i in range(fake.transactions_per_account):
+                yield MonzoTransaction.model_validate(fake.transaction(account_id, i))
+
+    repository = TransactionRepository(get_async_database())
+    await repository.ingest(stream())
+
+    cursors: list[str | None] = [None]
+    cursor = None
+    while True:
+        page = await repository.page(cursor, limit=PAGE_SIZE)
+        if page.next_cursor is None:
+            return cursors
+        cursor = page.next_cursor
+        cursors.append(cursor)
+
+
+def _time(function) -> float:
+    durations = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        with patch("app.config.settings.settings.sqlite_database", os.path.join(directory, "pages.db")):
+            upgrade()
+            cursors = asyncio.run(_load())
+
+            print(f"{'page':>6} {'OFFSET ms':>10} {'keyset ms':>10}")
+            with get_db_connection() as conn:
+                for number in PAGES:
+                    cursor = cursors[number - 1]
+                    after = _decode_cursor(cursor) if cursor is not None else None
+                    offset = _time(lambda: conn.execute(_OFFSET, (PAGE_SIZE, (number - 1) * PAGE_SIZE)).fetchall())
+                    keyset = _time(lambda: _page(conn, after, PAGE_SIZE))
+                    print(f"{number:>6} {offset:>10.3f} {keyset:>10.3f}")
+
+            close_async_database()
+            close_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ import socket
 import sys
 import time
 from collections.abc import Callable
+from pathlib import Path
 
 from invoke.context import Context
 from invoke.tasks import task
@@ -98,6 +99,23 @@ def dev(c: Context):
     c.run("uv run uvicorn app.app:app --reload", env=env, pty=True)  # type: ignore
 
 
+@task
+def assets(c: Context):
+    # Fingerprint and precompress static files ahead of time, so the app doesn't on startup.
+    from app.v1.controllers.static_assets import get_asset_manifest
+
+    def build() -> None:
+        get_asset_manifest()
+
+    _run_command(
+        c,
+        build,
+        lambda: print(f"⏳ Building assets...", end="\r"),
+        lambda: print(f"🟢 Assets built"),
+        lambda: print(f"🔴 Building assets failed"),
+    )
+
+
 @task
 def format(c: Context):
     _run_command(
@@ -148,6 +166,22 @@ def test(c: Context):
     )
 
 
+@task
+def bench(c: Context, name: str = ""):
+    # Configure the environment.
+    env = {
+        "LOGFIRE_CONSOLE": "false",
+        "SQLITE_DATABASE": f"/tmp/transactions-{_generate_id()}.db",
+    }
+
+    # Run one benchmark, or all of them.
+    modules = [name] if name else sorted(p.stem for p in Path("benchmarks").glob("*.py") if p.stem != "__init__")
+    for module in modules:
+        print(f"⏱️  {module}")
+        c.run(f"uv run python -m benchmarks.{module}", env=env, pty=True)  # type: ignore
+        print()
+
+
 @task
 def all(c: Context):
     tasks = [format, lint, typecheck, test]
@@ -0,0 +1,162 @@
+import asyncio
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.config.async_database import AsyncDatabase, close_async_database, get_async_db_connection
+from app.config.database import ConnectionPool
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / "test.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, value TEXT)")
+    conn.commit()
+    conn.close()
+
+    database = AsyncDatabase(path, readers=2, write_batch_size=10)
+    yield database
+    database.close()
+
+
+def insert(value: str):
+    def function(conn: sqlite3.Connection) -> int:
+        cursor = conn.execute("INSERT INTO t (value) VALUES (?)", (value,))
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    return function
+
+
+def fail(conn: sqlite3.Connection) -> None:
+    conn.execute("INSERT INTO t (value) VALUES ('rolled back')")
+    raise ValueError("boom")
+
+
+class TestAsyncDatabase:
+    @pytest.mark.asyncio
+    async def test_write_then_read(self, database):
+        row_id = await database.write(insert("a"))
+
+        rows = await database.read(lambda conn: conn.execute("SELECT id, value FROM t").fetchall())
+
+        assert [tuple(row) for row in rows] == [(row_id, "a")]
+
+    @pytest.mark.asyncio
+    async def test_reads_are_read_only(self, database):
+        with pytest.raises(sqlite3.OperationalError):
+            await database.read(insert("a"))
+
+    @pytest.mark.asyncio
+    async def test_writes_run_on_a_single_thread(self, database):
+        threads = await asyncio.gather(*(database.write(lambda _: threading.current_thread().name) for _ in range(20)))
+
+        assert set(threads) == {"sqlite-writer"}
+
+    @pytest.mark.asyncio
+    async def test_batches_concurrent_writes_into_one_transaction(self, database):
+        gate = threading.Event()
+
+        def block(conn: sqlite3.Connection) -> None:
+            gate.wait()
+
+        blocked = asyncio.ensure_future(database.write(block))
+        await asyncio.sleep(0.05)
+        queued = [asyncio.ensure_future(database.write(lambda conn: conn.total_changes)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+
+        with patch("app.config.async_database._write_batch_size") as batch_size:
+            gate.set()
+            await blocked
+            await asyncio.gather(*queued)
+
+        assert [call.args[0] for call in batch_size.record.call_args_list] == [1, 5]
+
+    @pytest.mark.asyncio
+    async def test_failing_write_only_rolls_back_itself(self, database):
+        results = await asyncio.gather(
+            database.write(insert("a")),
+            database.write(fail),
+            database.write(insert("b")),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], ValueError)
+        rows = await database.read(lambda conn: conn.execute("SELECT value FROM t ORDER BY id").fetchall())
+        assert [row["value"] for row in rows] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_fails_the_whole_batch(self, database):
+        def commit(conn: sqlite3.Connection) -> None:
+            conn.commit()
+
+        with pytest.raises(sqlite3.OperationalError):
+            await database.write(commit)
+
+        assert await database.write(insert("after")) > 0
+
+    @pytest.mark.asyncio
+    async def test_write_fails_when_the_writer_cannot_connect(self, tmp_path):
+        gate = threading.Event()
+        connect = ConnectionPool._connect
+
+        def wait_then_connect(pool: ConnectionPool) -> sqlite3.Connection:
+            gate.wait()
+            return connect(pool)
+
+        with patch.object(ConnectionPool, "_connect", wait_then_connect):
+            database = AsyncDatabase(str(tmp_path / "missing" / "test.db"))
+            try:
+                queued = asyncio.ensure_future(database.write(insert("a")))
+                gate.set()
+                with pytest.raises(sqlite3.OperationalError):
+                    await asyncio.wait_for(queued, 5)
+
+                with pytest.raises(RuntimeError, match="SQLite writer has stopped"):
+                    await database.write(insert("b"))
+            finally:
+                database.close()
+
+
+class TestGetAsyncDbConnection:
+    @pytest.mark.asyncio
+    async def test_returns_the_reader_connection_after_each_read(self, database):
+        with patch("app.config.async_database.get_async_database", return_value=database):
+            async with get_async_db_connection() as conn:
+                await conn.execute("INSERT INTO t (value) VALUES (?)", ("a",))
+                row = await conn.fetchone("SELECT value FROM t")
+                assert database.readers.stats().idle == 1
+
+        assert row is not None and row["value"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_more_handles_than_readers(self, database):
+        database.readers.timeout = 1.0
+
+        async def use() -> list[sqlite3.Row]:
+            async with get_async_db_connection() as conn:
+                await conn.fetchone("SELECT 1")
+                await asyncio.sleep(0.01)
+                return await conn.fetchall("SELECT 1")
+
+        with patch("app.config.async_database.get_async_database", return_value=database):
+            results = await asyncio.gather(*(use() for _ in range(6)))
+
+        assert all(len(rows) == 1 for rows in results)
+
+    @pytest.mark.asyncio
+    async def test_executemany_and_fetchall(self, database):
+        with patch("app.config.async_database.get_async_database", return_value=database):
+            async with get_async_db_connection() as conn:
+                changed = await conn.executemany("INSERT INTO t (value) VALUES (?)", [("a",), ("b",)])
+                rows = await conn.fetchall("SELECT value FROM t ORDER BY id")
+
+        assert changed == 2
+        assert [row["value"] for row in rows] == ["a", "b"]
+
+    def test_close_async_database_without_database(self):
+        close_async_database()
@@ -0,0 +1,210 @@
+import sqlite3
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.config.database import (
+    ConnectionPool,
+    close_pool,
+    get_db_connection,
+    get_pool,
+    get_read_only_pool,
+)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "test.db"), size=2, timeout=0.1)
+    yield pool
+    pool.close()
+
+
+class TestConnectionPool:
+    def test_applies_pragmas_once_per_connection(self, pool):
+        with pool.connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+        with patch.object(pool, "_connect", wraps=pool._connect) as connect:
+            with pool.connection():
+                pass
+
+        connect.assert_not_called()
+
+    def test_reuses_connections(self, pool):
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is second
+        assert pool.stats().connections_opened == 1
+        assert pool.stats().checkouts == 2
+
+    def test_uses_row_factory(self, pool):
+        with pool.connection() as conn:
+            row = conn.execute("SELECT 1 AS one").fetchone()
+
+        assert row["one"] == 1
+
+    def test_opens_up_to_size_connections(self, pool):
+        with pool.connection() as first, pool.connection() as second:
+            assert first is not second
+            assert pool.stats().open == 2
+
+    def test_times_out_when_exhausted(self, pool):
+        with pool.connection(), pool.connection():
+            with pytest.raises(TimeoutError):
+                with pool.connection():
+                    pass
+
+    def test_waiter_gets_returned_connection(self, pool):
+        checked_out = threading.Event()
+        pool.timeout = 5
+
+        def hold():
+            with pool.connection(), pool.connection():
+                checked_out.set()
+                time.sleep(0.05)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        checked_out.wait()
+
+        with pool.connection():
+            pass
+        thread.join()
+
+        assert pool.stats().wait_time > 0
+        assert pool.stats().connections_opened == 2
+
+    def test_rolls_back_uncommitted_work_on_return(self, pool):
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (id INTEGER)")
+            conn.commit()
+            conn.execute("INSERT INTO t VALUES (1)")
+
+        with pool.connection() as conn:
+            assert not conn.in_transaction
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_replaces_unhealthy_connections(self, pool):
+        pool.health_check_after = 0
+        with pool.connection() as conn:
+            pass
+        conn.close()
+
+        with pool.connection() as replacement:
+            assert replacement is not conn
+            assert replacement.execute("SELECT 1").fetchone()[0] == 1
+
+        assert pool.stats().connections_closed == 1
+        assert pool.stats().open == 1
+
+    def test_recycles_connections_older_than_max_age(self, pool):
+        pool.max_age = 0
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        assert first is not second
+        assert pool.stats().connections_opened == 2
+        assert pool.stats().idle == 0
+
+    def test_releases_slot_when_connect_fails(self, pool):
+        with patch.object(pool, "_connect", side_effect=sqlite3.OperationalError("boom")):
+            with pytest.raises(sqlite3.OperationalError):
+                with pool.connection():
+                    pass
+
+        assert pool.stats().open == 0
+
+    def test_close_closes_idle_connections(self, pool):
+        with pool.connection():
+            pass
+
+        pool.close()
+
+        assert pool.stats().open == 0
+        assert pool.stats().connections_closed == 1
+        with pytest.raises(RuntimeError):
+            with pool.connection():
+                pass
+
+    def test_connection_returned_after_close_is_closed(self, pool):
+        with pool.connection() as conn:
+            pool.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert pool.stats().open == 0
+
+
+class TestReadOnlyConnectionPool:
+    @pytest.fixture
+    def read_only_pool(self, pool):
+        with pool.connection() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("CREATE TABLE t (x)")
+            conn.commit()
+        read_only_pool = ConnectionPool(pool.database, size=2, timeout=0.1, read_only=True)
+        yield read_only_pool
+        read_only_pool.close()
+
+    def test_refuses_writes(self, read_only_pool):
+        with read_only_pool.connection() as conn:
+            assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("INSERT INTO t VALUES (1)")
+
+    def test_opened_read_only(self, read_only_pool):
+        with read_only_pool.connection() as conn:
+            conn.execute("PRAGMA query_only = OFF")
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("INSERT INTO t VALUES (1)")
+
+    def test_reads_while_a_write_is_open(self, pool, read_only_pool):
+        with pool.connection() as writer, read_only_pool.connection() as reader:
+            writer.execute("BEGIN IMMEDIATE")
+            writer.execute("INSERT INTO t VALUES (1)")
+
+            assert reader.execute("SELECT count(*) FROM t").fetchone()[0] == 0
+
+            writer.commit()
+            assert reader.execute("SELECT count(*) FROM t").fetchone()[0] == 1
+
+
+class TestGetDbConnection:
+    def test_checks_out_from_shared_pool(self, tmp_path):
+        with patch("app.config.database.settings.sqlite_database", str(tmp_path / "shared.db")):
+            close_pool()
+            with get_db_connection() as first:
+                pass
+            with get_db_connection() as second:
+                pass
+
+            assert first is second
+            assert get_pool() is get_pool()
+            close_pool()
+
+    def test_read_only_connections_come_from_their_own_pool(self, tmp_path):
+        with patch("app.config.database.settings.sqlite_database", str(tmp_path / "shared.db")):
+            close_pool()
+            with get_db_connection() as conn:
+                conn.execute("CREATE TABLE t (x)")
+                conn.commit()
+
+            with get_db_connection(read_only=True) as reader:
+                with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                    reader.execute("INSERT INTO t VALUES (1)")
+            with get_db_connection() as writer:
+                writer.execute("INSERT INTO t VALUES (1)")
+                writer.commit()
+
+            assert reader is not writer
+            assert get_read_only_pool().stats().checkouts == 1
+            assert get_pool().stats().checkouts == 2
+            close_pool()
@@ -0,0 +1,126 @@
+import asyncio
+import os
+import sqlite3
+from contextlib import closing
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.config.database import get_pool
+from app.config.maintenance import MaintenanceScheduler
+
+
+@pytest.fixture
+def scheduler(migrated_database):
+    return MaintenanceScheduler(get_async_database(), get_pool(), interval=0.01, vacuum_interval=0, vacuum_pages=10)
+
+
+async def fill(scheduler: MaintenanceScheduler, rows: int = 2000) -> None:
+    def fill(conn: sqlite3.Connection) -> None:
+        conn.execute("CREATE TABLE IF NOT EXISTS filler (value TEXT)")
+        conn.executemany("INSERT INTO filler (value) VALUES (?)", [("x" * 500,) for _ in range(rows)])
+
+    await scheduler.database.write(fill)
+
+
+class TestMaintenanceScheduler:
+    @pytest.mark.asyncio
+    async def test_passive_checkpoint(self, scheduler, migrated_database):
+        await fill(scheduler)
+
+        result = await scheduler.checkpoint()
+
+        assert result.mode == "PASSIVE"
+        assert not result.busy
+        assert result.checkpointed_frames == result.wal_frames > 0
+        # A passive checkpoint leaves the WAL file to be reused.
+        assert result.wal_bytes_after == result.wal_bytes_before > 0
+
+    @pytest.mark.asyncio
+    async def test_truncates_a_large_wal(self, scheduler, migrated_database):
+        await fill(scheduler)
+        scheduler.wal_truncate_bytes = 1024
+
+        result = await scheduler.checkpoint()
+
+        assert result.mode == "TRUNCATE"
+        assert result.wal_bytes_after == 0
+        assert os.path.getsize(f"{migrated_database}-wal") == 0
+
+    @pytest.mark.asyncio
+    async def test_migrations_enable_incremental_vacuum(self, scheduler):
+        assert await scheduler.incremental()
+
+    @pytest.mark.asyncio
+    async def test_vacuum_releases_a_bounded_number_of_pages(self, scheduler, migrated_database):
+        await fill(scheduler)
+        await scheduler.database.write(lambda conn: conn.execute("DELETE FROM filler"))
+
+        assert await scheduler.vacuum() == 10
+
+        with closing(sqlite3.connect(migrated_database)) as conn:
+            assert conn.execute("PRAGMA freelist_count").fetchone()[0] > 0
+
+    @pytest.mark.asyncio
+    async def test_vacuum_without_free_pages(self, scheduler):
+        assert await scheduler.vacuum() == 0
+
+    @pytest.mark.asyncio
+    async def test_optimize(self, scheduler):
+        await fill(scheduler)
+
+        await scheduler.optimize()
+
+    @pytest.mark.asyncio
+    async def test_run_runs_due_jobs_until_stopped(self, scheduler):
+        scheduler.optimize_interval = 0
+        stop = asyncio.Event()
+
+        with (
+            patch.object(scheduler, "checkpoint", AsyncMock()) as checkpoint,
+            patch.object(scheduler, "incremental", AsyncMock(return_value=True)),
+            patch.object(scheduler, "vacuum", AsyncMock()) as vacuum,
+            patch.object(scheduler, "optimize", AsyncMock(side_effect=RuntimeError("boom"))) as optimize,
+        ):
+            task = asyncio.create_task(scheduler.run(stop))
+            await asyncio.sleep(0.05)
+            stop.set()
+            await task
+
+        assert checkpoint.await_count >= 2
+        assert vacuum.await_count == optimize.await_count == checkpoint.await_count
+
+    @pytest.mark.asyncio
+    async def test_run_skips_vacuum_without_incremental_auto_vacuum(self, scheduler):
+        stop = asyncio.Event()
+
+        with (
+            patch.object(scheduler, "incremental", AsyncMock(return_value=False)),
+            patch.object(scheduler, "vacuum", AsyncMock()) as vacuum,
+            patch("app.config.maintenance.logfire.warn") as warn,
+        ):
+            task = asyncio.create_task(scheduler.run(stop))
+            await asyncio.sleep(0.05)
+            stop.set()
+            await task
+
+        vacuum.assert_not_awaited()
+        warn.assert_called_with("SQLite maintenance: vacuum skipped, incremental auto-vacuum is off")
+
+    @pytest.mark.asyncio
+    async def test_optimize_waits_for_a_quiet_interval(self, scheduler):
+        scheduler.optimize_interval = 0
+        scheduler.quiet_operations = 1
+        stop = asyncio.Event()
+
+        with patch.object(scheduler, "optimize", AsyncMock()) as optimize:
+            task = asyncio.create_task(scheduler.run(stop))
+            for _ in range(50):
+                await scheduler.database.read(lambda conn: None)
+                await asyncio.sleep(0.001)
+            stop.set()
+            await task
+
+        # Only the first interval, with nothing to compare against, counts as quiet.
+        assert optimize.await_count <= 1
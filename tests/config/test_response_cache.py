@@ -0,0 +1,137 @@
+import asyncio
+
+import pytest
+
+from app.config.response_cache import ResponseCache
+
+
+@pytest.fixture
+def cache(monotonic_clock):
+    return ResponseCache(ttl=10, stale_ttl=60, max_entries=2, clock=monotonic_clock)
+
+
+class Computation:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return f"value {self.calls}"
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_fresh_entries_are_hits(self, cache):
+        compute = Computation()
+
+        assert await cache.get("key", compute) == "value 1"
+        assert await cache.get("key", compute) == "value 1"
+
+        assert compute.calls == 1
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_computation(self, cache):
+        compute = Computation()
+        compute.release.clear()
+
+        requests = [asyncio.create_task(cache.get("key", compute)) for _ in range(10)]
+        await asyncio.sleep(0)
+        compute.release.set()
+
+        assert await asyncio.gather(*requests) == ["value 1"] * 10
+        assert compute.calls == 1
+        assert (cache.misses, cache.coalesced) == (1, 9)
+
+    @pytest.mark.asyncio
+    async def test_stale_entries_are_served_while_refreshed(self, cache, monotonic_clock):
+        compute = Computation()
+        await cache.get("key", compute)
+        monotonic_clock.now = 30
+
+        assert await cache.get("key", compute) == "value 1"
+        assert await cache.get("key", compute) == "value 1"
+        await asyncio.sleep(0)
+
+        assert compute.calls == 2
+        assert cache.stale == 2
+        assert await cache.get("key", compute) == "value 2"
+        assert cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_recomputed(self, cache, monotonic_clock):
+        compute = Computation()
+        await cache.get("key", compute)
+        monotonic_clock.now = 100
+
+        assert await cache.get("key", compute) == "value 2"
+        assert cache.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_waiter_and_arent_cached(self, cache):
+        gate = asyncio.Event()
+
+        async def failing() -> str:
+            await gate.wait()
+            raise ValueError("boom")
+
+        requests = [asyncio.create_task(cache.get("key", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        gate.set()
+
+        results = await asyncio.gather(*requests, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_doesnt_cancel_the_computation(self, cache):
+        compute = Computation()
+        compute.release.clear()
+        first = asyncio.create_task(cache.get("key", compute))
+        second = asyncio.create_task(cache.get("key", compute))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        compute.release.set()
+
+        assert await second == "value 1"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_by_tag(self, cache):
+        await cache.get("a", Computation(), tags=["transactions"])
+        await cache.get("b", Computation(), tags=["other"])
+
+        assert cache.invalidate("transactions") == 1
+
+        assert len(cache) == 1
+        assert cache.invalidate() == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_computation_isnt_stored(self, cache):
+        compute = Computation()
+        compute.release.clear()
+        request = asyncio.create_task(cache.get("key", compute, tags=["transactions"]))
+        await asyncio.sleep(0)
+
+        cache.invalidate("transactions")
+        compute.release.set()
+
+        assert await request == "value 1"
+        assert len(cache) == 0
+        assert await cache.get("key", compute) == "value 2"
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, cache):
+        for key in ("a", "b"):
+            await cache.get(key, Computation())
+        await cache.get("a", Computation())
+
+        await cache.get("c", Computation())
+
+        assert cache.evictions == 1
+        compute = Computation()
+        await cache.get("b", compute)
+        assert compute.calls == 1
@@ -0,0 +1,120 @@
+import asyncio
+import re
+import sqlite3
+from contextlib import closing
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import server_timing
+from app.config.async_database import get_async_database
+from app.config.server_timing import ServerTiming, ServerTimingMiddleware, current_timing
+from app.v1.controllers.middleware.response_pipeline import ResponsePipelineMiddleware
+from app.v1.controllers.middleware.response_stages import GZipStage, HTMLStage
+from app.v1.controllers.v1_router import router
+
+
+def metrics(header: str) -> dict[str, str]:
+    return dict(re.findall(r"([\w-]+);dur=([\d.]+)", header))
+
+
+class TestServerTiming:
+    def test_header(self):
+        timing = ServerTiming()
+        timing.record("sql", 0.002)
+        timing.record("sql", 0.001)
+        timing.record("template", 0.0005)
+
+        header = timing.header()
+
+        assert header.startswith('sql;dur=3.00;desc="2x", template;dur=0.50;desc="1x", total;dur=')
+
+    def test_names_are_made_tokens(self):
+        timing = ServerTiming()
+        timing.record("db connection", 0.001)
+
+        assert timing.header().startswith("db-connection;dur=1.00")
+
+    def test_record_outside_a_request_does_nothing(self):
+        with server_timing.measure("sql"):
+            pass
+
+        assert current_timing() is None
+
+
+class TestServerTimingMiddleware:
+    @pytest.fixture
+    def app(self):
+        app = FastAPI()
+
+        @app.get("/")
+        async def index():
+            with server_timing.measure("work"):
+                pass
+            return {"timed": current_timing() is not None}
+
+        return app
+
+    def test_adds_header(self, app):
+        app.add_middleware(ServerTimingMiddleware)
+
+        response = TestClient(app).get("/")
+
+        assert response.json() == {"timed": True}
+        assert set(metrics(response.headers["server-timing"])) == {"work", "total"}
+
+    def test_header_can_be_disabled(self, app):
+        app.add_middleware(ServerTimingMiddleware, header=False)
+
+        response = TestClient(app).get("/")
+
+        assert "server-timing" not in response.headers
+
+    def test_sets_span_attributes(self, app):
+        app.add_middleware(ServerTimingMiddleware)
+        span = MagicMock()
+
+        with patch("app.config.server_timing.trace.get_current_span", return_value=span):
+            TestClient(app).get("/")
+
+        attributes = {call.args[0]: call.args[1] for call in span.set_attribute.call_args_list}
+        assert attributes["server_timing.work_count"] == 1
+        assert {"server_timing.work_ms", "server_timing.total_ms"} <= attributes.keys()
+
+    def test_breaks_down_a_page(self, migrated_database):
+        with closing(sqlite3.connect(migrated_database)) as conn, conn:
+            conn.execute(
+                "INSERT INTO transactions (id, account_id, amount, currency, created_at, description) "
+                "VALUES ('tx_1', 'acc_1', -350, 'GBP', '2024-01-01T12:00:00.000Z', 'Pret')"
+            )
+        app = FastAPI()
+        app.include_router(router)
+        app.add_middleware(ResponsePipelineMiddleware, stages=[HTMLStage(), GZipStage(minimum_size=0)])
+        app.add_middleware(ServerTimingMiddleware)
+
+        response = TestClient(app).get("/v1/transactions/search", params={"q": "pret"})
+
+        assert {"db-connection", "sql", "template", "html", "gzip", "total"} <= set(
+            metrics(response.headers["server-timing"])
+        )
+
+
+class TestAsyncDatabase:
+    @pytest.mark.asyncio
+    async def test_reads_and_writes_are_recorded_against_the_request(self, migrated_database):
+        database = get_async_database()
+
+        async def request() -> ServerTiming:
+            timing = ServerTiming()
+            server_timing._current.set(timing)
+            await database.read(lambda conn: server_timing.record("read", 0.001))
+            await database.write(lambda conn: server_timing.record("write", 0.001))
+            return timing
+
+        timings = await asyncio.gather(request(), request())
+
+        for timing in timings:
+            durations = timing.durations()
+            assert (durations["read"], durations["write"]) == ((0.001, 1), (0.001, 1))
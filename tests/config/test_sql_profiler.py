@@ -0,0 +1,160 @@
+import itertools
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from app.config.sql_profiler import ProfiledConnection, SQLProfiler, fingerprint
+
+
+@pytest.fixture
+def profiler():
+    profiler = SQLProfiler(flush_interval=3600)
+    with patch("app.config.sql_profiler.profiler", profiler):
+        yield profiler
+
+
+@pytest.fixture
+def conn(profiler):
+    conn = sqlite3.connect(":memory:", factory=ProfiledConnection)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO t (name) VALUES (?)", [("a",), ("b",), ("c",)])
+    profiler.reset()
+    yield conn
+    conn.close()
+
+
+def counts(profiler: SQLProfiler) -> dict[str, tuple[int, int]]:
+    return {summary.fingerprint: (summary.count, summary.rows) for summary in profiler.top(100)}
+
+
+class TestFingerprint:
+    def test_normalizes_literals(self):
+        assert fingerprint("SELECT * FROM t WHERE id = 42 AND name = 'it''s'") == (
+            "SELECT * FROM t WHERE id = ? AND name = ?"
+        )
+
+    def test_normalizes_whitespace_and_trailing_semicolon(self):
+        assert fingerprint("SELECT *\n   FROM t ;") == "SELECT * FROM t"
+
+    def test_keeps_numbers_in_identifiers(self):
+        assert fingerprint("SELECT col1 FROM t2 WHERE x = -1.5e3") == "SELECT col1 FROM t2 WHERE x = ?"
+
+    def test_collapses_in_lists(self):
+        assert fingerprint("SELECT * FROM t WHERE id IN (1, 2, 3)") == fingerprint("SELECT * FROM t WHERE id IN (?)")
+
+    def test_collapses_multi_row_values(self):
+        assert fingerprint("INSERT INTO t VALUES (1, 'a'), (2, 'b')") == "INSERT INTO t VALUES (?, ?), ..."
+
+    def test_normalizes_blob_literals(self):
+        assert fingerprint("SELECT x'00ff'") == "SELECT ?"
+
+
+class TestSQLProfiler:
+    def test_aggregates_by_fingerprint(self, profiler):
+        profiler.record("SELECT * FROM t WHERE id = 1", 0.001, 1)
+        profiler.record("SELECT * FROM t WHERE id = 2", 0.003, 0)
+
+        [summary] = profiler.top()
+
+        assert summary.fingerprint == "SELECT * FROM t WHERE id = ?"
+        assert summary.count == 2
+        assert summary.rows == 1
+        assert summary.total_ms == pytest.approx(4)
+        assert summary.mean_ms == pytest.approx(2)
+        assert summary.p50_ms == pytest.approx(2)
+        assert summary.p95_ms == pytest.approx(2.9)
+
+    def test_top_orders_by_field(self, profiler):
+        profiler.record("SELECT 1", 0.005, 1)
+        for _ in range(3):
+            profiler.record("SELECT name FROM t", 0.002, 1)
+
+        assert [summary.fingerprint for summary in profiler.top(by="total_ms")] == ["SELECT name FROM t", "SELECT ?"]
+        assert [summary.fingerprint for summary in profiler.top(by="p95_ms")] == ["SELECT ?", "SELECT name FROM t"]
+        assert len(profiler.top(limit=1)) == 1
+
+    def test_flush_logs_window_and_keeps_totals(self, profiler):
+        profiler.record("SELECT 1", 0.001, 1)
+
+        with patch("app.config.sql_profiler.logfire") as logfire:
+            profiler.flush()
+            profiler.flush()
+
+        logfire.info.assert_called_once()
+        assert logfire.info.call_args.kwargs["fingerprint"] == "SELECT ?"
+        assert logfire.info.call_args.kwargs["count"] == 1
+        assert profiler.top()[0].count == 1
+
+    def test_flushes_after_interval(self, profiler):
+        profiler.flush_interval = 0
+
+        with patch.object(profiler, "flush") as flush:
+            profiler.record("SELECT 1", 0.001, 1)
+
+        flush.assert_called_once()
+
+    def test_samples_raw_statements(self, profiler):
+        profiler.sample_rate = 1.0
+
+        with patch("app.config.sql_profiler.logfire") as logfire:
+            profiler.record("SELECT 1", 0.001, 1)
+
+        logfire.info.assert_called_once()
+        assert logfire.info.call_args.kwargs["args"] == ["SELECT 1"]
+
+    def test_does_not_sample_by_default(self, profiler):
+        with patch("app.config.sql_profiler.logfire") as logfire:
+            profiler.record("SELECT 1", 0.001, 1)
+
+        logfire.info.assert_not_called()
+
+
+class TestProfiledConnection:
+    def test_records_rows_from_fetchall(self, profiler, conn):
+        conn.execute("SELECT * FROM t").fetchall()
+
+        assert counts(profiler) == {"SELECT * FROM t": (1, 3)}
+
+    def test_records_rows_from_iteration(self, profiler, conn):
+        rows = list(conn.execute("SELECT * FROM t WHERE id > 1"))
+
+        assert len(rows) == 2
+        assert counts(profiler) == {"SELECT * FROM t WHERE id > ?": (1, 2)}
+
+    def test_iteration_time_includes_the_last_fetch(self, profiler, conn):
+        # Each call to the clock advances it a second: one for execute, and one per fetch, including the last.
+        with patch("app.config.sql_profiler.time.perf_counter", side_effect=itertools.count()):
+            list(conn.execute("SELECT * FROM t WHERE id = 1"))
+
+        assert profiler.top(1)[0].total_ms == 3000
+
+    def test_records_when_fetchone_exhausts_or_cursor_is_reused(self, profiler, conn):
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM t WHERE id = 1")
+        assert cursor.fetchone() is not None
+        assert cursor.fetchone() is None
+        cursor.execute("SELECT * FROM t WHERE id = 2").fetchone()
+        cursor.execute("SELECT name FROM t")
+
+        assert counts(profiler) == {"SELECT * FROM t WHERE id = ?": (2, 2)}
+
+    def test_records_on_close(self, profiler, conn):
+        cursor = conn.execute("SELECT * FROM t")
+        cursor.fetchmany(2)
+        cursor.close()
+
+        assert counts(profiler) == {"SELECT * FROM t": (1, 2)}
+
+    def test_records_when_fetchmany_exhausts(self, profiler, conn):
+        cursor = conn.execute("SELECT * FROM t")
+        cursor.fetchmany(2)
+        cursor.fetchmany(5)
+
+        assert counts(profiler) == {"SELECT * FROM t": (1, 3)}
+
+    def test_records_writes_with_rowcount(self, profiler, conn):
+        conn.executemany("UPDATE t SET name = ? WHERE id = ?", [("x", 1), ("y", 2)])
+        conn.executescript("DELETE FROM t;")
+
+        assert counts(profiler) == {"UPDATE t SET name = ? WHERE id = ?": (1, 2), "DELETE FROM t": (1, 0)}
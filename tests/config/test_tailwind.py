@@ -0,0 +1,99 @@
+import pytest
+
+from app.config.tailwind import (
+    UnknownUtilityError,
+    build_stylesheet,
+    extract_candidates,
+    generate_utilities,
+    unknown_utilities,
+)
+
+
+class TestExtractCandidates:
+    def test_finds_classes_in_attributes_and_template_syntax(self):
+        html = '<td class="py-1 whitespace-nowrap{% if not row.settled_at %} italic{% endif %}">'
+
+        assert {"py-1", "whitespace-nowrap", "italic"} <= extract_candidates([html])
+
+
+class TestGenerateUtilities:
+    def test_ignores_words_that_arent_utilities(self):
+        assert generate_utilities(["row.settled_at", "endif", "Loading…"]) == ""
+
+    def test_utilities(self):
+        css = generate_utilities(["bg-gray-100", "py-1", "text-xs", "-mt-2", "w-1/3", "w-[350px]"])
+
+        assert css.splitlines() == [
+            ".-mt-2 { margin-top: calc(0.5rem * -1) }",
+            r".w-1\/3 { width: 33.333333% }",
+            r".w-\[350px\] { width: 350px }",
+            ".bg-gray-100 { background-color: #f3f4f6 }",
+            ".py-1 { padding-top: 0.25rem; padding-bottom: 0.25rem }",
+            ".text-xs { font-size: 0.75rem; line-height: 1rem }",
+        ]
+
+    def test_later_utilities_win(self):
+        # Colours come after sizes, whatever order the classes were written in.
+        css = generate_utilities(["text-gray-500", "text-sm"])
+
+        assert css.index(".text-sm") < css.index(".text-gray-500")
+
+    def test_variants(self):
+        css = generate_utilities(["hover:text-gray-300", "md:flex", "group-hover:underline", "bg-black/50"])
+
+        assert css.splitlines() == [
+            ".bg-black\\/50 { background-color: rgb(0 0 0 / 0.5) }",
+            ".group:hover .group-hover\\:underline { text-decoration-line: underline }",
+            ".hover\\:text-gray-300:hover { color: #d1d5db }",
+            "@media (min-width: 768px) {",
+            "  .md\\:flex { display: flex }",
+            "}",
+        ]
+
+    def test_unknown_variant_is_ignored(self):
+        assert generate_utilities(["dark:flex", "print:hidden"]) == ""
+
+    def test_space_between_children(self):
+        assert generate_utilities(["space-x-4"]) == (
+            ".space-x-4 > :not([hidden]) ~ :not([hidden]) { margin-left: 1rem }\n"
+        )
+
+    def test_container(self):
+        css = generate_utilities(["container"])
+
+        assert css.startswith(".container { width: 100% }\n")
+        assert "@media (min-width: 1536px) { .container { max-width: 1536px } }" in css
+
+
+class TestUnknownUtilities:
+    def test_finds_utilities_that_generate_nothing(self):
+        html = '<p class="bg-gray-100 bg-grey-100 dark:flex card {{ \'txt-red\' if not x else \'w-13\' }}">'
+
+        assert unknown_utilities([html]) == {"bg-grey-100", "dark:flex", "w-13"}
+
+    def test_ignores_template_syntax_and_text(self):
+        html = '<td class="py-1{% if not row.settled_at %} italic{% endif %}">text-huge</td>'
+
+        assert unknown_utilities([html]) == set()
+
+
+class TestBuildStylesheet:
+    def test_extends_base_with_the_utilities_templates_use(self, tmp_path):
+        (tmp_path / "templates" / "partials").mkdir(parents=True)
+        (tmp_path / "templates" / "partials" / "row.html").write_text('<tr class="border-b text-sm">')
+        (tmp_path / "base.css").write_text("body { margin: 0 }\n")
+
+        css = build_stylesheet(tmp_path / "templates", tmp_path / "base.css").decode()
+
+        assert css.startswith("body { margin: 0 }\n")
+        assert ".border-b { border-bottom-width: 1px }" in css
+        assert ".text-sm {" in css
+        assert ".text-lg" not in css
+
+    def test_fails_on_unknown_utilities(self, tmp_path):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "page.html").write_text('<p class="text-sm dark:text-white">')
+        (tmp_path / "base.css").write_text("")
+
+        with pytest.raises(UnknownUtilityError, match="dark:text-white"):
+            build_stylesheet(tmp_path / "templates", tmp_path / "base.css")
@@ -0,0 +1,49 @@
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+
+from app.config.async_database import close_async_database
+from app.config.database import close_pool
+from app.config.response_cache import response_cache
+from app.v1.repositories.upgrade import upgrade
+from app.v1.services.sessions import session_store
+
+
+class Clock[T]:
+    """A clock that only moves when a test sets `now`."""
+
+    def __init__(self, now: T) -> None:
+        self.now = now
+
+    def __call__(self) -> T:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Stands in for `datetime.now(UTC)`."""
+    return Clock(datetime(2024, 1, 1, 12, tzinfo=UTC))
+
+
+@pytest.fixture
+def monotonic_clock():
+    """Stands in for `time.monotonic`."""
+    return Clock(0.0)
+
+
+@pytest.fixture
+def migrated_database(tmp_path):
+    """A fresh database with every migration applied, used by the shared pool and async database."""
+    path = str(tmp_path / "transactions.db")
+    with patch("app.config.settings.settings.sqlite_database", path):
+        close_async_database()
+        close_pool()
+        upgrade()
+        response_cache.invalidate()
+        session_store.clear()
+        yield path
+        response_cache.invalidate()
+        session_store.clear()
+        close_async_database()
+        close_pool()
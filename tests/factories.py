@@ -0,0 +1,20 @@
+"""Builders for the models tests store, filled in with defaults so each test only spells out what it's about."""
+
+from datetime import datetime
+from typing import Any
+
+from app.v1.gateways.monzo import MonzoTransaction
+
+
+def make_transaction(
+    id: str, amount: int, created: datetime, category: str = "groceries", **overrides: Any
+) -> MonzoTransaction:
+    fields = {
+        "id": id,
+        "account_id": "acc_1",
+        "amount": amount,
+        "currency": "GBP",
+        "created": created,
+        "category": category,
+    }
+    return MonzoTransaction.model_validate(fields | overrides)
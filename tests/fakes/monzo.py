@@ -0,0 +1,114 @@
+"""
+Fake Monzo API for tests and benchmarks.
+
+Transactions are derived from their index rather than stored, so an account can hold any number of them. Use
+`FakeMonzo(...).app` with `httpx.ASGITransport`, or serve it with uvicorn.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import parse_qsl
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+
+EPOCH = datetime(2020, 1, 1, tzinfo=UTC)
+INTERVAL = timedelta(minutes=7)
+
+MERCHANTS = ["Tesco", "Pret A Manger", "TfL", "Amazon", "Netflix", "Shell", "Boots", "Deliveroo"]
+CATEGORIES = ["groceries", "eating_out", "transport", "shopping", "entertainment", "transport", "personal_care"]
+
+
+def _timestamp(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class FakeMonzo:
+    def __init__(
+        self,
+        accounts: int = 2,
+        transactions_per_account: int = 250,
+        access_token: str = "test-token",
+        rate_limit_every: int | None = None,
+        refresh_token: str = "test-refresh-token",
+    ) -> None:
+        self.account_ids = [f"acc_{i:04d}" for i in range(accounts)]
+        self.transactions_per_account = transactions_per_account
+        self.access_token = access_token
+        self.rate_limit_every = rate_limit_every
+        self.refresh_token = refresh_token
+        self.refreshes = 0
+        self.requests = 0
+        self.app = self._build()
+
+    def transaction(self, account_id: str, index: int) -> dict[str, Any]:
+        created = EPOCH + INTERVAL * index
+        merchant = MERCHANTS[index % len(MERCHANTS)]
+        return {
+            "id": f"tx_{account_id}_{index:08d}",
+            "account_id": account_id,
+            "amount": -((index * 7919) % 10_000) - 1 if index % 20 else 250_000,
+            "currency": "GBP",
+            "created": _timestamp(created),
+            "settled": "" if index == self.transactions_per_account - 1 else _timestamp(created + timedelta(days=1)),
+            "description": merchant.upper(),
+            "category": CATEGORIES[index % len(CATEGORIES)] if index % 20 else "income",
+            "notes": "",
+            "merchant": {"id": f"merch_{index % len(MERCHANTS)}", "name": merchant} if index % 20 else "",
+            "include_in_spending": True,
+        }
+
+    def _index_after(self, account_id: str, since: str | None) -> int:
+        """First index after a `since` cursor (a transaction ID or timestamp)."""
+        if since is None:
+            return 0
+        if since.startswith("tx_"):
+            return int(since.rsplit("_", 1)[1]) + 1
+        offset = datetime.fromisoformat(since.replace("Z", "+00:00")) - EPOCH
+        return max(0, -(-offset // INTERVAL))
+
+    def _build(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def check(request: Any, call_next: Any) -> Any:
+            if request.url.path == "/oauth2/token":
+                return await call_next(request)
+            self.requests += 1
+            if self.rate_limit_every and self.requests % self.rate_limit_every == 0:
+                return JSONResponse({"code": "too_many_requests"}, status_code=429, headers={"Retry-After": "0"})
+            if request.headers.get("authorization") != f"Bearer {self.access_token}":
+                return JSONResponse({"code": "unauthorized"}, status_code=401)
+            return await call_next(request)
+
+        @app.post("/oauth2/token")
+        async def token(request: Request) -> Any:  # type: ignore
+            # Refresh tokens are single use: refreshing replaces both tokens.
+            form = dict(parse_qsl((await request.body()).decode()))
+            if form.get("grant_type") != "refresh_token" or form.get("refresh_token") != self.refresh_token:
+                return JSONResponse({"code": "unauthorized.bad_refresh_token"}, status_code=401)
+            self.refreshes += 1
+            self.access_token = f"test-token-{self.refreshes}"
+            self.refresh_token = f"test-refresh-token-{self.refreshes}"
+            return {"access_token": self.access_token, "refresh_token": self.refresh_token, "expires_in": 21600}
+
+        @app.get("/accounts")
+        async def accounts() -> dict[str, Any]:  # type: ignore
+            return {"accounts": [{"id": id, "description": f"Account {id}", "closed": False} for id in self.account_ids]}
+
+        @app.get("/transactions")
+        async def transactions(  # type: ignore
+            account_id: str,
+            since: str | None = None,
+            before: str | None = None,
+            limit: int = Query(100, le=100),
+        ) -> dict[str, Any]:
+            if account_id not in self.account_ids:
+                raise HTTPException(status_code=404)
+            start = self._index_after(account_id, since)
+            end = min(start + limit, self.transactions_per_account)
+            if before is not None:
+                end = min(end, self._index_after(account_id, before))
+            return {"transactions": [self.transaction(account_id, i) for i in range(start, end)]}
+
+        return app
@@ -0,0 +1,64 @@
+"""
+Fake Resend API for tests.
+
+Records the emails it accepts, honours idempotency keys like Resend does (including refusing a key reused for
+different emails), and can be told to fail the next few requests, or to send them but lose the response. Use
+`FakeResend().app` with `httpx.ASGITransport`.
+"""
+
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class FakeResend:
+    def __init__(self, api_key: str = "re_test") -> None:
+        self.api_key = api_key
+        self.sent: list[dict[str, Any]] = []
+        self.requests = 0
+        self.failures: list[tuple[int, dict[str, str]]] = []
+        self.lost = 0
+        self.responses: dict[str, tuple[bytes, list[dict[str, str]]]] = {}
+        self.app = self._build()
+
+    def fail(self, status_code: int, times: int = 1, headers: dict[str, str] | None = None) -> None:
+        """Fail the next `times` requests with `status_code`."""
+        self.failures.extend([(status_code, headers or {})] * times)
+
+    def lose(self, times: int = 1) -> None:
+        """Send the next `times` requests' emails, but respond as if the request timed out."""
+        self.lost += times
+
+    def _build(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/emails/batch")
+        async def batch(request: Request) -> Any:  # type: ignore
+            self.requests += 1
+            if request.headers.get("authorization") != f"Bearer {self.api_key}":
+                return JSONResponse({"name": "missing_api_key"}, status_code=401)
+            if self.failures:
+                status_code, headers = self.failures.pop(0)
+                return JSONResponse({"name": "application_error"}, status_code=status_code, headers=headers)
+
+            key = request.headers["idempotency-key"]
+            body = await request.body()
+            if key in self.responses:
+                previous_body, data = self.responses[key]
+                if previous_body != body:
+                    return JSONResponse({"name": "invalid_idempotent_request"}, status_code=409)
+                return {"data": data}
+
+            emails: list[dict[str, Any]] = await request.json()
+            if len(emails) > 100 or any("@" not in address for email in emails for address in email["to"]):
+                return JSONResponse({"name": "validation_error"}, status_code=422)
+            self.sent.extend(emails)
+            data = [{"id": f"email_{len(self.sent) - len(emails) + i}"} for i in range(len(emails))]
+            self.responses[key] = (body, data)
+            if self.lost:
+                self.lost -= 1
+                return JSONResponse({"name": "gateway_timeout"}, status_code=504)
+            return {"data": data}
+
+        return app
@@ -0,0 +1,59 @@
+from app.v1.controllers.middleware.body_cache import BodyCache
+
+
+class TestBodyCache:
+    def test_get_missing_key(self):
+        cache = BodyCache(max_entries=2, max_bytes=100)
+
+        assert cache.get(b"a") is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+
+    def test_put_and_get(self):
+        cache = BodyCache(max_entries=2, max_bytes=100)
+
+        cache.put(b"a", b"value")
+
+        assert cache.get(b"a") == b"value"
+        assert cache.hits == 1
+        assert cache.size == 5
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = BodyCache(max_entries=2, max_bytes=100)
+        cache.put(b"a", b"1")
+        cache.put(b"b", b"2")
+        cache.get(b"a")
+
+        cache.put(b"c", b"3")
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == b"1"
+        assert cache.get(b"c") == b"3"
+        assert cache.evictions == 1
+
+    def test_evicts_to_stay_under_max_bytes(self):
+        cache = BodyCache(max_entries=10, max_bytes=10)
+        cache.put(b"a", b"x" * 6)
+
+        cache.put(b"b", b"y" * 6)
+
+        assert len(cache) == 1
+        assert cache.size == 6
+        assert cache.get(b"b") == b"y" * 6
+
+    def test_skips_values_larger_than_max_bytes(self):
+        cache = BodyCache(max_entries=10, max_bytes=10)
+
+        cache.put(b"a", b"x" * 11)
+
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_replacing_a_key_updates_size(self):
+        cache = BodyCache(max_entries=10, max_bytes=100)
+        cache.put(b"a", b"x" * 6)
+
+        cache.put(b"a", b"y" * 2)
+
+        assert len(cache) == 1
+        assert cache.size == 2
@@ -0,0 +1,118 @@
+import pytest
+
+from app.v1.controllers.middleware.html_processor import StreamingHTMLProcessor, minify_html
+
+DOCUMENT = b"""
+<!DOCTYPE html>
+<html>
+<head>
+    <!-- A comment -->
+    <title>Test   page</title>
+    <script>if (a < b) {   x = "<!-- not a comment -->"; }</script>
+</head>
+<body class="a   b">
+    <pre>  keep
+   this </pre>
+    <p>Hello    <b>World</b>, 1 < 2</p>
+    <textarea>  untouched  </textarea>
+</body>
+</html>
+"""
+
+EXPECTED = b"""<!DOCTYPE html>
+<html>
+<head>
+<title>Test page</title>
+<script>if (a < b) {   x = "<!-- not a comment -->"; }</script>
+</head>
+<body class="a   b">
+<pre>  keep
+   this </pre>
+<p>Hello <b>World</b>, 1 < 2</p>
+<textarea>  untouched  </textarea>
+</body>
+</html>"""
+
+
+class TestMinifyHTML:
+    def test_removes_comments_and_collapses_whitespace(self):
+        output, comments_removed = minify_html(DOCUMENT)
+
+        assert output == EXPECTED
+        assert comments_removed == 1
+
+    def test_empty_document(self):
+        assert minify_html(b"") == (b"", 0)
+
+    def test_whitespace_only_document(self):
+        assert minify_html(b" \n\t ") == (b"", 0)
+
+    def test_keeps_quoted_angle_brackets_in_attributes(self):
+        output, _ = minify_html(b'<div data-x="a > b">  x  </div>')
+
+        assert output == b'<div data-x="a > b"> x </div>'
+
+    def test_raw_text_end_tag_is_case_insensitive(self):
+        output, _ = minify_html(b"<SCRIPT>  a  </Script >  <p>  b  </p>")
+
+        assert output == b"<SCRIPT>  a  </Script > <p> b </p>"
+
+    def test_self_closing_raw_element_does_not_swallow_content(self):
+        output, _ = minify_html(b"<textarea/>  <p>  a  </p>")
+
+        assert output == b"<textarea/> <p> a </p>"
+
+    def test_unterminated_comment_is_removed(self):
+        output, comments_removed = minify_html(b"<p>a</p><!-- never closed")
+
+        assert output == b"<p>a</p>"
+        assert comments_removed == 1
+
+    def test_lone_angle_bracket_is_text(self):
+        output, _ = minify_html(b"<p>a <  b</p>")
+
+        assert output == b"<p>a < b</p>"
+
+
+class TestStreamingHTMLProcessor:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13, 64])
+    def test_output_is_independent_of_chunk_boundaries(self, chunk_size):
+        processor = StreamingHTMLProcessor()
+
+        chunks = [DOCUMENT[i : i + chunk_size] for i in range(0, len(DOCUMENT), chunk_size)]
+        output = b"".join(processor.feed(chunk) for chunk in chunks) + processor.close()
+
+        assert output == EXPECTED
+        assert processor.comments_removed == 1
+
+    def test_emits_output_before_close(self):
+        processor = StreamingHTMLProcessor()
+
+        assert processor.feed(b"<p>one</p>\n<p") == b"<p>one</p>"
+        assert processor.feed(b">two</p>") == b"\n<p>two</p>"
+        assert processor.close() == b""
+
+    def test_holds_back_partial_comment(self):
+        processor = StreamingHTMLProcessor()
+
+        assert processor.feed(b"<p>a</p><!") == b"<p>a</p>"
+        assert processor.feed(b"-- hidden -") == b""
+        assert processor.feed(b"-><p>b</p>") == b"<p>b</p>"
+        assert processor.comments_removed == 1
+
+    def test_comment_containing_angle_bracket_split_anywhere(self):
+        document = b"<p>a</p><!-- if x > y then z --><p>b</p>"
+
+        for split in range(1, len(document)):
+            processor = StreamingHTMLProcessor()
+            output = processor.feed(document[:split]) + processor.feed(document[split:]) + processor.close()
+
+            assert output == b"<p>a</p><p>b</p>", split
+            assert processor.comments_removed == 1
+
+    def test_holds_back_partial_raw_text_end_tag(self):
+        processor = StreamingHTMLProcessor()
+
+        assert processor.feed(b"<pre>  a  </pr") == b"<pre>  a  "
+        assert processor.feed(b"e>  b") == b"</pre> b"
+        assert processor.close() == b""
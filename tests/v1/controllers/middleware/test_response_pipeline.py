@@ -0,0 +1,174 @@
+from unittest.mock import Mock
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from app.v1.controllers.middleware.response_pipeline import ResponseContext, ResponsePipelineMiddleware
+
+
+class UpperTransform:
+    def feed(self, chunk: bytes) -> bytes:
+        return chunk.upper()
+
+    def close(self) -> bytes:
+        return b"!"
+
+
+class UpperStage:
+    name = "upper"
+
+    def __init__(self):
+        self.contexts: list[ResponseContext] = []
+
+    def open(self, context: ResponseContext):
+        self.contexts.append(context)
+        context.headers["x-upper"] = "1"
+        return UpperTransform()
+
+
+class SkipStage:
+    name = "skip"
+
+    def open(self, context: ResponseContext):
+        return None
+
+
+def make_app(*messages: Message):
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        for message in messages:
+            await send(message)
+
+    return app
+
+
+def start(content_length: int | None = None) -> Message:
+    headers = [(b"content-type", b"text/plain")]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    return {"type": "http.response.start", "status": 200, "headers": headers}
+
+
+def body(data: bytes, more_body: bool = False) -> Message:
+    return {"type": "http.response.body", "body": data, "more_body": more_body}
+
+
+async def run(middleware: ResponsePipelineMiddleware, method: str = "GET", scope_type: str = "http") -> list[Message]:
+    sent: list[Message] = []
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    scope = {"type": scope_type, "method": method, "path": "/", "headers": []}
+    await middleware(scope, Mock(), send)
+    return sent
+
+
+def header(message: Message, name: bytes) -> bytes | None:
+    return dict(message["headers"]).get(name)
+
+
+class TestResponsePipelineMiddleware:
+    @pytest.mark.asyncio
+    async def test_transforms_single_body(self):
+        middleware = ResponsePipelineMiddleware(make_app(start(5), body(b"hello")), stages=[UpperStage()])
+
+        sent = await run(middleware)
+
+        assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+        assert sent[1]["body"] == b"HELLO!"
+        assert header(sent[0], b"content-length") == b"6"
+        assert header(sent[0], b"x-upper") == b"1"
+
+    @pytest.mark.asyncio
+    async def test_transforms_streamed_body(self):
+        app = make_app(start(10), body(b"hello", more_body=True), body(b"world"))
+        middleware = ResponsePipelineMiddleware(app, stages=[UpperStage()])
+
+        sent = await run(middleware)
+
+        assert [message["body"] for message in sent[1:]] == [b"HELLO", b"WORLD!"]
+        assert [message["more_body"] for message in sent[1:]] == [True, False]
+        assert header(sent[0], b"content-length") is None
+
+    @pytest.mark.asyncio
+    async def test_chains_stages_in_order(self):
+        first, second = UpperStage(), UpperStage()
+        middleware = ResponsePipelineMiddleware(make_app(start(), body(b"a")), stages=[first, second])
+
+        sent = await run(middleware)
+
+        assert second.contexts[0].body == b"A!"
+        assert sent[1]["body"] == b"A!!"
+
+    @pytest.mark.asyncio
+    async def test_stage_sees_first_chunk_and_more_body(self):
+        stage = UpperStage()
+        app = make_app(start(), body(b"a", more_body=True), body(b""))
+        middleware = ResponsePipelineMiddleware(app, stages=[stage])
+
+        await run(middleware)
+
+        assert stage.contexts[0].body == b"a"
+        assert stage.contexts[0].more_body is True
+
+    @pytest.mark.asyncio
+    async def test_skipped_stages_leave_response_untouched(self):
+        middleware = ResponsePipelineMiddleware(make_app(start(5), body(b"hello")), stages=[SkipStage()])
+
+        sent = await run(middleware)
+
+        assert sent[1]["body"] == b"hello"
+        assert header(sent[0], b"content-length") == b"5"
+
+    @pytest.mark.asyncio
+    async def test_drops_empty_intermediate_chunks(self):
+        class BufferTransform(UpperTransform):
+            def feed(self, chunk: bytes) -> bytes:
+                return b""
+
+        class BufferStage:
+            name = "buffer"
+
+            def open(self, context: ResponseContext):
+                return BufferTransform()
+
+        app = make_app(start(), body(b"a", more_body=True), body(b"b", more_body=True), body(b""))
+        middleware = ResponsePipelineMiddleware(app, stages=[BufferStage()])
+
+        sent = await run(middleware)
+
+        assert [message["body"] for message in sent[1:]] == [b"", b"!"]
+
+    @pytest.mark.asyncio
+    async def test_passes_through_other_messages(self):
+        pathsend = {"type": "http.response.pathsend", "path": "/tmp/file"}
+        stage = UpperStage()
+        middleware = ResponsePipelineMiddleware(make_app(start(), pathsend), stages=[stage])
+
+        sent = await run(middleware)
+
+        assert sent == [start(), pathsend]
+        assert stage.contexts == []
+
+    @pytest.mark.asyncio
+    async def test_skips_head_requests(self):
+        stage = UpperStage()
+        middleware = ResponsePipelineMiddleware(make_app(start(5), body(b"")), stages=[stage])
+
+        sent = await run(middleware, method="HEAD")
+
+        assert header(sent[0], b"content-length") == b"5"
+        assert stage.contexts == []
+
+    @pytest.mark.asyncio
+    async def test_skips_non_http_scopes(self):
+        app = Mock(return_value=None)
+
+        async def inner(scope: Scope, receive: Receive, send: Send) -> None:
+            app(scope)
+
+        middleware = ResponsePipelineMiddleware(inner, stages=[UpperStage()])
+
+        await run(middleware, scope_type="websocket")
+
+        app.assert_called_once()
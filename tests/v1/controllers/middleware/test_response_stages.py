@@ -0,0 +1,156 @@
+import gzip
+
+import pytest
+from starlette.datastructures import MutableHeaders
+
+from app.v1.controllers.middleware.body_cache import BodyCache
+from app.v1.controllers.middleware.response_pipeline import ResponseContext
+from app.v1.controllers.middleware.response_stages import GZipStage, HTMLStage
+
+
+def make_context(
+    body: bytes = b"",
+    more_body: bool = False,
+    content_type: str = "text/html; charset=utf-8",
+    accept_encoding: str = "gzip, deflate",
+    content_encoding: str | None = None,
+) -> ResponseContext:
+    headers = MutableHeaders(raw=[(b"content-type", content_type.encode())])
+    if content_encoding:
+        headers["content-encoding"] = content_encoding
+    scope = {"type": "http", "path": "/test", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    return ResponseContext(scope=scope, headers=headers, body=body, more_body=more_body)
+
+
+def run(transform, *chunks: bytes) -> bytes:
+    return b"".join(transform.feed(chunk) for chunk in chunks) + transform.close()
+
+
+@pytest.fixture
+def html_with_comments():
+    return b"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <!-- This is a comment -->
+        <title>Test</title>
+    </head>
+    <body>
+        <!-- Another comment -->
+        <h1>Hello World</h1>
+    </body>
+    </html>
+    """
+
+
+class TestHTMLStage:
+    def test_minifies_html(self, html_with_comments):
+        transform = HTMLStage().open(make_context(html_with_comments))
+
+        output = run(transform, html_with_comments).decode()
+
+        assert "comment" not in output
+        assert "<h1>Hello World</h1>" in output
+        assert "\n\n" not in output
+
+    def test_minifies_across_chunks(self):
+        transform = HTMLStage().open(make_context(more_body=True))
+
+        output = run(transform, b"<p>Hello <!-- a com", b"ment -->   World</p>", b"\n\n<p>Again</p>")
+
+        assert output == b"<p>Hello World</p>\n<p>Again</p>"
+
+    def test_pretty_prettifies_html(self, html_with_comments):
+        transform = HTMLStage(pretty=True).open(make_context(html_with_comments))
+
+        assert transform.feed(html_with_comments) == b""
+        output = transform.close().decode()
+
+        assert "comment" not in output
+        assert " <h1>\n   Hello World\n  </h1>" in output
+
+    def test_caches_complete_bodies(self, html_with_comments):
+        cache = BodyCache(max_entries=10, max_bytes=10_000)
+        stage = HTMLStage(cache=cache)
+
+        first = run(stage.open(make_context(html_with_comments)), html_with_comments)
+        second = run(stage.open(make_context(html_with_comments)), html_with_comments)
+
+        assert first == second
+        assert "comment" not in first.decode()
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_pretty_and_minified_output_are_cached_separately(self, html_with_comments):
+        cache = BodyCache(max_entries=10, max_bytes=10_000)
+
+        minified = run(HTMLStage(cache=cache).open(make_context(html_with_comments)), html_with_comments)
+        pretty = run(HTMLStage(pretty=True, cache=cache).open(make_context(html_with_comments)), html_with_comments)
+
+        assert minified != pretty
+        assert len(cache) == 2
+
+    def test_does_not_cache_streamed_bodies(self):
+        cache = BodyCache(max_entries=10, max_bytes=10_000)
+
+        transform = HTMLStage(cache=cache).open(make_context(b"<p>a</p>", more_body=True))
+
+        assert run(transform, b"<p>a</p>", b"  <p>b</p>") == b"<p>a</p> <p>b</p>"
+        assert len(cache) == 0
+
+    def test_skips_non_html_content(self):
+        assert HTMLStage().open(make_context(b"{}", content_type="application/json")) is None
+
+    def test_skips_encoded_content(self):
+        assert HTMLStage().open(make_context(b"...", content_encoding="br")) is None
+
+
+class TestGZipStage:
+    def test_compresses_large_bodies(self):
+        context = make_context(b"x" * 1000)
+
+        transform = GZipStage(minimum_size=500).open(context)
+
+        assert gzip.decompress(run(transform, b"x" * 1000)) == b"x" * 1000
+        assert context.headers["content-encoding"] == "gzip"
+        assert context.headers["vary"] == "Accept-Encoding"
+
+    def test_caches_complete_bodies(self):
+        cache = BodyCache(max_entries=10, max_bytes=10_000)
+        stage = GZipStage(minimum_size=500, cache=cache)
+
+        first_context, second_context = make_context(b"x" * 1000), make_context(b"x" * 1000)
+        first = run(stage.open(first_context), b"x" * 1000)
+        second = run(stage.open(second_context), b"x" * 1000)
+
+        assert first == second
+        assert gzip.decompress(second) == b"x" * 1000
+        assert second_context.headers["content-encoding"] == "gzip"
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_does_not_cache_other_content(self):
+        cache = BodyCache(max_entries=10, max_bytes=10_000)
+        context = make_context(b"[]" * 500, content_type="application/json")
+
+        output = run(GZipStage(minimum_size=500, cache=cache).open(context), b"[]" * 500)
+
+        assert gzip.decompress(output) == b"[]" * 500
+        assert len(cache) == 0
+
+    def test_compresses_streamed_bodies_regardless_of_size(self):
+        transform = GZipStage(minimum_size=500).open(make_context(b"a", more_body=True))
+
+        assert gzip.decompress(run(transform, b"a", b"b")) == b"ab"
+
+    def test_skips_small_bodies(self):
+        assert GZipStage(minimum_size=500).open(make_context(b"x" * 499)) is None
+
+    def test_skips_clients_without_gzip(self):
+        assert GZipStage(minimum_size=0).open(make_context(b"x", accept_encoding="br")) is None
+
+    def test_skips_encoded_content(self):
+        assert GZipStage(minimum_size=0).open(make_context(b"x", content_encoding="br")) is None
+
+    def test_skips_event_streams(self):
+        context = make_context(b"x", more_body=True, content_type="text/event-stream")
+
+        assert GZipStage(minimum_size=0).open(context) is None
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from app.config.async_database import get_async_database
+from app.config.response_cache import ResponseCache
+from app.v1.controllers.cached import cached_response
+from app.v1.repositories.change_counters import bump
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(ttl=60, stale_ttl=60, max_entries=10)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def client(migrated_database, cache, calls):
+    app = FastAPI()
+
+    @app.get("/page")
+    @cached_response("transactions", cache=cache)
+    async def page(request: Request, q: str = ""):
+        calls.append(q)
+        return HTMLResponse(f"<p>{q} {len(calls)}</p>", headers={"X-Page": "yes"})
+
+    return TestClient(app)
+
+
+class TestCachedResponse:
+    def test_serves_repeat_requests_from_the_cache(self, client, calls):
+        first = client.get("/page", params={"q": "a"})
+        second = client.get("/page", params={"q": "a"})
+
+        assert second.text == first.text == "<p>a 1</p>"
+        assert second.headers["x-page"] == "yes"
+        assert second.headers["content-type"].startswith("text/html")
+        assert calls == ["a"]
+
+    def test_arguments_are_part_of_the_key(self, client, calls):
+        client.get("/page", params={"q": "a"})
+        client.get("/page", params={"q": "b"})
+        client.get("/page", params={"q": "a"}, headers={"HX-Request": "true"})
+
+        assert calls == ["a", "b", "a"]
+
+    @pytest.mark.asyncio
+    async def test_new_data_is_a_miss(self, client, calls):
+        client.get("/page")
+
+        await get_async_database().write(lambda conn: bump(conn, "transactions"))
+        response = client.get("/page")
+
+        assert response.text == "<p> 2</p>"
+
+    def test_invalidate(self, client, cache, calls):
+        client.get("/page")
+
+        cache.invalidate("transactions")
+        client.get("/page")
+
+        assert len(calls) == 2
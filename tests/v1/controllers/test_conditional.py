@@ -0,0 +1,109 @@
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from app.config.async_database import get_async_database
+from app.v1.controllers.conditional import ConditionalRoute, conditional
+from app.v1.controllers.middleware.response_pipeline import ResponsePipelineMiddleware
+from app.v1.controllers.middleware.response_stages import GZipStage
+from app.v1.repositories.change_counters import bump
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def app(migrated_database, calls):
+    router = APIRouter(route_class=ConditionalRoute)
+
+    @router.get("/page", dependencies=[Depends(conditional("transactions"))])
+    async def page(q: str = ""):
+        calls.append(q)
+        return HTMLResponse(f"<p>{q}</p>")
+
+    @router.get("/plain")
+    async def plain():
+        return {"ok": True}
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return TestClient(app)
+
+
+class TestConditional:
+    def test_adds_etag(self, client):
+        response = client.get("/page")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_not_modified_skips_the_route(self, client, calls):
+        etag = client.get("/page").headers["etag"]
+
+        response = client.get("/page", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert calls == [""]
+
+    def test_not_modified_through_gzip(self, app, calls):
+        app.add_middleware(ResponsePipelineMiddleware, stages=[GZipStage(minimum_size=0)])
+        client = TestClient(app, headers={"Accept-Encoding": "gzip"})
+        response = client.get("/page", params={"q": "x" * 100})
+        assert response.headers["content-encoding"] == "gzip"
+
+        response = client.get("/page", params={"q": "x" * 100}, headers={"If-None-Match": response.headers["etag"]})
+
+        assert response.status_code == 304
+        assert response.headers["etag"].startswith('W/"')
+        assert calls == ["x" * 100]
+
+    @pytest.mark.asyncio
+    async def test_changes_when_the_data_does(self, client):
+        etag = client.get("/page").headers["etag"]
+
+        await get_async_database().write(lambda conn: bump(conn, "transactions"))
+        response = client.get("/page", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.parametrize(
+        ("params", "headers", "cookies"),
+        [
+            ({"q": "other"}, {}, {}),
+            ({}, {"HX-Request": "true"}, {}),
+            ({}, {}, {"turbofox.session_id": "someone"}),
+        ],
+    )
+    def test_varies_with_the_request(self, client, params, headers, cookies):
+        etag = client.get("/page").headers["etag"]
+        client.cookies.update(cookies)
+
+        response = client.get("/page", params=params, headers=headers | {"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_history_restore_does_not_match_the_fragment(self, client):
+        etag = client.get("/page", headers={"HX-Request": "true"}).headers["etag"]
+
+        response = client.get(
+            "/page", headers={"HX-Request": "true", "HX-History-Restore-Request": "true", "If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_routes_without_the_dependency_are_untouched(self, client):
+        assert "etag" not in client.get("/plain").headers
@@ -0,0 +1,22 @@
+import pytest
+
+from app.v1.controllers.etags import etag_matches
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize(
+        ("if_none_match", "expected"),
+        [
+            (None, False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"other", "abc"', True),
+            ("*", True),
+            ('"other"', False),
+        ],
+    )
+    def test_matches(self, if_none_match, expected):
+        assert etag_matches(if_none_match, '"abc"') is expected
+
+    def test_weak_etag_matches_strong_tag(self):
+        assert etag_matches('"abc"', 'W/"abc"')
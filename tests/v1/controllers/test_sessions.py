@@ -0,0 +1,34 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.settings import settings
+from app.v1.controllers.sessions import current_session
+from app.v1.repositories.sessions import Session
+from app.v1.services.sessions import session_store
+
+
+@pytest.fixture
+def client(migrated_database):
+    app = FastAPI()
+
+    @app.get("/")
+    async def index(session: Session | None = Depends(current_session)):
+        return session.data if session else None
+
+    return TestClient(app)
+
+
+class TestCurrentSession:
+    @pytest.mark.asyncio
+    async def test_session_from_cookie(self, client):
+        session = await session_store.create({"user": "jd"})
+
+        client.cookies[settings.session_cookie_name] = session.id
+        assert client.get("/").json() == {"user": "jd"}
+
+    def test_no_session(self, client):
+        assert client.get("/").json() is None
+
+        client.cookies[settings.session_cookie_name] = "unknown"
+        assert client.get("/").json() is None
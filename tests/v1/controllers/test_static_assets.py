@@ -0,0 +1,128 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.v1.controllers.static_assets import IMMUTABLE, StaticAssets, build_assets
+
+SCRIPT = b"console.log('hello');\n" * 100
+
+
+@pytest.fixture
+def source(tmp_path):
+    source = tmp_path / "static"
+    (source / "js").mkdir(parents=True)
+    (source / "js" / "app.js").write_bytes(SCRIPT)
+    (source / "js" / "app-copy.js").write_bytes(SCRIPT)
+    (source / "logo.png").write_bytes(b"\x89PNG not really")
+    return source
+
+
+@pytest.fixture
+def manifest(source, tmp_path):
+    return build_assets(source, tmp_path / "build")
+
+
+@pytest.fixture
+def client(manifest):
+    app = FastAPI()
+    app.mount("/static", StaticAssets(manifest))
+    return TestClient(app)
+
+
+class TestBuildAssets:
+    def test_urls_are_fingerprinted(self, manifest):
+        url = manifest.url("js/app.js")
+
+        assert url.startswith("/static/js/app-copy.") or url.startswith("/static/js/app.")
+        assert url.endswith(".js")
+        assert manifest.url("/logo.png").startswith("/static/logo.")
+
+    def test_identical_files_share_one_copy(self, manifest, tmp_path):
+        assert manifest.url("js/app.js") == manifest.url("js/app-copy.js")
+        assert len(list((tmp_path / "build" / "js").glob("*.js"))) == 1
+
+    def test_text_is_precompressed(self, manifest):
+        asset = manifest.assets["js/app.js"]
+
+        assert "gzip" in asset.encodings
+        assert gzip.decompress(asset.file.with_name(asset.file.name + ".gz").read_bytes()) == SCRIPT
+        assert manifest.assets["logo.png"].encodings == ()
+
+    def test_rebuild_reuses_output(self, source, manifest, tmp_path):
+        variant = manifest.assets["js/app.js"].file.with_name(manifest.assets["js/app.js"].file.name + ".gz")
+        variant.write_bytes(b"reused")
+
+        rebuilt = build_assets(source, tmp_path / "build")
+
+        assert rebuilt.url("js/app.js") == manifest.url("js/app.js")
+        assert variant.read_bytes() == b"reused"
+
+    def test_changed_content_changes_the_url(self, source, manifest, tmp_path):
+        (source / "js" / "app-copy.js").write_bytes(b"changed")
+
+        rebuilt = build_assets(source, tmp_path / "build")
+
+        assert rebuilt.url("js/app-copy.js") != manifest.url("js/app-copy.js")
+
+    def test_generated_files(self, source, tmp_path):
+        manifest = build_assets(source, tmp_path / "build", generated={"css/app.css": b"body { margin: 0 }"})
+
+        asset = manifest.assets["css/app.css"]
+        assert asset.url.startswith("/static/css/app.")
+        assert asset.file.read_bytes() == b"body { margin: 0 }"
+
+    def test_unknown_path(self, manifest):
+        with pytest.raises(KeyError):
+            manifest.url("js/missing.js")
+
+
+class TestStaticAssets:
+    def test_fingerprinted_url_is_immutable(self, client, manifest):
+        response = client.get(manifest.url("js/app.js"), headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.content == SCRIPT
+        assert response.headers["cache-control"] == IMMUTABLE
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert "content-encoding" not in response.headers
+
+    def test_source_path_is_revalidated(self, client):
+        response = client.get("/static/js/app.js", headers={"Accept-Encoding": "identity"})
+
+        assert response.content == SCRIPT
+        assert response.headers["cache-control"] == "no-cache"
+
+    def test_serves_precompressed_gzip(self, client, manifest):
+        response = client.get(manifest.url("js/app.js"), headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == SCRIPT
+
+    def test_refused_encoding_is_not_used(self, client, manifest):
+        response = client.get(manifest.url("js/app.js"), headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+        assert "content-encoding" not in response.headers
+
+    def test_encodings_have_their_own_etag(self, client, manifest):
+        gzipped = client.get(manifest.url("js/app.js"), headers={"Accept-Encoding": "gzip"})
+        identity = client.get(manifest.url("js/app.js"), headers={"Accept-Encoding": "identity"})
+
+        assert gzipped.headers["etag"] != identity.headers["etag"]
+
+    def test_not_modified(self, client, manifest):
+        headers = {"Accept-Encoding": "gzip"}
+        etag = client.get(manifest.url("js/app.js"), headers=headers).headers["etag"]
+
+        response = client.get(manifest.url("js/app.js"), headers=headers | {"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_not_found(self, client):
+        assert client.get("/static/js/missing.js").status_code == 404
+
+    def test_method_not_allowed(self, client, manifest):
+        assert client.post(manifest.url("js/app.js")).status_code == 405
@@ -0,0 +1,92 @@
+import pytest
+from starlette.requests import Request
+
+from app.v1.controllers import templates as templates_module
+from app.v1.controllers.templates import create_environment, highlight, money, render, render_block
+
+
+class TestFilters:
+    def test_highlight_escapes_text_and_marks_matches(self):
+        assert highlight("\x02Fish\x03 & <Chips>") == "<mark>Fish</mark> &amp; &lt;Chips&gt;"
+
+    def test_highlight_none(self):
+        assert highlight(None) == ""
+
+    def test_money(self):
+        assert money(-123456) == "-1,234.56"
+        assert money(5) == "0.05"
+
+
+def make_request(headers: dict[str, str] | None = None) -> Request:
+    raw_headers = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers, "query_string": b""})
+
+
+class TestRender:
+    @pytest.fixture(autouse=True)
+    def env(self, tmp_path, monkeypatch):
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "layout.html").write_text(
+            "<html><nav>Nav</nav><main>{% block content %}{% endblock %}</main></html>"
+        )
+        (tmp_path / "templates" / "page.html").write_text(
+            '{% extends "layout.html" %}{% block content %}<h1>{{ title }}</h1>'
+            '<ul id="items">{% block items %}{% for item in items %}<li>{{ item }}</li>{% endfor %}{% endblock %}</ul>'
+            "{% endblock %}"
+        )
+        (tmp_path / "templates" / "partial.html").write_text("<li>{{ title }}</li>")
+        env = create_environment(tmp_path / "templates", auto_reload=False, bytecode_cache_dir=str(tmp_path))
+        monkeypatch.setattr(templates_module.templates, "env", env)
+        return env
+
+    def test_full_page_without_htmx(self):
+        response = render(make_request(), "page.html", {"title": "<Hi>", "items": [1]})
+
+        assert response.body == b"<html><nav>Nav</nav><main><h1>&lt;Hi&gt;</h1><ul id=\"items\"><li>1</li></ul></main></html>"
+        assert response.headers["vary"] == "HX-Request, HX-Target, HX-History-Restore-Request"
+
+    def test_htmx_gets_the_content_block(self):
+        response = render(make_request({"HX-Request": "true"}), "page.html", {"title": "Hi", "items": [1]})
+
+        assert response.body == b'<h1>Hi</h1><ul id="items"><li>1</li></ul>'
+
+    def test_htmx_gets_the_targeted_block(self):
+        request = make_request({"HX-Request": "true", "HX-Target": "items"})
+
+        response = render(request, "page.html", {"title": "Hi", "items": [1, 2]})
+
+        assert response.body == b"<li>1</li><li>2</li>"
+
+    def test_history_restore_gets_the_full_page(self):
+        request = make_request({"HX-Request": "true", "HX-History-Restore-Request": "true"})
+
+        response = render(request, "page.html", {"title": "Hi", "items": []})
+
+        assert response.body.startswith(b"<html>")
+
+    def test_template_without_blocks_renders_whole(self):
+        response = render(make_request({"HX-Request": "true"}), "partial.html", {"title": "Hi"})
+
+        assert response.body == b"<li>Hi</li>"
+
+    def test_render_block(self):
+        assert render_block("page.html", "items", {"items": ["a"]}) == "<li>a</li>"
+
+    def test_compiled_templates_are_cached_on_disk(self, tmp_path, env):
+        env.get_template("partial.html")
+
+        assert list(tmp_path.glob("__jinja2_*.cache"))
+
+    def test_templates_are_not_reloaded(self, tmp_path, env):
+        render(make_request(), "partial.html", {"title": "Hi"})
+        (tmp_path / "templates" / "partial.html").write_text("<p>{{ title }}</p>")
+
+        assert render(make_request(), "partial.html", {"title": "Hi"}).body == b"<li>Hi</li>"
+
+
+class TestBaseTemplate:
+    def test_links_fingerprinted_stylesheet_instead_of_the_tailwind_compiler(self):
+        html = render(make_request(), "base.html").body.decode()
+
+        assert 'rel="stylesheet" href="/static/css/app.' in html
+        assert "tailwindcss" not in html
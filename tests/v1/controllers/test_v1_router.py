@@ -1,3 +1,5 @@
+import sqlite3
+from contextlib import closing
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -5,10 +7,16 @@ from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.testclient import TestClient
 
+from app.config.sql_profiler import SQLProfiler
 from app.v1.controllers.v1_router import index, lifespan, router
 
 
 class TestLifespan:
+    @pytest.fixture(autouse=True)
+    def mock_run_data_migrations(self):
+        with patch("app.v1.controllers.v1_router.run_data_migrations") as mock:
+            yield mock
+
     @pytest.mark.asyncio
     @patch("app.v1.controllers.v1_router.upgrade")
     async def test_lifespan_calls_upgrade(self, mock_upgrade: MagicMock):
@@ -19,6 +27,43 @@ class TestLifespan:
         
         mock_upgrade.assert_called_once()
 
+    @pytest.mark.asyncio
+    @patch("app.v1.controllers.v1_router.upgrade")
+    @patch("app.v1.controllers.v1_router.close_pool")
+    async def test_lifespan_closes_pool_on_shutdown(self, mock_close_pool: MagicMock, _: MagicMock):
+        app = FastAPI()
+
+        async with lifespan(app):
+            mock_close_pool.assert_not_called()
+
+        mock_close_pool.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("app.v1.controllers.v1_router.upgrade")
+    async def test_lifespan_runs_and_stops_data_migrations(self, _: MagicMock, mock_run_data_migrations: MagicMock):
+        app = FastAPI()
+
+        async with lifespan(app):
+            pass
+
+        mock_run_data_migrations.assert_called_once()
+        [stop] = mock_run_data_migrations.call_args.args
+        assert stop.is_set()
+
+    @pytest.mark.asyncio
+    @patch("app.v1.controllers.v1_router.upgrade")
+    @patch("app.v1.controllers.v1_router.logfire")
+    async def test_lifespan_logs_failed_data_migrations(
+        self, mock_logfire: MagicMock, _: MagicMock, mock_run_data_migrations: MagicMock
+    ):
+        mock_run_data_migrations.side_effect = RuntimeError("boom")
+        app = FastAPI()
+
+        async with lifespan(app):
+            pass
+
+        mock_logfire.exception.assert_called_once()
+
 
 class TestRouter:
     def test_router_configuration(self):
@@ -35,9 +80,214 @@ class TestRouter:
         assert response.status_code == 307
         assert response.headers["location"] == "/v5/budget"
 
+    def test_debug_sql_endpoint(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+        profiler = SQLProfiler()
+        profiler.record("SELECT * FROM t WHERE id = 1", 0.002, 1)
+        profiler.record("SELECT 1", 0.001, 1)
+
+        with patch("app.v1.controllers.v1_router.profiler", profiler):
+            response = client.get("/v1/debug/sql", params={"limit": 1})
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {
+                "fingerprint": "SELECT * FROM t WHERE id = ?",
+                "count": 1,
+                "total_ms": 2.0,
+                "mean_ms": 2.0,
+                "p50_ms": 2.0,
+                "p95_ms": 2.0,
+                "rows": 1,
+            }
+        ]
+
+    def test_debug_sql_endpoint_hidden_outside_debug(self):
+        app = FastAPI()
+        app.include_router(router)
+        client = TestClient(app)
+
+        with patch("app.v1.controllers.v1_router.settings.debug", False):
+            response = client.get("/v1/debug/sql")
+
+        assert response.status_code == 404
+
     @pytest.mark.asyncio
     async def test_index_endpoint_returns_redirect_response(self):
         response = await index()
         
         assert isinstance(response, RedirectResponse)
         assert response.headers["location"] == "/v5/budget"
+
+
+class TestMonzoWebhook:
+    EVENT = {
+        "type": "transaction.created",
+        "data": {
+            "id": "tx_1",
+            "account_id": "acc_1",
+            "amount": -350,
+            "currency": "GBP",
+            "created": "2024-01-01T12:00:00.000Z",
+            "settled": "",
+            "description": "PRET A MANGER",
+            "category": "eating_out",
+            "merchant": {"id": "merch_1", "name": "Pret A Manger"},
+        },
+    }
+
+    @pytest.fixture
+    def client(self, migrated_database):
+        app = FastAPI()
+        app.include_router(router)
+        with patch("app.v1.controllers.v1_router.settings.monzo_webhook_secret", "s3cret"):
+            yield TestClient(app)
+
+    def test_stores_transaction(self, client, migrated_database):
+        response = client.post("/v1/webhooks/monzo", params={"secret": "s3cret"}, json=self.EVENT)
+
+        assert response.status_code == 204
+        with closing(sqlite3.connect(migrated_database)) as conn:
+            rows = conn.execute("SELECT id, amount, merchant_name FROM transactions").fetchall()
+        assert rows == [("tx_1", -350, "Pret A Manger")]
+
+    def test_rejects_wrong_secret(self, client):
+        response = client.post("/v1/webhooks/monzo", params={"secret": "wrong"}, json=self.EVENT)
+
+        assert response.status_code == 403
+
+    def test_ignores_other_events(self, client):
+        response = client.post("/v1/webhooks/monzo", params={"secret": "s3cret"}, json={"type": "other", "data": {}})
+
+        assert response.status_code == 204
+
+    def test_rejects_invalid_transaction(self, client):
+        event = {"type": "transaction.created", "data": {"id": "tx_1"}}
+
+        response = client.post("/v1/webhooks/monzo", params={"secret": "s3cret"}, json=event)
+
+        assert response.status_code == 422
+
+    def test_disabled_without_secret(self):
+        app = FastAPI()
+        app.include_router(router)
+
+        response = TestClient(app).post("/v1/webhooks/monzo", json=self.EVENT)
+
+        assert response.status_code == 404
+
+
+class TestSearchTransactions:
+    @pytest.fixture
+    def client(self, migrated_database):
+        with closing(sqlite3.connect(migrated_database)) as conn, conn:
+            conn.execute(
+                "INSERT INTO transactions (id, account_id, amount, currency, created_at, description, merchant_name) "
+                "VALUES ('tx_1', 'acc_1', -350, 'GBP', '2024-01-01T12:00:00.000Z', 'PRET <LDN>', 'Pret A Manger')"
+            )
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_renders_results_partial(self, client):
+        response = client.get("/v1/transactions/search", params={"q": "pret"})
+
+        assert response.status_code == 200
+        assert "<html" not in response.text
+        assert "<mark>Pret</mark> A Manger" in response.text
+        assert "<mark>PRET</mark> &lt;LDN&gt;" in response.text
+        assert "-3.50 GBP" in response.text
+
+    def test_renders_no_results(self, client):
+        response = client.get("/v1/transactions/search", params={"q": "tesco"})
+
+        assert "No matching transactions" in response.text
+
+
+class TestTransactionRows:
+    @pytest.fixture
+    def client(self, migrated_database):
+        with closing(sqlite3.connect(migrated_database)) as conn, conn:
+            conn.executemany(
+                "INSERT INTO transactions (id, account_id, amount, currency, created_at, description) "
+                "VALUES (?, 'acc_1', -100, 'GBP', ?, ?)",
+                [(f"tx_{i}", f"2024-01-01T00:00:{i:02d}.000Z", f"Merchant {i}") for i in range(5)],
+            )
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_renders_rows_with_next_page_loader(self, client):
+        response = client.get("/v1/transactions/rows", params={"limit": 3})
+
+        assert response.status_code == 200
+        assert response.text.count("<tr") == 4
+        assert "Merchant 4" in response.text
+        assert 'hx-get="/v1/transactions/rows?cursor=' in response.text
+
+    def test_follows_the_cursor_to_the_last_page(self, client):
+        first = client.get("/v1/transactions/rows", params={"limit": 3})
+        url = first.text.split('hx-get="')[1].split('"')[0].replace("&amp;", "&")
+
+        second = client.get(url)
+
+        assert "Merchant 1" in second.text and "Merchant 0" in second.text
+        assert "Merchant 2" not in second.text
+        assert "hx-get" not in second.text
+
+    def test_invalid_cursor(self, client):
+        response = client.get("/v1/transactions/rows", params={"cursor": "nope"})
+
+        assert response.status_code == 400
+
+
+class TestSpendingChart:
+    @pytest.fixture
+    def client(self, migrated_database):
+        with closing(sqlite3.connect(migrated_database)) as conn, conn:
+            conn.executemany(
+                "INSERT INTO transactions (id, account_id, amount, currency, created_at) "
+                "VALUES (?, 'acc_1', ?, 'GBP', ?)",
+                [(f"tx_{i}", -100 * (i + 1), f"2024-01-{i + 1:02d}T12:00:00.000Z") for i in range(10)],
+            )
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_returns_columnar_series(self, client):
+        response = client.get("/v1/charts/spending", params={"bucket": 86400, "width": 5})
+
+        assert response.status_code == 200
+        series = response.json()
+        assert set(series) == {"t", "v"}
+        assert len(series["t"]) == len(series["v"]) == 5
+        assert series["t"][0] == 1704067200
+        assert series["v"][0] == 100 and series["v"][-1] == 1000
+
+    def test_not_modified_when_etag_matches(self, client):
+        etag = client.get("/v1/charts/spending").headers["etag"]
+
+        response = client.get("/v1/charts/spending", headers={"If-None-Match": f'"other", {etag.removeprefix("W/")}'})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_not_modified_skips_the_query(self, client):
+        etag = client.get("/v1/charts/spending").headers["etag"]
+
+        with patch("app.v1.controllers.v1_router.ChartService") as mock_service:
+            response = client.get("/v1/charts/spending", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        mock_service.assert_not_called()
+
+    def test_etag_changes_with_the_series(self, client):
+        etag = client.get("/v1/charts/spending").headers["etag"]
+
+        response = client.get("/v1/charts/spending", params={"width": 3}, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
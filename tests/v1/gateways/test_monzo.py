@@ -0,0 +1,225 @@
+import asyncio
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from app.v1.gateways import monzo
+from app.v1.gateways.monzo import (
+    MonzoGateway,
+    MonzoTransaction,
+    close_monzo_client,
+    get_monzo_client,
+    refresh_access_token,
+)
+from tests.fakes.monzo import FakeMonzo
+
+
+async def token() -> str:
+    return "test-token"
+
+
+def gateway_for(fake: FakeMonzo, **kwargs) -> MonzoGateway:
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url="http://monzo")
+    return MonzoGateway(client, token, **kwargs)
+
+
+class TestMonzoTransaction:
+    def test_unsettled_and_merchantless(self):
+        transaction = MonzoTransaction.model_validate(
+            {
+                "id": "tx_1",
+                "account_id": "acc_1",
+                "amount": 100,
+                "currency": "GBP",
+                "created": "2024-01-01T00:00:00Z",
+                "settled": "",
+                "merchant": "",
+            }
+        )
+
+        assert transaction.settled is None
+        assert transaction.merchant is None
+
+    def test_unexpanded_merchant(self):
+        transaction = MonzoTransaction.model_validate(
+            {
+                "id": "tx_1",
+                "account_id": "acc_1",
+                "amount": 100,
+                "currency": "GBP",
+                "created": "2024-01-01T00:00:00Z",
+                "merchant": "merch_1",
+            }
+        )
+
+        assert transaction.merchant is not None
+        assert transaction.merchant.id == "merch_1"
+
+
+class TestMonzoGateway:
+    @pytest.mark.asyncio
+    async def test_list_accounts(self):
+        gateway = gateway_for(FakeMonzo(accounts=3))
+
+        accounts = await gateway.list_accounts()
+
+        assert [account.id for account in accounts] == ["acc_0000", "acc_0001", "acc_0002"]
+
+    @pytest.mark.asyncio
+    async def test_pages_through_all_transactions(self):
+        fake = FakeMonzo(accounts=1, transactions_per_account=250)
+        gateway = gateway_for(fake)
+
+        pages = [page async for page in gateway.iter_transaction_pages("acc_0000")]
+
+        assert [len(page) for page in pages] == [100, 100, 50]
+        ids = [transaction.id for page in pages for transaction in page]
+        assert ids == [f"tx_acc_0000_{i:08d}" for i in range(250)]
+
+    @pytest.mark.asyncio
+    async def test_full_last_page_needs_one_more_request(self):
+        fake = FakeMonzo(accounts=1, transactions_per_account=200)
+        gateway = gateway_for(fake)
+
+        pages = [page async for page in gateway.iter_transaction_pages("acc_0000")]
+
+        assert [len(page) for page in pages] == [100, 100]
+        assert fake.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_since_transaction_id(self):
+        gateway = gateway_for(FakeMonzo(accounts=1, transactions_per_account=50))
+
+        pages = [page async for page in gateway.iter_transaction_pages("acc_0000", since="tx_acc_0000_00000039")]
+
+        assert [transaction.id for transaction in pages[0]][0] == "tx_acc_0000_00000040"
+        assert len(pages[0]) == 10
+
+    @pytest.mark.asyncio
+    async def test_since_and_before_timestamps(self):
+        fake = FakeMonzo(accounts=1, transactions_per_account=50)
+        gateway = gateway_for(fake)
+        since = datetime.fromisoformat(fake.transaction("acc_0000", 10)["created"])
+        before = datetime.fromisoformat(fake.transaction("acc_0000", 20)["created"])
+
+        pages = [page async for page in gateway.iter_transaction_pages("acc_0000", since=since, before=before)]
+
+        assert [transaction.id[-2:] for transaction in pages[0]] == [f"{i:02d}" for i in range(10, 20)]
+
+    @pytest.mark.asyncio
+    async def test_iter_transactions_fetches_every_account(self):
+        gateway = gateway_for(FakeMonzo(accounts=4, transactions_per_account=230))
+
+        transactions = [transaction async for transaction in gateway.iter_transactions()]
+
+        assert len(transactions) == 4 * 230
+        assert len({transaction.id for transaction in transactions}) == 4 * 230
+
+    @pytest.mark.asyncio
+    async def test_iter_transactions_skips_closed_accounts(self):
+        fake = FakeMonzo(accounts=2, transactions_per_account=5)
+        gateway = gateway_for(fake)
+        accounts = await gateway.list_accounts()
+        accounts[1].closed = True
+
+        async def list_accounts():
+            return accounts
+
+        gateway.list_accounts = list_accounts  # type: ignore
+
+        transactions = [transaction async for transaction in gateway.iter_transactions()]
+
+        assert {transaction.account_id for transaction in transactions} == {"acc_0000"}
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limited_requests(self):
+        fake = FakeMonzo(accounts=1, transactions_per_account=250, rate_limit_every=2)
+        gateway = gateway_for(fake)
+
+        transactions = [transaction async for transaction in gateway.iter_transactions(["acc_0000"])]
+
+        assert len(transactions) == 250
+        assert fake.requests == 5
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        fake = FakeMonzo(accounts=1, rate_limit_every=1)
+        gateway = gateway_for(fake, max_retries=2)
+
+        with pytest.raises(httpx.HTTPStatusError) as excinfo:
+            await gateway.list_accounts()
+
+        assert excinfo.value.response.status_code == 429
+        assert fake.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_without_retry_after_backs_off(self):
+        gateway = gateway_for(FakeMonzo(), backoff=1.0, max_backoff=5.0)
+        response = httpx.Response(503)
+
+        assert 1.0 <= gateway._retry_delay(response, 0) <= 2.0
+        assert gateway._retry_delay(response, 10) == 5.0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_the_consumer(self):
+        gateway = gateway_for(FakeMonzo(accounts=1))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            [transaction async for transaction in gateway.iter_transactions(["acc_0000", "acc_missing"])]
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_is_not_retried(self):
+        fake = FakeMonzo(access_token="other")
+        gateway = gateway_for(fake)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await gateway.list_accounts()
+
+        assert fake.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_stopping_early_cancels_fetches(self):
+        fake = FakeMonzo(accounts=3, transactions_per_account=10_000)
+        gateway = gateway_for(fake)
+
+        stream = gateway.iter_transactions(concurrency=1)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        requests = fake.requests
+        await asyncio.sleep(0.05)
+
+        assert fake.requests == requests
+        assert requests < 20
+
+
+class TestRefreshAccessToken:
+    @pytest.mark.asyncio
+    async def test_exchanges_the_refresh_token(self):
+        fake = FakeMonzo()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url="http://monzo")
+
+        token = await refresh_access_token(client, "test-refresh-token")
+
+        assert token.access_token == "test-token-1"
+        assert (token.refresh_token, token.expires_in) == ("test-refresh-token-1", 21600)
+        with pytest.raises(httpx.HTTPStatusError):
+            await refresh_access_token(client, "test-refresh-token")
+
+
+class TestMonzoClient:
+    @pytest.mark.asyncio
+    async def test_shared_client(self):
+        client = get_monzo_client()
+
+        assert get_monzo_client() is client
+        assert str(client.base_url).startswith("https://api.monzo.com")
+
+        await close_monzo_client()
+        assert monzo._client is None
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_without_client(self):
+        await close_monzo_client()
@@ -0,0 +1,86 @@
+import httpx
+import pytest
+
+from app.v1.gateways import resend
+from app.v1.gateways.resend import ResendEmail, ResendError, ResendGateway, close_resend_client, get_resend_client
+from tests.fakes.resend import FakeResend
+
+
+@pytest.fixture
+def fake():
+    return FakeResend()
+
+
+@pytest.fixture
+def gateway(fake):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url="http://resend")
+    return ResendGateway(client, "re_test")
+
+
+def email(to: str = "jd@example.com") -> ResendEmail:
+    return ResendEmail(sender="TurboFox <hi@turbofox.dev>", to=[to], subject="Hello", text="Hi")
+
+
+class TestResendGateway:
+    @pytest.mark.asyncio
+    async def test_send_batch(self, gateway, fake):
+        ids = await gateway.send_batch([email(), email("other@example.com")], "key")
+
+        assert ids == ["email_0", "email_1"]
+        assert fake.sent[0] == {
+            "from": "TurboFox <hi@turbofox.dev>",
+            "to": ["jd@example.com"],
+            "subject": "Hello",
+            "text": "Hi",
+        }
+
+    @pytest.mark.asyncio
+    async def test_idempotency_key(self, gateway, fake):
+        first = await gateway.send_batch([email()], "key")
+        second = await gateway.send_batch([email()], "key")
+
+        assert first == second
+        assert len(fake.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_retryable_errors(self, gateway, fake):
+        fake.fail(429, headers={"Retry-After": "7"})
+
+        with pytest.raises(ResendError) as error:
+            await gateway.send_batch([email()], "key")
+
+        assert error.value.retryable
+        assert error.value.retry_after == 7
+
+    @pytest.mark.asyncio
+    async def test_rejected_batches_arent_retryable(self, gateway):
+        with pytest.raises(ResendError) as error:
+            await gateway.send_batch([email("nobody")], "key")
+
+        assert error.value.status_code == 422
+        assert not error.value.retryable
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_are_retryable(self):
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        gateway = ResendGateway(httpx.AsyncClient(transport=httpx.MockTransport(refuse), base_url="http://resend"), "")
+
+        with pytest.raises(ResendError) as error:
+            await gateway.send_batch([email()], "key")
+
+        assert error.value.retryable
+
+
+class TestResendClient:
+    @pytest.mark.asyncio
+    async def test_shared_client(self):
+        client = get_resend_client()
+
+        assert get_resend_client() is client
+        assert str(client.base_url).startswith("https://api.resend.com")
+
+        await close_resend_client()
+        assert resend._client is None
+        assert client.is_closed
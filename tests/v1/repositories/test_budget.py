@@ -0,0 +1,97 @@
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.budget import BudgetRepository, CategoryTotal
+from app.v1.repositories.transactions import TransactionRepository
+from tests.factories import make_transaction
+
+JANUARY = datetime(2024, 1, 15, tzinfo=UTC)
+FEBRUARY = datetime(2024, 2, 15, tzinfo=UTC)
+
+
+def execute(path: str, sql: str) -> None:
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(sql)
+
+
+@pytest.fixture
+def transactions(migrated_database):
+    return TransactionRepository(get_async_database())
+
+
+@pytest.fixture
+def budget(migrated_database):
+    return BudgetRepository(get_async_database())
+
+
+class TestBudgetRepository:
+    @pytest.mark.asyncio
+    async def test_month_totals(self, transactions, budget):
+        await transactions.upsert(
+            [
+                make_transaction("tx_1", -500, JANUARY),
+                make_transaction("tx_2", -250, JANUARY, account_id="acc_2"),
+                make_transaction("tx_3", -1000, JANUARY, category="eating_out"),
+                make_transaction("tx_4", -300, JANUARY, category="eating_out", include_in_spending=False),
+                make_transaction("tx_5", -999, FEBRUARY),
+            ]
+        )
+
+        assert await budget.month_totals("2024-01") == [
+            CategoryTotal(category="eating_out", amount=-1300, spending=-1000, transactions=2),
+            CategoryTotal(category="groceries", amount=-750, spending=-750, transactions=2),
+        ]
+        assert await budget.months() == ["2024-02", "2024-01"]
+
+    @pytest.mark.asyncio
+    async def test_updates_move_totals(self, transactions, budget):
+        await transactions.upsert([make_transaction("tx_1", -500, JANUARY), make_transaction("tx_2", -100, JANUARY)])
+
+        await transactions.upsert([make_transaction("tx_1", -500, JANUARY, category="shopping")])
+
+        assert await budget.month_totals("2024-01") == [
+            CategoryTotal(category="shopping", amount=-500, spending=-500, transactions=1),
+            CategoryTotal(category="groceries", amount=-100, spending=-100, transactions=1),
+        ]
+        assert await budget.check() == []
+
+    @pytest.mark.asyncio
+    async def test_deletes_remove_empty_rollups(self, transactions, budget, migrated_database):
+        await transactions.upsert([make_transaction("tx_1", -500, JANUARY)])
+
+        execute(migrated_database, "DELETE FROM transactions")
+
+        assert await budget.month_totals("2024-01") == []
+        assert await budget.months() == []
+
+    @pytest.mark.asyncio
+    async def test_bulk_ingest_keeps_rollups_consistent(self, transactions, budget):
+        async def stream():
+            for i in range(500):
+                yield make_transaction(f"tx_{i}", -i, datetime(2024, 1 + i % 12, 1, tzinfo=UTC), category=f"c{i % 7}")
+
+        await transactions.ingest(stream(), batch_size=100)
+
+        assert await budget.check() == []
+        assert len(await budget.months()) == 12
+
+    @pytest.mark.asyncio
+    async def test_check_and_rebuild(self, transactions, budget, migrated_database):
+        await transactions.upsert([make_transaction("tx_1", -500, JANUARY), make_transaction("tx_2", -100, FEBRUARY)])
+        execute(migrated_database, "UPDATE budget_rollups SET amount = 0 WHERE month = '2024-01'")
+        execute(migrated_database, "DELETE FROM budget_rollups WHERE month = '2024-02'")
+
+        mismatches = await budget.check()
+
+        assert [(m.month, m.stored, m.computed) for m in mismatches] == [
+            ("2024-01", (0, -500, 1), (-500, -500, 1)),
+            ("2024-02", None, (-100, -100, 1)),
+        ]
+
+        await budget.rebuild()
+
+        assert await budget.check() == []
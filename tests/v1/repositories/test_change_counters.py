@@ -0,0 +1,34 @@
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.change_counters import ChangeCounterRepository, bump
+from app.v1.repositories.transactions import TransactionRepository
+from tests.v1.repositories.test_transactions import indexed_transaction
+
+
+@pytest.fixture
+def counters(migrated_database):
+    return ChangeCounterRepository(get_async_database())
+
+
+class TestChangeCounterRepository:
+    @pytest.mark.asyncio
+    async def test_unknown_names_are_at_zero(self, counters):
+        assert await counters.versions(["transactions", "nothing"]) == {"transactions": 0, "nothing": 0}
+        assert await counters.versions([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_bump(self, counters):
+        await counters.database.write(lambda conn: bump(conn, "transactions"))
+        await counters.database.write(lambda conn: bump(conn, "other"))
+
+        assert await counters.versions(["transactions", "other"]) == {"transactions": 1, "other": 1}
+
+    @pytest.mark.asyncio
+    async def test_only_changing_writes_bump_transactions(self, counters):
+        transactions = TransactionRepository(counters.database)
+
+        await transactions.upsert([indexed_transaction(1)])
+        await transactions.upsert([indexed_transaction(1)])
+
+        assert await counters.versions(["transactions"]) == {"transactions": 1}
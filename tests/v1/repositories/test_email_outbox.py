@@ -0,0 +1,99 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.email_outbox import EmailOutboxRepository, OutboxEmail
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def outbox(migrated_database):
+    return EmailOutboxRepository(get_async_database())
+
+
+def email(key: str) -> OutboxEmail:
+    return OutboxEmail(sender="hi@turbofox.dev", to=["jd@example.com"], subject=key, idempotency_key=key)
+
+
+CLAIM = timedelta(minutes=5)
+
+
+class TestEmailOutboxRepository:
+    @pytest.mark.asyncio
+    async def test_enqueue_is_idempotent(self, outbox):
+        assert await outbox.enqueue(email("a"), NOW)
+        assert not await outbox.enqueue(email("a"), NOW)
+
+        [claimed] = await outbox.claim(NOW, 10, CLAIM)
+        assert (claimed.subject, claimed.to, claimed.attempts) == ("a", ["jd@example.com"], 0)
+
+    @pytest.mark.asyncio
+    async def test_claims_due_emails_oldest_first(self, outbox):
+        for i, key in enumerate("abc"):
+            await outbox.enqueue(email(key), NOW + timedelta(seconds=i))
+
+        assert [claimed.subject for claimed in await outbox.claim(NOW + timedelta(seconds=1), 1, CLAIM)] == ["a"]
+        assert [claimed.subject for claimed in await outbox.claim(NOW + timedelta(seconds=5), 10, CLAIM)] == ["b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_claimed_emails_are_skipped_until_the_claim_expires(self, outbox):
+        await outbox.enqueue(email("a"), NOW)
+        await outbox.enqueue(email("b"), NOW)
+        first = await outbox.claim(NOW, 10, CLAIM)
+
+        await outbox.enqueue(email("c"), NOW)
+        assert [claimed.subject for claimed in await outbox.claim(NOW, 10, CLAIM)] == ["c"]
+
+        # The abandoned batch comes back whole, with its key, and without the email queued since.
+        again = await outbox.claim(NOW + CLAIM, 10, CLAIM)
+        assert [claimed.subject for claimed in again] == ["a", "b"]
+        assert {claimed.batch_key for claimed in again} == {first[0].batch_key}
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_whole(self, outbox):
+        await outbox.enqueue(email("a"), NOW)
+        await outbox.enqueue(email("b"), NOW)
+        a, b = await outbox.claim(NOW, 10, CLAIM)
+        await outbox.mark_failed({a.id: NOW + timedelta(minutes=1), b.id: NOW + timedelta(minutes=1)}, "boom")
+        await outbox.enqueue(email("c"), NOW + timedelta(minutes=1))
+
+        retry = await outbox.claim(NOW + timedelta(minutes=1), 10, CLAIM)
+
+        assert [(claimed.subject, claimed.attempts) for claimed in retry] == [("a", 1), ("b", 1)]
+        assert {claimed.batch_key for claimed in retry} == {a.batch_key}
+
+    @pytest.mark.asyncio
+    async def test_split(self, outbox):
+        await outbox.enqueue(email("a"), NOW)
+        await outbox.enqueue(email("b"), NOW)
+        a, b = await outbox.claim(NOW, 10, CLAIM)
+
+        await outbox.split([a.id, b.id])
+        await outbox.mark_failed({a.id: NOW, b.id: NOW}, "boom")
+
+        assert [(claimed.subject, claimed.batch_key) for claimed in await outbox.claim(NOW, 10, CLAIM)] == [("a", "a")]
+
+    @pytest.mark.asyncio
+    async def test_mark_sent(self, outbox):
+        await outbox.enqueue(email("a"), NOW)
+        [claimed] = await outbox.claim(NOW, 10, CLAIM)
+
+        await outbox.mark_sent({claimed.id: "email_1"}, NOW)
+
+        assert await outbox.claim(NOW + CLAIM, 10, CLAIM) == []
+        assert await outbox.counts() == {"sent": 1}
+
+    @pytest.mark.asyncio
+    async def test_mark_failed(self, outbox):
+        await outbox.enqueue(email("a"), NOW)
+        await outbox.enqueue(email("b"), NOW)
+        a, b = await outbox.claim(NOW, 10, CLAIM)
+
+        await outbox.mark_failed({a.id: NOW + timedelta(minutes=1), b.id: None}, "boom")
+
+        assert await outbox.claim(NOW, 10, CLAIM) == []
+        [retry] = await outbox.claim(NOW + timedelta(minutes=1), 10, CLAIM)
+        assert (retry.subject, retry.attempts) == ("a", 1)
+        assert await outbox.counts() == {"pending": 1, "failed": 1}
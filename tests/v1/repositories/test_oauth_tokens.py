@@ -0,0 +1,58 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.oauth_tokens import OAuthToken, OAuthTokenRepository
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=UTC)
+
+
+@pytest.fixture
+def tokens(migrated_database):
+    return OAuthTokenRepository(get_async_database())
+
+
+def token(n: int) -> OAuthToken:
+    return OAuthToken(f"access-{n}", f"refresh-{n}", NOW + timedelta(hours=n))
+
+
+class TestOAuthTokenRepository:
+    @pytest.mark.asyncio
+    async def test_save_and_get(self, tokens):
+        assert await tokens.get("monzo") is None
+
+        saved = await tokens.save("monzo", token(1))
+
+        assert saved.version == 1
+        assert await tokens.get("monzo") == saved
+        assert (await tokens.save("monzo", token(2))).version == 2
+
+    @pytest.mark.asyncio
+    async def test_only_one_claim_at_a_time(self, tokens):
+        saved = await tokens.save("monzo", token(1))
+        until = NOW + timedelta(seconds=30)
+
+        assert await tokens.claim("monzo", saved.version, NOW, until)
+        assert not await tokens.claim("monzo", saved.version, NOW, until)
+        assert await tokens.claim("monzo", saved.version, until, until + timedelta(seconds=30))
+
+    @pytest.mark.asyncio
+    async def test_replace_only_the_version_read(self, tokens):
+        saved = await tokens.save("monzo", token(1))
+
+        replaced = await tokens.replace("monzo", saved.version, token(2))
+
+        assert replaced == OAuthToken("access-2", "refresh-2", NOW + timedelta(hours=2), 2)
+        assert await tokens.replace("monzo", saved.version, token(3)) is None
+        assert await tokens.get("monzo") == replaced
+
+    @pytest.mark.asyncio
+    async def test_replace_releases_the_claim(self, tokens):
+        saved = await tokens.save("monzo", token(1))
+        await tokens.claim("monzo", saved.version, NOW, NOW + timedelta(seconds=30))
+
+        replaced = await tokens.replace("monzo", saved.version, token(2))
+
+        assert replaced is not None
+        assert await tokens.claim("monzo", replaced.version, NOW, NOW + timedelta(seconds=30))
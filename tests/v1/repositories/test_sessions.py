@@ -0,0 +1,71 @@
+import sqlite3
+from contextlib import closing
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.sessions import SessionRepository
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=UTC)
+TTL = timedelta(days=1)
+
+
+@pytest.fixture
+def sessions(migrated_database):
+    return SessionRepository(get_async_database())
+
+
+class TestSessionRepository:
+    @pytest.mark.asyncio
+    async def test_create_and_get(self, sessions):
+        session = await sessions.create({"user": "jd"}, NOW, TTL)
+
+        assert await sessions.get(session.id, NOW) == session
+        assert session.expires_at == NOW + TTL
+
+    @pytest.mark.asyncio
+    async def test_stores_only_a_hash_of_the_token(self, sessions, migrated_database):
+        session = await sessions.create({}, NOW, TTL)
+
+        with closing(sqlite3.connect(migrated_database)) as conn:
+            [stored] = conn.execute("SELECT id FROM sessions").fetchone()
+        assert session.id not in stored
+
+    @pytest.mark.asyncio
+    async def test_expired_and_unknown_sessions_arent_found(self, sessions):
+        session = await sessions.create({}, NOW, TTL)
+
+        assert await sessions.get(session.id, NOW + TTL) is None
+        assert await sessions.get("unknown", NOW) is None
+
+    @pytest.mark.asyncio
+    async def test_touch_slides_the_expiry_forward(self, sessions):
+        a = await sessions.create({}, NOW, TTL)
+        b = await sessions.create({}, NOW, TTL)
+        later = NOW + timedelta(hours=12)
+
+        assert await sessions.touch({a.id: later, b.id: later}, TTL) == 2
+        assert await sessions.touch({a.id: NOW + timedelta(hours=1)}, TTL) == 0
+
+        session = await sessions.get(a.id, NOW + TTL)
+        assert session is not None
+        assert (session.last_seen_at, session.expires_at) == (later, later + TTL)
+
+    @pytest.mark.asyncio
+    async def test_delete(self, sessions):
+        session = await sessions.create({}, NOW, TTL)
+
+        await sessions.delete(session.id)
+
+        assert await sessions.get(session.id, NOW) is None
+
+    @pytest.mark.asyncio
+    async def test_delete_expired_in_batches(self, sessions):
+        expired = [await sessions.create({}, NOW - TTL, TTL) for _ in range(5)]
+        current = await sessions.create({}, NOW, TTL)
+
+        assert await sessions.delete_expired(NOW, batch_size=2) == 5
+
+        assert await sessions.get(current.id, NOW) is not None
+        assert await sessions.get(expired[0].id, NOW - TTL) is None
@@ -0,0 +1,266 @@
+import sqlite3
+from collections.abc import AsyncIterator, Iterable
+from contextlib import closing
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.gateways.monzo import MonzoTransaction
+from app.v1.repositories.transactions import InvalidCursorError, TransactionRepository, _defer_indexes
+from tests.factories import make_transaction
+
+
+def indexed_transaction(index: int, **overrides) -> MonzoTransaction:
+    """The `index`th of a run of transactions a minute apart, each at its own merchant."""
+    fields = {
+        "amount": -100 * index,
+        "created": datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=index),
+        "description": f"Merchant {index}",
+        "merchant": {"id": f"merch_{index}", "name": f"Merchant {index}"},
+    }
+    return make_transaction(f"tx_{index:06d}", **(fields | overrides))
+
+
+async def stream(transactions: Iterable[MonzoTransaction]) -> AsyncIterator[MonzoTransaction]:
+    for transaction in transactions:
+        yield transaction
+
+
+def indexes(path: str) -> set[str]:
+    with closing(sqlite3.connect(path)) as conn:
+        rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger') AND sql IS NOT NULL"
+        ).fetchall()
+    return {row[0] for row in rows}
+
+
+def fetch(path: str, sql: str) -> list[tuple]:
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute(sql).fetchall()
+
+
+@pytest.fixture
+def repository(migrated_database):
+    return TransactionRepository(get_async_database())
+
+
+class TestTransactionRepository:
+    @pytest.mark.asyncio
+    async def test_upsert_inserts_rows(self, repository, migrated_database):
+        changed = await repository.upsert([indexed_transaction(1), indexed_transaction(2, merchant="", settled="")])
+
+        assert changed == 2
+        assert fetch(migrated_database, "SELECT id, amount, created_at, merchant_name FROM transactions") == [
+            ("tx_000001", -100, "2024-01-01T00:01:00.000Z", "Merchant 1"),
+            ("tx_000002", -200, "2024-01-01T00:02:00.000Z", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_upsert_is_idempotent(self, repository):
+        await repository.upsert([indexed_transaction(1), indexed_transaction(2)])
+
+        changed = await repository.upsert([indexed_transaction(1), indexed_transaction(2)])
+
+        assert changed == 0
+        assert await repository.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_upsert_updates_changed_rows(self, repository, migrated_database):
+        await repository.upsert([indexed_transaction(1), indexed_transaction(2)])
+
+        settled = datetime(2024, 1, 2, tzinfo=UTC)
+        changed = await repository.upsert([indexed_transaction(1, settled=settled), indexed_transaction(2)])
+
+        assert changed == 1
+        assert fetch(migrated_database, "SELECT id, settled_at FROM transactions ORDER BY id") == [
+            ("tx_000001", "2024-01-02T00:00:00.000Z"),
+            ("tx_000002", None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_ingest_in_batches(self, repository):
+        changed = await repository.ingest(stream(indexed_transaction(i) for i in range(1050)), batch_size=100)
+
+        assert changed == 1050
+        assert await repository.count() == 1050
+
+    @pytest.mark.asyncio
+    async def test_initial_ingest_rebuilds_deferred_indexes(self, repository, migrated_database):
+        expected = indexes(migrated_database)
+        seen: list[set[str]] = []
+
+        async def observed() -> AsyncIterator[MonzoTransaction]:
+            for i in range(10):
+                if i == 5:
+                    seen.append(indexes(migrated_database))
+                yield indexed_transaction(i)
+
+        await repository.ingest(observed(), batch_size=3)
+
+        assert {"transactions_account_id_created_at", "transactions_search_insert"} < expected
+        assert {"transactions_account_id_created_at", "transactions_search_insert"}.isdisjoint(seen[0])
+        assert indexes(migrated_database) == expected
+        assert fetch(migrated_database, "SELECT * FROM deferred_indexes") == []
+        assert len((await repository.search("merchant", limit=100)).results) == 10
+        assert fetch(migrated_database, "SELECT month, transactions FROM budget_rollups") == [("2024-01", 10)]
+
+    @pytest.mark.asyncio
+    async def test_incremental_ingest_keeps_indexes(self, repository, migrated_database):
+        await repository.upsert([indexed_transaction(0)])
+        expected = indexes(migrated_database)
+        seen: list[set[str]] = []
+
+        async def observed() -> AsyncIterator[MonzoTransaction]:
+            yield indexed_transaction(1)
+            seen.append(indexes(migrated_database))
+
+        await repository.ingest(observed())
+
+        assert seen == [expected]
+
+    @pytest.mark.asyncio
+    async def test_failed_ingest_restores_indexes(self, repository, migrated_database):
+        expected = indexes(migrated_database)
+
+        async def failing() -> AsyncIterator[MonzoTransaction]:
+            yield indexed_transaction(0)
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await repository.ingest(failing(), batch_size=1)
+
+        assert indexes(migrated_database) == expected
+        assert await repository.count() == 1
+
+    @pytest.mark.asyncio
+    async def test_interrupted_load_is_repaired_by_next_ingest(self, repository, migrated_database):
+        expected = indexes(migrated_database)
+        # A load that stopped after dropping the indexes.
+        await repository.database.write(_defer_indexes)
+        assert indexes(migrated_database) < expected
+        await repository.upsert([indexed_transaction(0)])
+
+        await repository.ingest(stream([indexed_transaction(1)]))
+
+        assert indexes(migrated_database) == expected
+        assert {r.id for r in (await repository.search("merchant")).results} == {"tx_000000", "tx_000001"}
+        assert fetch(migrated_database, "SELECT month, transactions FROM budget_rollups") == [("2024-01", 2)]
+
+
+class TestSearch:
+    @pytest.fixture
+    async def searchable(self, repository):
+        await repository.upsert(
+            [
+                indexed_transaction(
+                    1, merchant={"id": "m1", "name": "Pret A Manger"}, description="PRET A MANGER LONDON"
+                ),
+                indexed_transaction(2, merchant={"id": "m2", "name": "Tesco"}, description="TESCO STORES 2041"),
+                indexed_transaction(3, merchant="", description="Transfer to savings", notes="for the pret fund"),
+                indexed_transaction(4, merchant={"id": "m4", "name": "Café Nero"}, description="CAFFE NERO"),
+            ]
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_prefix_search_ranks_merchants_first(self, searchable):
+        page = await searchable.search("pre")
+
+        assert [result.id for result in page.results] == ["tx_000001", "tx_000003"]
+        assert page.results[0].merchant == "\x02Pret\x03 A Manger"
+        assert page.results[1].notes == "for the \x02pret\x03 fund"
+        assert not page.has_more
+
+    @pytest.mark.asyncio
+    async def test_every_word_must_match(self, searchable):
+        page = await searchable.search("tesco 2041")
+
+        assert [result.id for result in page.results] == ["tx_000002"]
+
+    @pytest.mark.asyncio
+    async def test_ignores_diacritics(self, searchable):
+        page = await searchable.search("cafe")
+
+        assert [result.id for result in page.results] == ["tx_000004"]
+
+    @pytest.mark.asyncio
+    async def test_query_syntax_is_literal(self, searchable):
+        assert (await searchable.search('"pret" OR NEAR(*')).results == []
+        assert (await searchable.search("  -- ")).results == []
+
+    @pytest.mark.asyncio
+    async def test_limit_reports_more(self, searchable):
+        page = await searchable.search("pret", limit=1)
+
+        assert len(page.results) == 1
+        assert page.has_more
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(self, searchable, migrated_database):
+        await searchable.upsert([indexed_transaction(2, merchant={"id": "m2", "name": "Sainsbury's"})])
+        with closing(sqlite3.connect(migrated_database)) as conn, conn:
+            conn.execute("DELETE FROM transactions WHERE id = 'tx_000001'")
+
+        assert [r.id for r in (await searchable.search("sainsbury")).results] == ["tx_000002"]
+        assert (await searchable.search("tesco")).results == []
+        assert [r.id for r in (await searchable.search("pret")).results] == ["tx_000003"]
+
+
+class TestPage:
+    @pytest.fixture
+    async def populated(self, repository):
+        # Pairs of transactions share a timestamp, so the ID has to break ties.
+        await repository.upsert(
+            indexed_transaction(i, created=datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=i // 2))
+            for i in range(25)
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_pages_through_everything_newest_first(self, populated):
+        ids: list[str] = []
+        cursor = None
+        while True:
+            page = await populated.page(cursor, limit=7)
+            ids.extend(row.id for row in page.rows)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert ids == [f"tx_{i:06d}" for i in reversed(range(25))]
+
+    @pytest.mark.asyncio
+    async def test_exact_last_page_has_no_cursor(self, populated):
+        page = await populated.page(limit=25)
+
+        assert len(page.rows) == 25
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_rows_inserted_above_the_cursor_dont_shift_pages(self, populated):
+        first = await populated.page(limit=5)
+        await populated.upsert([indexed_transaction(100, created=datetime(2025, 1, 1, tzinfo=UTC))])
+
+        second = await populated.page(first.next_cursor, limit=5)
+
+        assert [row.id for row in second.rows] == [f"tx_{i:06d}" for i in range(19, 14, -1)]
+
+    @pytest.mark.asyncio
+    async def test_uses_the_covering_index(self, populated):
+        plan = await populated.database.read(
+            lambda conn: conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id, created_at, amount, currency, description, category, merchant_name, "
+                "settled_at FROM transactions WHERE (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC "
+                "LIMIT 5",
+                ("2024", "tx"),
+            ).fetchall()
+        )
+
+        assert "COVERING INDEX transactions_created_at_id" in plan[0]["detail"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("cursor", ["not a cursor", "W10", "WzEsIDJd"])
+    async def test_invalid_cursor(self, populated, cursor):
+        with pytest.raises(InvalidCursorError):
+            await populated.page(cursor)
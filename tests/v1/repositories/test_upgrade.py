@@ -1,11 +1,61 @@
 import sqlite3
-import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from app.v1.repositories.upgrade import _apply_migration, _get_current_version, _get_migration_files, upgrade
+from app.config.database import ConnectionPool
+from app.v1.repositories.upgrade import (
+    DataMigration,
+    MigrationError,
+    _apply_migration,
+    _get_current_version,
+    _get_data_migrations,
+    _get_migration_files,
+    _migration_lock,
+    _split_statements,
+    run_data_migrations,
+    upgrade,
+)
+
+SCHEMA_VERSION = """
+CREATE TABLE schema_version (
+    id TEXT DEFAULT 'singleton' CHECK (id = 'singleton'),
+    version INTEGER NOT NULL
+);
+INSERT INTO schema_version (id, version) VALUES ('singleton', 1);
+"""
+
+
+@pytest.fixture
+def database(tmp_path):
+    """A pooled database, patched in as the one `upgrade` connects to."""
+    pool = ConnectionPool(str(tmp_path / "test.db"))
+
+    @contextmanager
+    def connection():
+        with pool.connection() as conn:
+            yield conn
+
+    with (
+        patch("app.v1.repositories.upgrade.get_db_connection", connection),
+        patch("app.v1.repositories.upgrade.settings.sqlite_database", pool.database),
+    ):
+        yield pool
+    pool.close()
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / "001.sql").write_text("PRAGMA journal_mode = WAL;\n" + SCHEMA_VERSION)
+
+    with patch("app.v1.repositories.upgrade.Path") as mock_path:
+        mock_path.return_value.parent.__truediv__.return_value = migrations_dir
+        yield migrations_dir
 
 
 class TestGetMigrationFiles:
@@ -64,6 +114,20 @@ class TestGetMigrationFiles:
         assert len(result) == 1
         assert result[0] == (1, mock_file1)
 
+    def test_get_migration_files_past_nine(self):
+        mock_migrations_dir = Mock()
+        mock_file1 = Mock()
+        mock_file1.stem = "009"
+        mock_file2 = Mock()
+        mock_file2.stem = "010"
+        mock_migrations_dir.glob.return_value = [mock_file2, mock_file1]
+
+        with patch("app.v1.repositories.upgrade.Path") as mock_path:
+            mock_path.return_value.parent.__truediv__.return_value = mock_migrations_dir
+            result = _get_migration_files()
+
+        assert result == [(9, mock_file1), (10, mock_file2)]
+
 
 class TestGetCurrentVersion:
     def test_get_current_version_with_existing_version(self):
@@ -97,166 +161,288 @@ class TestGetCurrentVersion:
         assert result == 0
 
 
+class TestSplitStatements:
+    def test_splits_on_semicolons(self):
+        assert _split_statements("CREATE TABLE a (id INTEGER);\nCREATE TABLE b (id INTEGER);") == [
+            "CREATE TABLE a (id INTEGER);",
+            "CREATE TABLE b (id INTEGER);",
+        ]
+
+    def test_keeps_semicolons_in_string_literals(self):
+        assert _split_statements("INSERT INTO a VALUES ('x; y');") == ["INSERT INTO a VALUES ('x; y');"]
+
+    def test_keeps_trigger_bodies_together(self):
+        sql = """
+        CREATE TRIGGER a_insert AFTER INSERT ON a BEGIN
+            INSERT INTO b VALUES (new.id);
+            UPDATE c SET n = n + 1;
+        END;
+        SELECT 1;
+        """
+
+        statements = _split_statements(sql)
+
+        assert len(statements) == 2
+        assert statements[0].startswith("CREATE TRIGGER") and statements[0].endswith("END;")
+
+    def test_ignores_empty_and_comment_only_statements(self):
+        assert _split_statements("CREATE TABLE a (id INTEGER);;\n-- trailing comment\n;") == [
+            "CREATE TABLE a (id INTEGER);"
+        ]
+
+    def test_keeps_final_statement_without_semicolon(self):
+        assert _split_statements("SELECT 1;\nSELECT 2") == ["SELECT 1;", "SELECT 2"]
+
+    def test_ignores_semicolons_in_comments(self):
+        assert _split_statements("-- a; b\nSELECT 1;") == ["-- a; b\nSELECT 1;"]
+
+
 class TestApplyMigration:
-    def test_apply_migration_single_statement(self):
-        """Test applying migration with single SQL statement."""
-        mock_cursor = Mock()
-        mock_file = Mock()
-        
-        sql_content = "CREATE TABLE test (id INTEGER);"
-        
-        with patch("builtins.open", mock_open(read_data=sql_content)):
-            _apply_migration(mock_cursor, 1, mock_file)
-        
-        assert mock_cursor.execute.call_count == 2
-        mock_cursor.execute.assert_any_call("CREATE TABLE test (id INTEGER)")
-        mock_cursor.execute.assert_any_call(
-            "UPDATE schema_version SET version = ? WHERE id = 'singleton'", (1,)
-        )
+    def test_applies_statements_and_records_version(self, database, tmp_path):
+        migration = tmp_path / "002.sql"
+        migration.write_text("CREATE TABLE test (id INTEGER);\nINSERT INTO test VALUES (1);")
 
-    def test_apply_migration_multiple_statements(self):
-        """Test applying migration with multiple SQL statements."""
-        mock_cursor = Mock()
-        mock_file = Mock()
-        
-        sql_content = """CREATE TABLE test1 (id INTEGER);
-CREATE TABLE test2 (name TEXT);
-INSERT INTO test1 VALUES (1);"""
-        
-        with patch("builtins.open", mock_open(read_data=sql_content)):
-            _apply_migration(mock_cursor, 2, mock_file)
-        
-        assert mock_cursor.execute.call_count == 4
-        mock_cursor.execute.assert_any_call("CREATE TABLE test1 (id INTEGER)")
-        mock_cursor.execute.assert_any_call("\nCREATE TABLE test2 (name TEXT)")
-        mock_cursor.execute.assert_any_call("\nINSERT INTO test1 VALUES (1)")
-        mock_cursor.execute.assert_any_call(
-            "UPDATE schema_version SET version = ? WHERE id = 'singleton'", (2,)
-        )
+        with database.connection() as conn:
+            conn.executescript(SCHEMA_VERSION)
+            _apply_migration(conn.cursor(), 2, migration)
 
-    def test_apply_migration_ignores_empty_statements(self):
-        """Test that empty statements are ignored during migration."""
-        mock_cursor = Mock()
-        mock_file = Mock()
-        
-        sql_content = "CREATE TABLE test (id INTEGER);;;"
-        
-        with patch("builtins.open", mock_open(read_data=sql_content)):
-            _apply_migration(mock_cursor, 1, mock_file)
-        
-        assert mock_cursor.execute.call_count == 2
-        mock_cursor.execute.assert_any_call("CREATE TABLE test (id INTEGER)")
-        mock_cursor.execute.assert_any_call(
-            "UPDATE schema_version SET version = ? WHERE id = 'singleton'", (1,)
-        )
+            assert _get_current_version(conn.cursor()) == 2
+            assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+            assert conn.execute("SELECT version FROM schema_migrations").fetchone()[0] == 2
+            assert not conn.in_transaction
+
+    def test_rolls_back_failed_migration(self, database, tmp_path):
+        migration = tmp_path / "002.sql"
+        migration.write_text("CREATE TABLE test (id INTEGER);\nINSERT INTO missing VALUES (1);")
+
+        with database.connection() as conn:
+            conn.executescript(SCHEMA_VERSION)
+            with pytest.raises(MigrationError, match="Migration 2"):
+                _apply_migration(conn.cursor(), 2, migration)
+
+            assert _get_current_version(conn.cursor()) == 1
+            assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'test'").fetchone() is None
+            assert not conn.in_transaction
+
+    def test_runs_leading_pragmas_outside_the_transaction(self, database, tmp_path):
+        migration = tmp_path / "001.sql"
+        migration.write_text("PRAGMA journal_mode = WAL;\n" + SCHEMA_VERSION)
+
+        with database.connection() as conn:
+            _apply_migration(conn.cursor(), 1, migration)
+
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_runs_a_leading_vacuum_outside_the_transaction(self, database, tmp_path):
+        migration = tmp_path / "001.sql"
+        migration.write_text("PRAGMA journal_mode = WAL;\nPRAGMA auto_vacuum = INCREMENTAL;\nVACUUM;\n" + SCHEMA_VERSION)
+
+        with database.connection() as conn:
+            _apply_migration(conn.cursor(), 1, migration)
+
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
 
 
 class TestUpgrade:
-    @patch("app.v1.repositories.upgrade._get_migration_files")
-    @patch("app.v1.repositories.upgrade._get_current_version")
-    @patch("app.v1.repositories.upgrade._apply_migration")
-    @patch("app.v1.repositories.upgrade.get_db_connection")
-    def test_upgrade_applies_pending_migrations(
-        self, mock_get_db_connection, mock_apply_migration, mock_get_current_version, mock_get_migration_files
-    ):
-        """Test that upgrade applies all pending migrations."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_db_connection.return_value.__enter__.return_value = mock_conn
-        
-        mock_get_current_version.return_value = 1
-        mock_file2 = Mock()
-        mock_file3 = Mock()
-        mock_get_migration_files.return_value = [(1, Mock()), (2, mock_file2), (3, mock_file3)]
-        
+    def test_upgrade_applies_pending_migrations(self, database, migrations_dir):
+        (migrations_dir / "002.sql").write_text("CREATE TABLE a (id INTEGER);")
+        (migrations_dir / "003.sql").write_text("CREATE TABLE b (id INTEGER);")
+
         upgrade()
-        
-        assert mock_apply_migration.call_count == 2
-        mock_apply_migration.assert_any_call(mock_cursor, 2, mock_file2)
-        mock_apply_migration.assert_any_call(mock_cursor, 3, mock_file3)
-        mock_conn.commit.assert_called_once()
-
-    @patch("app.v1.repositories.upgrade._get_migration_files")
-    @patch("app.v1.repositories.upgrade._get_current_version")
-    @patch("app.v1.repositories.upgrade._apply_migration")
-    @patch("app.v1.repositories.upgrade.get_db_connection")
-    def test_upgrade_no_pending_migrations(
-        self, mock_get_db_connection, mock_apply_migration, mock_get_current_version, mock_get_migration_files
-    ):
-        """Test that upgrade does nothing when no pending migrations."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_db_connection.return_value.__enter__.return_value = mock_conn
-        
-        mock_get_current_version.return_value = 3
-        mock_get_migration_files.return_value = [(1, Mock()), (2, Mock()), (3, Mock())]
-        
+
+        with database.connection() as conn:
+            assert _get_current_version(conn.cursor()) == 3
+            assert [row[0] for row in conn.execute("SELECT version FROM schema_migrations ORDER BY version")] == [
+                1,
+                2,
+                3,
+            ]
+
+    def test_upgrade_no_pending_migrations(self, database, migrations_dir):
         upgrade()
-        
+
+        with patch("app.v1.repositories.upgrade._apply_migration") as mock_apply_migration:
+            upgrade()
+
         mock_apply_migration.assert_not_called()
-        mock_conn.commit.assert_called_once()
-
-    @patch("app.v1.repositories.upgrade._get_migration_files")
-    @patch("app.v1.repositories.upgrade._get_current_version")
-    @patch("app.v1.repositories.upgrade._apply_migration")
-    @patch("app.v1.repositories.upgrade.get_db_connection")
-    def test_upgrade_calls_callback_for_each_migration(
-        self, mock_get_db_connection, mock_apply_migration, mock_get_current_version, mock_get_migration_files
-    ):
-        """Test that upgrade calls callback function for each applied migration."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_db_connection.return_value.__enter__.return_value = mock_conn
-        
-        mock_get_current_version.return_value = 0
-        mock_get_migration_files.return_value = [(1, Mock()), (2, Mock())]
-        
+
+    def test_upgrade_calls_callback_for_each_migration(self, database, migrations_dir):
+        (migrations_dir / "002.sql").write_text("CREATE TABLE a (id INTEGER);")
+
         callback = Mock()
         upgrade(on_migration=callback)
-        
+
         assert callback.call_count == 2
         callback.assert_any_call(1)
         callback.assert_any_call(2)
 
-    @patch("app.v1.repositories.upgrade._get_migration_files")
-    @patch("app.v1.repositories.upgrade._get_current_version")
-    @patch("app.v1.repositories.upgrade._apply_migration")
-    @patch("app.v1.repositories.upgrade.get_db_connection")
-    def test_upgrade_no_callback(
-        self, mock_get_db_connection, mock_apply_migration, mock_get_current_version, mock_get_migration_files
-    ):
-        """Test that upgrade works without callback function."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_db_connection.return_value.__enter__.return_value = mock_conn
-        
-        mock_get_current_version.return_value = 0
-        mock_get_migration_files.return_value = [(1, Mock())]
-        
-        upgrade()  # No callback provided
-        
-        mock_apply_migration.assert_called_once()
-        mock_conn.commit.assert_called_once()
-
-    @patch("app.v1.repositories.upgrade._get_migration_files")
-    @patch("app.v1.repositories.upgrade._get_current_version")
-    @patch("app.v1.repositories.upgrade.get_db_connection")
-    def test_upgrade_empty_migration_list(
-        self, mock_get_db_connection, mock_get_current_version, mock_get_migration_files
-    ):
-        """Test upgrade behavior when no migration files exist."""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_get_db_connection.return_value.__enter__.return_value = mock_conn
-        
-        mock_get_current_version.return_value = 0
-        mock_get_migration_files.return_value = []
-        
+    def test_upgrade_stops_at_failed_migration(self, database, migrations_dir):
+        (migrations_dir / "002.sql").write_text("CREATE TABLE a (id INTEGER);")
+        (migrations_dir / "003.sql").write_text("INSERT INTO missing VALUES (1);")
+        (migrations_dir / "004.sql").write_text("CREATE TABLE b (id INTEGER);")
+
+        with pytest.raises(MigrationError):
+            upgrade()
+
+        with database.connection() as conn:
+            assert _get_current_version(conn.cursor()) == 2
+
+    def test_upgrade_rejects_edited_migrations(self, database, migrations_dir):
         upgrade()
-        
-        mock_conn.commit.assert_called_once()
+        (migrations_dir / "001.sql").write_text(SCHEMA_VERSION + "\nCREATE TABLE a (id INTEGER);")
+
+        with pytest.raises(MigrationError, match="has changed"):
+            upgrade()
+
+    def test_upgrade_adopts_migrations_applied_without_checksums(self, database, migrations_dir):
+        with database.connection() as conn:
+            conn.executescript(SCHEMA_VERSION)
+
+        upgrade()
+
+        with database.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0] == 1
+
+    def test_upgrade_empty_migration_list(self, database, migrations_dir):
+        (migrations_dir / "001.sql").unlink()
+
+        upgrade()
+
+        with database.connection() as conn:
+            assert _get_current_version(conn.cursor()) == 0
+
+    def test_upgrade_applies_the_shipped_migrations(self, database):
+        upgrade()
+
+        with database.connection() as conn:
+            assert _get_current_version(conn.cursor()) == max(version for version, _ in _get_migration_files())
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestMigrationLock:
+    def test_non_blocking_lock_fails_while_held(self, database):
+        with _migration_lock("test") as acquired:
+            assert acquired
+            with _migration_lock("test", blocking=False) as acquired_again:
+                assert not acquired_again
+
+        with _migration_lock("test", blocking=False) as acquired:
+            assert acquired
+
+    def test_in_memory_database_needs_no_lock(self):
+        with patch("app.v1.repositories.upgrade.settings.sqlite_database", ":memory:"):
+            with _migration_lock("test") as acquired:
+                assert acquired
+
+
+def backfill_step(conn: sqlite3.Connection, checkpoint: str | None, batch_size: int) -> str | None:
+    rows = conn.execute(
+        "SELECT id FROM items WHERE id > ? ORDER BY id LIMIT ?", (int(checkpoint or 0), batch_size)
+    ).fetchall()
+    if not rows:
+        return None
+    conn.executemany("UPDATE items SET doubled = id * 2 WHERE id = ?", [(row["id"],) for row in rows])
+    return str(rows[-1]["id"])
+
+
+class TestDataMigrations:
+    @pytest.fixture
+    def items(self, database, migrations_dir):
+        (migrations_dir / "002.sql").write_text("CREATE TABLE items (id INTEGER PRIMARY KEY, doubled INTEGER);")
+        upgrade()
+        with database.connection() as conn:
+            conn.executemany("INSERT INTO items (id) VALUES (?)", [(i,) for i in range(1, 11)])
+            conn.commit()
+
+    def test_get_data_migrations_loads_python_files(self, migrations_dir):
+        (migrations_dir / "002.py").write_text(
+            "from app.v1.repositories.upgrade import DataMigration\n"
+            "migration = DataMigration(name='noop', step=lambda conn, checkpoint, batch_size: None)\n"
+        )
+        (migrations_dir / "helpers.py").write_text("raise RuntimeError('not a migration')\n")
+
+        [(version, migration)] = _get_data_migrations()
+
+        assert version == 2
+        assert migration.name == "noop"
+
+    def test_backfills_in_checkpointed_batches(self, database, items):
+        step = Mock(side_effect=backfill_step)
+        migration = DataMigration(name="double", step=step, batch_size=4)
+
+        with patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(2, migration)]):
+            run_data_migrations(pause=0)
+
+        with database.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items WHERE doubled = id * 2").fetchone()[0] == 10
+            progress = conn.execute("SELECT * FROM data_migrations").fetchone()
+        assert [call.args[1] for call in step.call_args_list] == [None, "4", "8", "10"]
+        assert progress["rows_done"] == 10
+        assert progress["checkpoint"] is None
+        assert progress["completed_at"] is not None
+
+    def test_resumes_from_checkpoint(self, database, items):
+        stop = threading.Event()
+
+        def step_then_stop(conn: sqlite3.Connection, checkpoint: str | None, batch_size: int) -> str | None:
+            stop.set()
+            return backfill_step(conn, checkpoint, batch_size)
+
+        first = DataMigration(name="double", step=step_then_stop, batch_size=4)
+        with patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(2, first)]):
+            run_data_migrations(stop, pause=0)
+
+        with database.connection() as conn:
+            assert conn.execute("SELECT checkpoint FROM data_migrations").fetchone()[0] == "4"
+
+        step = Mock(side_effect=backfill_step)
+        second = DataMigration(name="double", step=step, batch_size=4)
+        with patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(2, second)]):
+            run_data_migrations(pause=0)
+
+        assert step.call_args_list[0].args[1] == "4"
+
+    def test_skips_completed_migrations(self, database, items):
+        step = Mock(return_value=None)
+        migration = DataMigration(name="noop", step=step)
+
+        with patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(2, migration)]):
+            run_data_migrations(pause=0)
+            run_data_migrations(pause=0)
+
+        step.assert_called_once()
+
+    def test_waits_for_schema_version(self, database, items):
+        step = Mock(return_value=None)
+        migration = DataMigration(name="future", step=step)
+
+        with patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(3, migration)]):
+            run_data_migrations(pause=0)
+
+        step.assert_not_called()
+
+    def test_failed_batch_is_rolled_back(self, database, items):
+        def fail(conn: sqlite3.Connection, checkpoint: str | None, batch_size: int) -> str | None:
+            conn.execute("UPDATE items SET doubled = 0")
+            raise ValueError("boom")
+
+        migration = DataMigration(name="fail", step=fail)
+
+        with patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(2, migration)]):
+            with pytest.raises(ValueError):
+                run_data_migrations(pause=0)
+
+        with database.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM items WHERE doubled IS NOT NULL").fetchone()[0] == 0
+
+    def test_skips_when_another_process_is_backfilling(self, database, items):
+        step = Mock(return_value=None)
+        migration = DataMigration(name="noop", step=step)
+
+        with (
+            patch("app.v1.repositories.upgrade._get_data_migrations", return_value=[(2, migration)]),
+            _migration_lock("backfill"),
+        ):
+            run_data_migrations(pause=0)
+
+        step.assert_not_called()
@@ -0,0 +1,102 @@
+import math
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.charts import ChartRepository
+from app.v1.repositories.transactions import TransactionRepository
+from app.v1.services.charts import ChartService, lttb
+from tests.factories import make_transaction
+
+DAY = 86400
+
+
+class TestLTTB:
+    def test_short_series_are_returned_as_is(self):
+        assert lttb([1, 2, 3], [4, 5, 6], 10) == ([1, 2, 3], [4, 5, 6])
+
+    def test_keeps_endpoints_and_threshold(self):
+        t = list(range(1000))
+        v = [math.sin(i / 20) for i in t]
+
+        sampled_t, sampled_v = lttb(t, v, 50)
+
+        assert len(sampled_t) == len(sampled_v) == 50
+        assert sampled_t[0] == 0 and sampled_t[-1] == 999
+        assert sampled_t == sorted(sampled_t)
+        assert all(v[i] == value for i, value in zip(sampled_t, sampled_v, strict=True))
+
+    def test_keeps_spikes(self):
+        t = list(range(100))
+        v = [0] * 100
+        v[37] = 1000
+        v[71] = -500
+
+        sampled_t, _ = lttb(t, v, 10)
+
+        assert 37 in sampled_t and 71 in sampled_t
+
+    def test_tiny_thresholds(self):
+        assert lttb([1, 2, 3, 4], [1, 2, 3, 4], 2) == ([1, 4], [1, 4])
+        assert lttb([1, 2, 3, 4], [1, 2, 3, 4], 1) == ([1], [1])
+
+
+@pytest.fixture
+async def charts(migrated_database):
+    database = get_async_database()
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    await TransactionRepository(database).upsert(
+        [
+            make_transaction("tx_1", -100, start + timedelta(hours=1)),
+            make_transaction("tx_2", -250, start + timedelta(hours=5), category="eating_out"),
+            make_transaction("tx_3", 5000, start + timedelta(hours=6)),
+            make_transaction("tx_4", -300, start + timedelta(days=2, hours=3)),
+            make_transaction("tx_5", -700, start + timedelta(days=3), include_in_spending=False),
+        ]
+    )
+    return ChartRepository(database)
+
+
+class TestChartRepository:
+    @pytest.mark.asyncio
+    async def test_buckets_outgoings_in_sql(self, charts):
+        t, v = await charts.spending(DAY)
+
+        epoch = int(datetime(2024, 1, 1, tzinfo=UTC).timestamp())
+        assert t == [epoch, epoch + 2 * DAY]
+        assert v == [350, 300]
+
+    @pytest.mark.asyncio
+    async def test_filters(self, charts):
+        start = datetime(2024, 1, 2, tzinfo=UTC)
+
+        assert (await charts.spending(DAY, category="eating_out"))[1] == [250]
+        assert (await charts.spending(DAY, start=start))[1] == [300]
+        assert (await charts.spending(DAY, end=start))[1] == [350]
+
+    @pytest.mark.asyncio
+    async def test_leaves_out_transactions_excluded_from_spending(self, charts):
+        t, _ = await charts.spending(DAY)
+
+        assert int(datetime(2024, 1, 4, tzinfo=UTC).timestamp()) not in t
+
+    @pytest.mark.asyncio
+    async def test_uses_the_covering_index(self, charts):
+        plan = await charts.database.read(
+            lambda conn: conn.execute(
+                "EXPLAIN QUERY PLAN SELECT created_at, amount FROM transactions "
+                "WHERE amount < 0 AND include_in_spending AND created_at >= ?",
+                ("2024",),
+            ).fetchall()
+        )
+
+        assert "COVERING INDEX transactions_created_at_id" in plan[0]["detail"]
+
+
+class TestChartService:
+    @pytest.mark.asyncio
+    async def test_downsamples_to_width(self, charts):
+        t, v = await ChartService(charts).spending(3600, width=2)
+
+        assert len(t) == len(v) == 2
@@ -0,0 +1,142 @@
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.gateways.resend import ResendGateway
+from app.v1.repositories.email_outbox import EmailOutboxRepository, OutboxEmail
+from app.v1.services.email import EmailDispatcher
+from tests.fakes.resend import FakeResend
+
+
+@pytest.fixture
+def fake():
+    return FakeResend()
+
+
+@pytest.fixture
+def dispatcher(fake, clock, migrated_database):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url="http://resend")
+    return EmailDispatcher(
+        ResendGateway(client, "re_test"),
+        EmailOutboxRepository(get_async_database()),
+        batch_size=3,
+        max_attempts=3,
+        backoff=timedelta(seconds=10),
+        clock=clock,
+    )
+
+
+def email(n: int, to: str = "jd@example.com") -> OutboxEmail:
+    return OutboxEmail(sender="hi@turbofox.dev", to=[to], subject=f"Email {n}", text="Hi", idempotency_key=f"key-{n}")
+
+
+class TestEmailDispatcher:
+    @pytest.mark.asyncio
+    async def test_sends_in_batches(self, dispatcher, fake):
+        for n in range(5):
+            await dispatcher.send(email(n))
+
+        assert await dispatcher.dispatch() == 3
+        assert await dispatcher.dispatch() == 2
+        assert await dispatcher.dispatch() == 0
+
+        assert fake.requests == 2
+        assert [sent["subject"] for sent in fake.sent] == [f"Email {n}" for n in range(5)]
+        assert await dispatcher.repository.counts() == {"sent": 5}
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_sent_once(self, dispatcher, fake):
+        assert await dispatcher.send(email(1))
+        assert not await dispatcher.send(email(1))
+
+        await dispatcher.dispatch()
+
+        assert len(fake.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self, dispatcher, fake, clock):
+        await dispatcher.send(email(1))
+        fake.fail(503, times=2)
+
+        await dispatcher.dispatch()
+        clock.now += timedelta(seconds=10)
+        await dispatcher.dispatch()
+        assert await dispatcher.dispatch() == 0
+
+        clock.now += timedelta(seconds=20)
+        await dispatcher.dispatch()
+        assert len(fake.sent) == 1
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after(self, dispatcher, fake, clock):
+        await dispatcher.send(email(1))
+        fake.fail(429, headers={"Retry-After": "60"})
+
+        await dispatcher.dispatch()
+        clock.now += timedelta(seconds=59)
+
+        assert await dispatcher.dispatch() == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, dispatcher, fake, clock):
+        await dispatcher.send(email(1))
+        fake.fail(500, times=3)
+
+        for _ in range(3):
+            await dispatcher.dispatch()
+            clock.now += timedelta(hours=1)
+
+        assert await dispatcher.repository.counts() == {"failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_is_sent_one_by_one(self, dispatcher, fake):
+        await dispatcher.send(email(1))
+        await dispatcher.send(email(2, to="nobody"))
+        await dispatcher.send(email(3))
+
+        await dispatcher.dispatch()
+
+        assert [sent["subject"] for sent in fake.sent] == ["Email 1", "Email 3"]
+        assert await dispatcher.repository.counts() == {"sent": 2, "failed": 1}
+
+    @pytest.mark.asyncio
+    async def test_batch_with_a_lost_response_is_not_delivered_twice(self, dispatcher, fake, clock):
+        await dispatcher.send(email(1))
+        await dispatcher.send(email(2))
+        fake.lose()
+        await dispatcher.dispatch()
+        await dispatcher.send(email(3))
+
+        clock.now += timedelta(seconds=10)
+        while await dispatcher.dispatch():
+            pass
+
+        assert [sent["subject"] for sent in fake.sent] == ["Email 1", "Email 2", "Email 3"]
+        assert await dispatcher.repository.counts() == {"sent": 3}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_dispatchers_send_each_email_once(self, dispatcher, fake, clock):
+        other = EmailDispatcher(dispatcher.gateway, dispatcher.repository, batch_size=3, clock=clock)
+        for n in range(6):
+            await dispatcher.send(email(n))
+
+        await asyncio.gather(dispatcher.dispatch(), other.dispatch(), dispatcher.dispatch(), other.dispatch())
+
+        assert sorted(sent["subject"] for sent in fake.sent) == [f"Email {n}" for n in range(6)]
+        assert fake.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_run_sends_queued_emails_promptly(self, dispatcher, fake):
+        stop = asyncio.Event()
+        task = asyncio.create_task(dispatcher.run(stop, poll_interval=60))
+        await asyncio.sleep(0.01)
+
+        await dispatcher.send(email(1))
+        await asyncio.sleep(0.05)
+        stop.set()
+        await asyncio.wait_for(task, 1)
+
+        assert len(fake.sent) == 1
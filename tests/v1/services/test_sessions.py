@@ -0,0 +1,128 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.repositories.sessions import SessionRepository
+from app.v1.services.sessions import SessionStore
+
+TTL = timedelta(days=1)
+
+
+@pytest.fixture
+def repository(migrated_database):
+    return SessionRepository(get_async_database())
+
+
+@pytest.fixture
+def store(repository, clock):
+    return SessionStore(ttl=TTL, cache_ttl=timedelta(minutes=1), max_entries=2, repository=repository, clock=clock)
+
+
+class TestSessionStore:
+    @pytest.mark.asyncio
+    async def test_cached_sessions_dont_touch_the_database(self, store, repository):
+        session = await store.create({"user": "jd"})
+
+        with patch.object(repository, "get", wraps=repository.get) as get:
+            assert await store.get(session.id) == session
+            assert await store.get(session.id) == session
+
+        get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reloads_once_cached_entry_is_old(self, store, repository, clock):
+        session = await store.create({})
+        await repository.delete(session.id)
+
+        assert await store.get(session.id) is not None
+        clock.now += timedelta(minutes=1)
+        assert await store.get(session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_sessions(self, store):
+        assert await store.get("unknown") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, store, repository):
+        a, b = await store.create({}), await store.create({})
+        await store.get(a.id)
+        await store.create({})
+
+        with patch.object(repository, "get", wraps=repository.get) as get:
+            await store.get(a.id)
+            await store.get(b.id)
+
+        assert [call.args[0] for call in get.call_args_list] == [b.id]
+
+    @pytest.mark.asyncio
+    async def test_uses_are_written_in_one_batch(self, store, repository, clock):
+        sessions = [await store.create({}) for _ in range(2)]
+        clock.now += timedelta(hours=12)
+        for session in sessions * 3:
+            await store.get(session.id)
+
+        with patch.object(repository, "touch", wraps=repository.touch) as touch:
+            assert await store.flush() == 2
+            assert await store.flush() == 0
+
+        touch.assert_called_once()
+        stored = await repository.get(sessions[0].id, clock.now + TTL - timedelta(seconds=1))
+        assert stored is not None
+        assert stored.last_seen_at == clock.now
+
+    @pytest.mark.asyncio
+    async def test_use_slides_the_expiry(self, store, clock):
+        session = await store.create({})
+
+        for _ in range(3):
+            clock.now += TTL / 2
+            assert await store.get(session.id) is not None
+            await store.flush()
+
+        clock.now += TTL
+        assert await store.get(session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, store, repository, clock):
+        session = await store.create({})
+        clock.now += timedelta(seconds=1)
+        await store.get(session.id)
+
+        with patch.object(repository, "touch", AsyncMock(side_effect=RuntimeError("boom"))):
+            with pytest.raises(RuntimeError):
+                await store.flush()
+
+        assert await store.flush() == 1
+
+    @pytest.mark.asyncio
+    async def test_delete(self, store):
+        session = await store.create({})
+
+        await store.delete(session.id)
+
+        assert await store.get(session.id) is None
+
+    @pytest.mark.asyncio
+    async def test_sweep(self, store, clock):
+        await store.create({})
+        clock.now += TTL
+
+        assert await store.sweep() == 1
+
+    @pytest.mark.asyncio
+    async def test_run_flushes_and_sweeps_until_stopped(self, store):
+        stop = asyncio.Event()
+        with (
+            patch.object(store, "flush", AsyncMock()) as flush,
+            patch.object(store, "sweep", AsyncMock(side_effect=RuntimeError("boom"))) as sweep,
+        ):
+            task = asyncio.create_task(store.run(stop, flush_interval=0.01, sweep_interval=0))
+            await asyncio.sleep(0.05)
+            stop.set()
+            await task
+
+        assert flush.await_count >= 2
+        assert sweep.await_count == flush.await_count
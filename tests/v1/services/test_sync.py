@@ -0,0 +1,98 @@
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.gateways.monzo import MonzoGateway
+from app.v1.repositories.sync_state import SyncStateRepository
+from app.v1.repositories.transactions import TransactionRepository
+from app.v1.services.sync import SyncService
+from app.v1.services.tokens import monzo_tokens
+from tests.fakes.monzo import FakeMonzo
+
+
+async def token() -> str:
+    return "test-token"
+
+
+@pytest.fixture
+def fake():
+    return FakeMonzo(accounts=2, transactions_per_account=250)
+
+
+@pytest.fixture
+def service(fake, migrated_database):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url="http://monzo")
+    database = get_async_database()
+    return SyncService(
+        MonzoGateway(client, token),
+        TransactionRepository(database),
+        SyncStateRepository(database),
+        overlap=timedelta(minutes=70),
+    )
+
+
+class TestSyncService:
+    @pytest.mark.asyncio
+    async def test_first_sync_downloads_everything(self, service, fake):
+        changed = await service.sync()
+
+        assert changed == {"acc_0000": 250, "acc_0001": 250}
+        assert await service.transactions.count() == 500
+        state = await service.sync_state.get("acc_0000")
+        assert state is not None
+        assert state.high_water_mark.isoformat().replace("+00:00", "Z") == fake.transaction("acc_0000", 249)["created"]
+
+    @pytest.mark.asyncio
+    async def test_next_sync_only_fetches_from_the_high_water_mark(self, service, fake):
+        await service.sync()
+        requests = fake.requests
+
+        changed = await service.sync_account("acc_0000")
+
+        # Only the overlap window is fetched again, in a single page.
+        assert fake.requests == requests + 1
+        assert changed == 0
+
+    @pytest.mark.asyncio
+    async def test_picks_up_new_and_late_settled_transactions(self, service, fake):
+        await service.sync()
+        fake.transactions_per_account = 260
+
+        changed = await service.sync_account("acc_0000")
+
+        # Ten new transactions, plus the previously pending one that has now settled.
+        assert changed == 11
+        state = await service.sync_state.get("acc_0000")
+        assert state is not None
+        assert state.high_water_mark.isoformat().replace("+00:00", "Z") == fake.transaction("acc_0000", 259)["created"]
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_leaves_the_high_water_mark(self, service, fake):
+        fake.access_token = "other"
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await service.sync_account("acc_0000")
+
+        assert await service.sync_state.get("acc_0000") is None
+
+
+    def test_authenticates_with_the_shared_token_manager(self, migrated_database):
+        service = SyncService()
+
+        assert service.gateway.get_access_token == monzo_tokens.get_access_token
+
+
+class TestSyncStateRepository:
+    @pytest.mark.asyncio
+    async def test_high_water_mark_never_moves_back(self, service, fake):
+        await service.sync()
+        before = await service.sync_state.get("acc_0000")
+        assert before is not None
+
+        await service.sync_state.advance("acc_0000", before.high_water_mark - timedelta(days=1))
+
+        after = await service.sync_state.get("acc_0000")
+        assert after is not None
+        assert after.high_water_mark == before.high_water_mark
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import timedelta
+
+import httpx
+import pytest
+
+from app.config.async_database import get_async_database
+from app.v1.gateways.monzo import refresh_access_token
+from app.v1.repositories.oauth_tokens import OAuthToken, OAuthTokenRepository
+from app.v1.services.tokens import TokenManager, TokenUnavailableError
+from tests.fakes.monzo import FakeMonzo
+
+LIFETIME = timedelta(hours=6)
+
+
+@pytest.fixture
+def fake():
+    return FakeMonzo()
+
+
+@pytest.fixture
+def repository(migrated_database):
+    return OAuthTokenRepository(get_async_database())
+
+
+@pytest.fixture
+def make_manager(fake, repository, clock):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=fake.app), base_url="http://monzo")
+
+    async def refresh(refresh_token: str) -> OAuthToken:
+        token = await refresh_access_token(client, refresh_token)
+        return OAuthToken(token.access_token, token.refresh_token, clock() + LIFETIME)
+
+    def make_manager() -> TokenManager:
+        return TokenManager("monzo", refresh, repository, poll_interval=0.001, clock=clock)
+
+    return make_manager
+
+
+@pytest.fixture
+async def stored(repository, clock):
+    return await repository.save("monzo", OAuthToken("test-token", "test-refresh-token", clock() + LIFETIME))
+
+
+class TestTokenManager:
+    @pytest.mark.asyncio
+    async def test_without_tokens(self, make_manager):
+        with pytest.raises(TokenUnavailableError):
+            await make_manager().get_access_token()
+
+    @pytest.mark.asyncio
+    async def test_fresh_tokens_are_loaded_once(self, make_manager, repository, stored, fake):
+        manager = make_manager()
+
+        assert await manager.get_access_token() == "test-token"
+        await repository.save("monzo", OAuthToken("other", "other", stored.expires_at))
+        assert await manager.get_access_token() == "test-token"
+        assert fake.refreshes == 0
+
+    @pytest.mark.asyncio
+    async def test_refreshes_in_the_background_before_expiry(self, make_manager, repository, stored, fake, clock):
+        manager = make_manager()
+        await manager.get_access_token()
+        clock.now = stored.expires_at - timedelta(minutes=1)
+
+        assert await manager.get_access_token() == "test-token"
+        assert manager._updating is not None
+        await manager._updating
+
+        assert fake.refreshes == 1
+        assert await manager.get_access_token() == "test-token-1"
+        persisted = await repository.get("monzo")
+        assert persisted is not None
+        assert (persisted.refresh_token, persisted.version) == ("test-refresh-token-1", 2)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self, make_manager, stored, fake, clock):
+        manager = make_manager()
+        clock.now = stored.expires_at
+
+        tokens = await asyncio.gather(*(manager.get_access_token() for _ in range(10)))
+
+        assert tokens == ["test-token-1"] * 10
+        assert fake.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_processes_share_one_refresh(self, make_manager, stored, fake, clock):
+        managers = [make_manager() for _ in range(3)]
+        clock.now = stored.expires_at
+
+        tokens = await asyncio.gather(*(manager.get_access_token() for manager in managers))
+
+        assert tokens == ["test-token-1"] * 3
+        assert fake.refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_raised_and_retried(self, make_manager, repository, stored, fake, clock):
+        manager = make_manager()
+        clock.now = stored.expires_at
+        fake.refresh_token = "revoked"
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await manager.get_access_token()
+
+        fake.refresh_token = "test-refresh-token"
+        clock.now += manager.claim_for
+        assert await manager.get_access_token() == "test-token-1"
+
+    @pytest.mark.asyncio
+    async def test_run_refreshes_when_due(self, make_manager, stored, fake, clock):
+        manager = make_manager()
+        clock.now = stored.expires_at - timedelta(minutes=1)
+        stop = asyncio.Event()
+
+        task = asyncio.create_task(manager.run(stop))
+        await asyncio.sleep(0.05)
+        stop.set()
+        await task
+
+        assert fake.refreshes == 1
+        assert await manager.get_access_token() == "test-token-1"
+
+    @pytest.mark.asyncio
+    async def test_run_waits_for_tokens(self, make_manager):
+        stop = asyncio.Event()
+
+        task = asyncio.create_task(make_manager().run(stop))
+        await asyncio.sleep(0.01)
+        stop.set()
+        await task